@@ -1,12 +1,27 @@
+import numpy as np
 import pygame
 from typing import Tuple
 
+
+def transform_points(xs: np.ndarray, ys: np.ndarray, camera_x: float, camera_y: float,
+                     scale: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """world_to_screen para arrays de posições, truncando como int()"""
+    return ((xs - camera_x) * scale).astype(int), ((ys - camera_y) * scale).astype(int)
+
+
+def visible_points(screen_x: np.ndarray, screen_y: np.ndarray, margin, width: int, height: int) -> np.ndarray:
+    """Máscara dos pontos a menos de margin pixels da tela"""
+    return (screen_x > -margin) & (screen_x < width + margin) & (screen_y > -margin) & (screen_y < height + margin)
+
+
 class Camera:
     def __init__(self, window_width: int, window_height: int):
         self.window_width = window_width
         self.window_height = window_height
         self.x = 0
         self.y = 0
+        self.prev_x = 0
+        self.prev_y = 0
         self.target_x = 0
         self.target_y = 0
         self.smooth_speed = 5.0
@@ -19,8 +34,13 @@ class Camera:
         self.x += (self.target_x - self.x) * self.smooth_speed * dt
         self.y += (self.target_y - self.y) * self.smooth_speed * dt
     
-    def get_position(self) -> Tuple[float, float]:
-        return self.x, self.y
+    def save_previous(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def get_position(self, alpha: float = 1.0) -> Tuple[float, float]:
+        """Posição interpolada entre o passo de simulação anterior e o atual"""
+        return self.prev_x + (self.x - self.prev_x) * alpha, self.prev_y + (self.y - self.prev_y) * alpha
     
     def world_to_screen(self, world_x: float, world_y: float) -> Tuple[int, int]:
         screen_x = int(world_x - self.x)
@@ -35,4 +55,13 @@ class Camera:
     def is_visible(self, x: float, y: float, size: int) -> bool:
         screen_x, screen_y = self.world_to_screen(x, y)
         return (screen_x + size >= 0 and screen_x - size <= self.window_width and
-                screen_y + size >= 0 and screen_y - size <= self.window_height)
\ No newline at end of file
+                screen_y + size >= 0 and screen_y - size <= self.window_height)
+    
+    def world_to_screen_array(self, xs: np.ndarray, ys: np.ndarray, alpha: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        camera_x, camera_y = self.get_position(alpha)
+        return transform_points(xs, ys, camera_x, camera_y)
+    
+    def visible_mask(self, xs: np.ndarray, ys: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+        """is_visible para arrays de posições do mundo"""
+        screen_x, screen_y = self.world_to_screen_array(xs, ys)
+        return visible_points(screen_x, screen_y, sizes + 1, self.window_width, self.window_height)
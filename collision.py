@@ -0,0 +1,197 @@
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game_config import GameConfig
+from walls import wall_tiles
+
+# Bitmap de uma área: um byte por ladrilho, linha a linha (1 = bloqueado)
+Bitmap = bytes
+
+
+def area_collision(area_size: int, tile_size: int) -> Bitmap:
+    """Bitmap de colisão de uma área, calculado uma vez quando a área é criada"""
+    count = area_size // tile_size
+    bitmap = bytearray(count * count)
+    for tile_x, tile_y in wall_tiles(area_size, tile_size):
+        bitmap[tile_y * count + tile_x] = 1
+    return bytes(bitmap)
+
+
+def _first_tile(edge: float, tile_size: int) -> int:
+    return int(edge // tile_size)
+
+
+def _last_tile(edge: float, tile_size: int) -> int:
+    """Último ladrilho tocado por um intervalo que termina (aberto) em edge"""
+    return int(-(-edge // tile_size)) - 1
+
+
+class CollisionMap:
+    """Colisão estática do mundo, em ladrilhos de world.tile_size pixels.
+
+    Cada área guarda o próprio bitmap (Area.collision / AreaData.collision);
+    o mapa só consulta o da área certa, então o custo de uma consulta não
+    depende de quantas paredes o nível tem. Fora da malha tudo é bloqueado.
+    Uma caixa que já está sobre um ladrilho bloqueado só aceita passos que
+    diminuam a sobreposição, então ela sai da parede mas não anda por dentro.
+    """
+
+    def __init__(self, config: GameConfig, bitmap_for: Callable[[int, int], Optional[Bitmap]]):
+        self.tile_size = config.world.tile_size
+        self.tiles_per_area = config.world.area_size // self.tile_size
+        self.world_tiles = self.tiles_per_area * config.world.grid_size
+        self.bitmap_for = bitmap_for
+        # Grade de collision_grid, montada na primeira resolução em lote (as paredes não mudam)
+        self.grid: Optional[Tuple] = None
+
+    def arrays(self) -> Tuple:
+        if self.grid is None:
+            self.grid = collision_grid(self)
+        return self.grid
+
+    def blocked(self, tile_x: int, tile_y: int) -> bool:
+        if not (0 <= tile_x < self.world_tiles and 0 <= tile_y < self.world_tiles):
+            return True
+        count = self.tiles_per_area
+        bitmap = self.bitmap_for(tile_x // count, tile_y // count)
+        return bitmap is not None and bitmap[(tile_y % count) * count + tile_x % count] == 1
+
+    def blocked_at(self, x: float, y: float) -> bool:
+        return self.blocked(int(x // self.tile_size), int(y // self.tile_size))
+
+    def overlaps(self, left: float, top: float, right: float, bottom: float) -> bool:
+        """Se a caixa [left, right) x [top, bottom) toca algum ladrilho bloqueado"""
+        tile = self.tile_size
+        for tile_y in range(_first_tile(top, tile), _last_tile(bottom, tile) + 1):
+            for tile_x in range(_first_tile(left, tile), _last_tile(right, tile) + 1):
+                if self.blocked(tile_x, tile_y):
+                    return True
+        return False
+
+    def overlap_area(self, left: float, top: float, right: float, bottom: float) -> float:
+        """Quanto da caixa [left, right) x [top, bottom) está sobre ladrilhos bloqueados"""
+        tile = self.tile_size
+        area = 0.0
+        for tile_y in range(_first_tile(top, tile), _last_tile(bottom, tile) + 1):
+            for tile_x in range(_first_tile(left, tile), _last_tile(right, tile) + 1):
+                if self.blocked(tile_x, tile_y):
+                    area += ((min(right, (tile_x + 1) * tile) - max(left, tile_x * tile)) *
+                             (min(bottom, (tile_y + 1) * tile) - max(top, tile_y * tile)))
+        return area
+
+    def move_box(self, x: float, y: float, half: float, dx: float, dy: float) -> Tuple[float, float]:
+        """Move uma caixa centrada em (x, y) com varredura por eixo: para
+        encostada no primeiro ladrilho bloqueado no caminho, mesmo que o
+        passo atravesse vários ladrilhos de uma vez"""
+        if dx:
+            x = self._sweep(x, y, half, dx, horizontal=True)
+        if dy:
+            y = self._sweep(y, x, half, dy, horizontal=False)
+        return x, y
+
+    def _sweep(self, position: float, other: float, half: float, delta: float, horizontal: bool) -> float:
+        tile = self.tile_size
+        # Faixa de ladrilhos que a caixa cobre no outro eixo
+        across = range(_first_tile(other - half, tile), _last_tile(other + half, tile) + 1)
+        # Ladrilhos que a borda da frente atravessa, do mais próximo ao mais distante
+        if delta > 0:
+            edge = position + half
+            ahead = range(_last_tile(edge, tile) + 1, _last_tile(edge + delta, tile) + 1)
+        else:
+            edge = position - half
+            ahead = range(_first_tile(edge, tile) - 1, _first_tile(edge + delta, tile) - 1, -1)
+
+        for step in ahead:
+            for lane in across:
+                if self.blocked(step, lane) if horizontal else self.blocked(lane, step):
+                    return step * tile - half if delta > 0 else (step + 1) * tile + half
+        return position + delta
+
+    def resolve(self, entity, old_x: float, old_y: float):
+        """Resolução dos inimigos: desfaz o eixo do passo que entrou em um
+        ladrilho bloqueado ou não diminuiu a sobreposição (primeiro x, depois y)"""
+        half = entity.size
+        new_x, new_y = entity.x, entity.y
+        if new_x != old_x and self._entered(new_x, old_y, old_x, old_y, half):
+            new_x = old_x
+        if new_y != old_y and self._entered(new_x, new_y, new_x, old_y, half):
+            new_y = old_y
+        entity.x, entity.y = new_x, new_y
+
+    def resolve_all(self, entities: Sequence, old_x: List[float], old_y: List[float]):
+        """resolve para várias entidades de uma vez, com as contas em arrays
+        do numpy (resolve_boxes); é o caminho de update_entities"""
+        count = len(entities)
+        if not count:
+            return
+        new_x = np.fromiter((entity.x for entity in entities), np.float64, count)
+        new_y = np.fromiter((entity.y for entity in entities), np.float64, count)
+        half = np.fromiter((entity.size for entity in entities), np.float64, count)
+        x, y = resolve_boxes(self.arrays(), new_x, new_y, np.array(old_x, dtype=np.float64),
+                             np.array(old_y, dtype=np.float64), half)
+        for entity, entity_x, entity_y in zip(entities, x.tolist(), y.tolist()):
+            entity.x = entity_x
+            entity.y = entity_y
+
+    def _entered(self, x: float, y: float, from_x: float, from_y: float, half: float) -> bool:
+        overlap = self.overlap_area(x - half, y - half, x + half, y + half)
+        return overlap > 0 and overlap >= self.overlap_area(from_x - half, from_y - half, from_x + half, from_y + half)
+
+
+def collision_grid(collision: 'CollisionMap') -> Tuple:
+    """Mapa de colisão do mundo inteiro como grade booleana de ladrilhos,
+    no formato que resolve_boxes e os workers de parallel.py usam"""
+    count = collision.tiles_per_area
+    grid = np.zeros((collision.world_tiles, collision.world_tiles), dtype=bool)
+    for grid_y in range(collision.world_tiles // count):
+        for grid_x in range(collision.world_tiles // count):
+            bitmap = collision.bitmap_for(grid_x, grid_y)
+            if bitmap is not None:
+                grid[grid_y * count:(grid_y + 1) * count, grid_x * count:(grid_x + 1) * count] = \
+                    np.frombuffer(bitmap, dtype=np.uint8).reshape(count, count) == 1
+    return collision.tile_size, grid
+
+
+def _boxes_overlap(collision: Tuple, left, top, right, bottom) -> np.ndarray:
+    """CollisionMap.overlap_area para várias caixas de uma vez"""
+    tile_size, grid = collision
+    first_x = np.floor_divide(left, tile_size).astype(np.int64)
+    last_x = (-np.floor_divide(-right, tile_size)).astype(np.int64) - 1
+    first_y = np.floor_divide(top, tile_size).astype(np.int64)
+    last_y = (-np.floor_divide(-bottom, tile_size)).astype(np.int64) - 1
+    result = np.zeros(len(left))
+    if not len(left):
+        return result
+    tiles = grid.shape[0]
+    for offset_y in range(int((last_y - first_y).max()) + 1):
+        tile_y = first_y + offset_y
+        for offset_x in range(int((last_x - first_x).max()) + 1):
+            tile_x = first_x + offset_x
+            inside = (tile_x >= 0) & (tile_x < tiles) & (tile_y >= 0) & (tile_y < tiles)
+            # Fora da malha é bloqueado
+            hit = ~inside
+            hit[inside] = grid[tile_y[inside], tile_x[inside]]
+            hit &= (tile_y <= last_y) & (tile_x <= last_x)
+            width = np.minimum(right, (tile_x + 1) * tile_size) - np.maximum(left, tile_x * tile_size)
+            height = np.minimum(bottom, (tile_y + 1) * tile_size) - np.maximum(top, tile_y * tile_size)
+            result += np.where(hit, width * height, 0.0)
+    return result
+
+
+def resolve_boxes(collision: Tuple, new_x: np.ndarray, new_y: np.ndarray, old_x: np.ndarray, old_y: np.ndarray,
+                  half) -> Tuple[np.ndarray, np.ndarray]:
+    """CollisionMap.resolve para várias caixas de uma vez sobre a grade de
+    collision_grid; half pode ser um número ou um array por caixa"""
+    def entered(x, y, from_x, from_y):
+        overlap = _boxes_overlap(collision, x - half, y - half, x + half, y + half)
+        return (overlap > 0) & (overlap >= _boxes_overlap(collision, from_x - half, from_y - half,
+                                                          from_x + half, from_y + half))
+
+    x = np.where((new_x != old_x) & entered(new_x, old_y, old_x, old_y), old_x, new_x)
+    y = np.where((new_y != old_y) & entered(x, new_y, x, old_y), old_y, new_y)
+    return x, y
+
+
+def create_collision_map(config: GameConfig, bitmap_for) -> Optional[CollisionMap]:
+    return CollisionMap(config, bitmap_for) if config.world.walls else None
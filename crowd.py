@@ -0,0 +1,111 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+from game_config import GameConfig
+
+
+class CrowdSeparation:
+    """Afasta inimigos próximos uns dos outros para que não se amontoem.
+
+    Um passo por quadro sobre os inimigos das áreas ativas: as posições são
+    distribuídas em células do tamanho do raio de separação, e cada inimigo
+    só olha as 9 células em volta, parando em separation_neighbors
+    vizinhos. Com simulation.separation_budget o passo cobre no máximo esse
+    número de inimigos por quadro, em rodízio, e compensa o empurrão dos
+    que ficaram de fora. Os deslocamentos são aplicados juntos no fim, então
+    o resultado não depende da ordem em que os inimigos são visitados; com
+    um collision.CollisionMap, os empurrões passam por resolve_all como um
+    passo comum e não colocam ninguém dentro de uma parede.
+    """
+
+    def __init__(self, config: GameConfig):
+        self.radius = config.enemy.separation_radius
+        self.strength = config.enemy.separation_strength
+        self.max_neighbors = config.enemy.separation_neighbors
+        self.budget = config.simulation.separation_budget
+        self.cursor = 0
+        # Inimigos visitados e pares dentro do raio no último passo
+        self.checked = 0
+        self.pairs = 0
+
+    def apply(self, enemies: List, dt: float, collision=None):
+        total = len(enemies)
+        if total < 2 or dt <= 0:
+            self.checked = self.pairs = 0
+            return
+
+        radius = self.radius
+        positions = [(enemy.x, enemy.y) for enemy in enemies]
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for index, (x, y) in enumerate(positions):
+            cells.setdefault((int(x // radius), int(y // radius)), []).append(index)
+
+        count = total if not self.budget or self.budget >= total else self.budget
+        start = self.cursor % total
+        self.cursor = start + count
+        step = self.strength * dt * total / count
+        max_push = radius * 0.5
+
+        pushes = []
+        pairs = 0
+        for offset in range(count):
+            index = (start + offset) % total
+            push = self._push(index, positions, cells)
+            if push is None:
+                continue
+            push_x, push_y, found = push
+            pairs += found
+            push_x *= step
+            push_y *= step
+            length = math.sqrt(push_x * push_x + push_y * push_y)
+            if length > max_push:
+                push_x *= max_push / length
+                push_y *= max_push / length
+            pushes.append((index, push_x, push_y))
+
+        pushed = [enemies[index] for index, _, _ in pushes]
+        old_x = [enemy.x for enemy in pushed]
+        old_y = [enemy.y for enemy in pushed]
+        for enemy, (_, push_x, push_y) in zip(pushed, pushes):
+            enemy.x += push_x
+            enemy.y += push_y
+        if collision is not None:
+            collision.resolve_all(pushed, old_x, old_y)
+        self.checked = count
+        self.pairs = pairs
+
+    def _push(self, index: int, positions: List[Tuple[float, float]],
+              cells: Dict[Tuple[int, int], List[int]]) -> Optional[Tuple[float, float, int]]:
+        """Soma das repulsões dos vizinhos, cada uma caindo linearmente até o raio"""
+        radius = self.radius
+        radius_sq = radius * radius
+        x, y = positions[index]
+        cell_x, cell_y = int(x // radius), int(y // radius)
+        push_x = push_y = 0.0
+        found = 0
+        for neighbour_y in (cell_y - 1, cell_y, cell_y + 1):
+            for neighbour_x in (cell_x - 1, cell_x, cell_x + 1):
+                for other in cells.get((neighbour_x, neighbour_y), ()):
+                    if other == index:
+                        continue
+                    dx = x - positions[other][0]
+                    dy = y - positions[other][1]
+                    distance_sq = dx * dx + dy * dy
+                    if distance_sq >= radius_sq:
+                        continue
+                    if distance_sq > 0:
+                        distance = math.sqrt(distance_sq)
+                        weight = (radius - distance) / (radius * distance)
+                        push_x += dx * weight
+                        push_y += dy * weight
+                    else:
+                        # Posições iguais: separa pelo índice, sempre para o mesmo lado
+                        push_x += 1.0 if index > other else -1.0
+                    found += 1
+                    if found >= self.max_neighbors:
+                        return push_x, push_y, found
+        return (push_x, push_y, found) if found else None
+
+
+def create_crowd_separation(config: GameConfig) -> Optional[CrowdSeparation]:
+    return CrowdSeparation(config) if config.enemy.separation_radius > 0 else None
@@ -1,10 +1,21 @@
 import pygame
 import random
-import yaml
 import os
 import json
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Union
 from entities import Player, Enemy, Item
+from game_config import GameConfig
+from world_backend import WorldBackend, build_enemies, build_items, create_parallel_updater, serialize_area
+from lod import AreaAggregate, lod_neighbours
+from scheduler import AreaScheduler, update_entities
+from flow_field import create_flow_field
+from crowd import create_crowd_separation
+from collision import area_collision, create_collision_map
+from walls import draw_walls
+from render_batch import BatchRenderer
+from pools import enemy_pool, pool_stats, release_entities
+from spawn import AreaSpawn, spawn_margin
+from memory_stats import MB, files_bytes
 
 class AreaData:
     def __init__(self, grid_x: int, grid_y: int, area_size: int):
@@ -19,22 +30,45 @@ class AreaData:
         self.items: List[Item] = []
         self.last_accessed = 0.0
         self.access_count = 0
+        # Bitmap de colisão (collision.area_collision) quando world.walls está ligado
+        self.collision: Optional[bytes] = None
+        # Modelo agregado enquanto a área está inativa e perto do jogador;
+        # vale também para áreas descarregadas
+        self.aggregate: Optional[AreaAggregate] = None
 
-class DynamicAreaManager:
-    def __init__(self, config: Dict):
-        self.config = config
-        self.grid_size = config['world']['grid_size']
-        self.area_size = config['world']['area_size']
-        self.activation_distance = config['world']['activation_distance']
-        self.max_active_areas = config['world']['max_active_areas']
-        self.max_loaded_areas = 6
+class DynamicAreaManager(WorldBackend):
+    """Backend 'dynamic': só as áreas carregadas ficam em memória (no máximo
+    world.max_loaded_areas); as demais vivem no cache em disco ou ainda nem
+    foram geradas. O diretório de cache pertence a uma única instância e é
+    limpo na criação, para não misturar áreas de outra partida."""
+    
+    def __init__(self, config: Union[GameConfig, Dict], seed: int = None, cache_dir: str = "area_cache"):
+        self.config = GameConfig.coerce(config)
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.grid_size = self.config.world.grid_size
+        self.area_size = self.config.world.area_size
+        self.activation_distance = self.config.world.activation_distance
+        self.max_active_areas = self.config.world.max_active_areas
+        self.max_loaded_areas = self.config.world.max_loaded_areas
+        self.lod_radius = self.config.world.lod_radius
+        self.lod_tick_interval = self.config.world.lod_tick_interval
+        self.scheduler = AreaScheduler(self.config)
+        self.parallel = create_parallel_updater(self.config)
+        self.collision = create_collision_map(self.config, self.collision_bitmap)
+        self.flow_field = create_flow_field(self.config, self.collision)
+        self.crowd = create_crowd_separation(self.config)
+        self.batch = BatchRenderer()
+        # Relógio de simulação, usado para escolher qual área descarregar
+        self.clock = 0.0
         
         self.areas_data: Dict[Tuple[int, int], AreaData] = {}
         self.active_areas: List[AreaData] = []
         self.loaded_areas: List[AreaData] = []
+        self.lod_areas: List[AreaData] = []
         
-        self.cache_dir = "area_cache"
+        self.cache_dir = cache_dir
         self.ensure_cache_dir()
+        self.clear_cache()
         
         self.initialize_areas()
     
@@ -46,8 +80,14 @@ class DynamicAreaManager:
         for y in range(self.grid_size):
             for x in range(self.grid_size):
                 area_data = AreaData(x, y, self.area_size)
+                if self.config.world.walls:
+                    area_data.collision = area_collision(self.area_size, self.config.world.tile_size)
                 self.areas_data[(x, y)] = area_data
     
+    def collision_bitmap(self, grid_x: int, grid_y: int) -> Optional[bytes]:
+        area_data = self.areas_data.get((grid_x, grid_y))
+        return area_data.collision if area_data else None
+    
     def get_area_key(self, x: float, y: float) -> Tuple[int, int]:
         grid_x = int(x // self.area_size)
         grid_y = int(y // self.area_size)
@@ -60,47 +100,13 @@ class DynamicAreaManager:
     def get_cache_filename(self, grid_x: int, grid_y: int) -> str:
         return os.path.join(self.cache_dir, f"area_{grid_x}_{grid_y}.json")
     
+    def area_spawn(self, area_data: AreaData) -> AreaSpawn:
+        return AreaSpawn(self.config, self.seed, area_data.grid_x, area_data.grid_y)
+    
     def generate_area_content(self, area_data: AreaData) -> Dict:
-        spawn_config = self.config['spawn']
-        content = {
-            'enemies': [],
-            'items': []
-        }
-        
-        for _ in range(spawn_config['enemies_per_area']):
-            enemy_x = random.uniform(area_data.x + 20, area_data.x + area_data.area_size - 20)
-            enemy_y = random.uniform(area_data.y + 20, area_data.y + area_data.area_size - 20)
-            content['enemies'].append({
-                'x': enemy_x,
-                'y': enemy_y,
-                'health': self.config['enemy']['health'],
-                'max_health': self.config['enemy']['health']
-            })
-        
-        for _ in range(spawn_config['health_items_per_area']):
-            item_x = random.uniform(area_data.x + 15, area_data.x + area_data.area_size - 15)
-            item_y = random.uniform(area_data.y + 15, area_data.y + area_data.area_size - 15)
-            content['items'].append({
-                'x': item_x,
-                'y': item_y,
-                'type': 'health',
-                'symbol': '➕'
-            })
-        
-        for _ in range(spawn_config['ammo_items_per_area']):
-            item_x = random.uniform(area_data.x + 15, area_data.x + area_data.area_size - 15)
-            item_y = random.uniform(area_data.y + 15, area_data.y + area_data.area_size - 15)
-            content['items'].append({
-                'x': item_x,
-                'y': item_y,
-                'type': 'ammo',
-                'symbol': '⚡'
-            })
-        
-        return content
+        return self.area_spawn(area_data).content(self.config)
     
     def save_area_to_cache(self, area_data: AreaData):
-        cache_file = self.get_cache_filename(area_data.grid_x, area_data.grid_y)
         content = {
             'enemies': [],
             'items': []
@@ -111,7 +117,8 @@ class DynamicAreaManager:
                 'x': enemy.x,
                 'y': enemy.y,
                 'health': enemy.health,
-                'max_health': enemy.max_health
+                'max_health': enemy.max_health,
+                'damage_cooldown': enemy.damage_cooldown
             })
         
         for item in area_data.items:
@@ -122,66 +129,61 @@ class DynamicAreaManager:
                 'symbol': item.symbol
             })
         
+        self.write_area_cache(area_data, content)
+    
+    def write_area_cache(self, area_data: AreaData, content: Dict):
+        if area_data.collision is not None:
+            content['collision'] = area_data.collision.hex()
+        cache_file = self.get_cache_filename(area_data.grid_x, area_data.grid_y)
         with open(cache_file, 'w', encoding='utf-8') as f:
             json.dump(content, f, indent=2)
     
-    def load_area_from_cache(self, area_data: AreaData) -> bool:
+    def read_area_cache(self, area_data: AreaData) -> Optional[Dict]:
         cache_file = self.get_cache_filename(area_data.grid_x, area_data.grid_y)
         
         if not os.path.exists(cache_file):
-            return False
+            return None
         
         try:
             with open(cache_file, 'r', encoding='utf-8') as f:
-                content = json.load(f)
-            
-            area_data.enemies.clear()
-            for enemy_data in content.get('enemies', []):
-                enemy = Enemy(enemy_data['x'], enemy_data['y'], self.config['enemy'])
-                enemy.health = enemy_data['health']
-                enemy.max_health = enemy_data['max_health']
-                area_data.enemies.append(enemy)
-            
-            area_data.items.clear()
-            for item_data in content.get('items', []):
-                item_config = self.config['items'][item_data['type']]
-                item = Item(item_data['x'], item_data['y'], item_data['type'], item_config)
-                item.symbol = item_data['symbol']
-                area_data.items.append(item)
-            
-            return True
+                return json.load(f)
         except Exception as e:
             print(f"Erro ao carregar área do cache: {e}")
+            return None
+    
+    def load_area_from_cache(self, area_data: AreaData) -> bool:
+        content = self.read_area_cache(area_data)
+        if content is None:
             return False
+        
+        area_data.enemies = build_enemies(content.get('enemies', []), self.config)
+        area_data.items = build_items(content.get('items', []), self.config)
+        if 'collision' in content:
+            area_data.collision = bytes.fromhex(content['collision'])
+        return True
     
     def load_area(self, area_data: AreaData):
         if area_data.loaded:
             return
         
-        current_time = pygame.time.get_ticks() / 1000.0
-        
         if not self.load_area_from_cache(area_data):
-            content = self.generate_area_content(area_data)
-            
-            for enemy_data in content['enemies']:
-                enemy = Enemy(enemy_data['x'], enemy_data['y'], self.config['enemy'])
-                enemy.health = enemy_data['health']
-                enemy.max_health = enemy_data['max_health']
-                area_data.enemies.append(enemy)
-            
-            for item_data in content['items']:
-                item_config = self.config['items'][item_data['type']]
-                item = Item(item_data['x'], item_data['y'], item_data['type'], item_config)
-                item.symbol = item_data['symbol']
-                area_data.items.append(item)
+            area_data.enemies, area_data.items = self.area_spawn(area_data).entities(self.config)
         
         area_data.loaded = True
-        area_data.last_accessed = current_time
+        area_data.last_accessed = self.clock
         area_data.access_count += 1
         self.loaded_areas.append(area_data)
         
         if len(self.loaded_areas) > self.max_loaded_areas:
             self.unload_oldest_area()
+        self.enforce_memory_budget()
+    
+    def enforce_memory_budget(self):
+        """Descarrega áreas inativas até a memória estimada caber em world.memory_budget_mb"""
+        budget = self.config.world.memory_budget_mb * MB
+        while budget and self.world_bytes() > budget:
+            if not self.unload_oldest_area():
+                break
     
     def unload_area(self, area_data: AreaData):
         if not area_data.loaded:
@@ -189,20 +191,18 @@ class DynamicAreaManager:
         
         self.save_area_to_cache(area_data)
         
-        area_data.enemies.clear()
-        area_data.items.clear()
+        release_entities(area_data.enemies, area_data.items)
         area_data.loaded = False
         
         if area_data in self.loaded_areas:
             self.loaded_areas.remove(area_data)
     
-    def unload_oldest_area(self):
-        if not self.loaded_areas:
-            return
-        
-        oldest_area = min(self.loaded_areas, key=lambda a: a.last_accessed)
-        if oldest_area not in self.active_areas:
-            self.unload_area(oldest_area)
+    def unload_oldest_area(self) -> bool:
+        candidates = [area for area in self.loaded_areas if not area.active]
+        if not candidates:
+            return False
+        self.unload_area(min(candidates, key=lambda a: a.last_accessed))
+        return True
     
     def get_distance_to_area(self, player: Player, area_data: AreaData) -> float:
         player_rect = player.get_rect()
@@ -213,6 +213,19 @@ class DynamicAreaManager:
         
         return (dx**2 + dy**2)**0.5
     
+    def nearby_areas(self, current_area: AreaData) -> List[AreaData]:
+        """Áreas que podem estar dentro da distância de ativação, na mesma
+        ordem (linha a linha) de areas_data, sem percorrer a malha inteira"""
+        # O retângulo do jogador pode passar da borda da área atual
+        reach = int((self.activation_distance + self.config.player.size) // self.area_size) + 1
+        areas = []
+        for y in range(current_area.grid_y - reach, current_area.grid_y + reach + 1):
+            for x in range(current_area.grid_x - reach, current_area.grid_x + reach + 1):
+                area_data = self.areas_data.get((x, y))
+                if area_data:
+                    areas.append(area_data)
+        return areas
+    
     def update_active_areas(self, player: Player):
         current_area = self.get_area_at_position(player.x, player.y)
         if not current_area:
@@ -220,7 +233,7 @@ class DynamicAreaManager:
         
         new_active_areas = [current_area]
         
-        for area_data in self.areas_data.values():
+        for area_data in self.nearby_areas(current_area):
             if area_data == current_area:
                 continue
             
@@ -238,34 +251,72 @@ class DynamicAreaManager:
             if area_data not in self.active_areas:
                 area_data.active = True
                 self.load_area(area_data)
+                self.promote_area(area_data)
+                # Fora das áreas ativas ninguém passa por Game.save_previous
+                for enemy in area_data.enemies:
+                    enemy.save_previous()
         
         self.active_areas = new_active_areas
     
     def update(self, player: Player, dt: float):
+        self.clock += dt
         self.update_active_areas(player)
         
         for area_data in self.active_areas:
             if not area_data.loaded:
                 self.load_area(area_data)
-            
-            for enemy in area_data.enemies[:]:
-                if not enemy.update(player, dt):
-                    area_data.enemies.remove(enemy)
-            
-            for item in area_data.items[:]:
-                if item.collect(player):
-                    area_data.items.remove(item)
+            area_data.last_accessed = self.clock
+        
+        self.run_areas(player, dt)
+        self.update_lod(player, dt)
+    
+    def update_area(self, area_data: AreaData, player: Player, dt: float, tick: int):
+        update_entities(area_data.enemies, area_data.items, player, dt, tick, self.scheduler.steering_interval,
+                        self.flow_field, self.collision)
+    
+    def area_content(self, area_data: AreaData) -> Dict:
+        """Conteúdo de uma área fora da memória: do cache ou gerado de novo"""
+        return self.read_area_cache(area_data) or self.generate_area_content(area_data)
+    
+    def demote_area(self, area_data: AreaData) -> AreaAggregate:
+        if area_data.aggregate is None:
+            if area_data.loaded:
+                positions = [(enemy.x, enemy.y) for enemy in area_data.enemies]
+            else:
+                positions = [(enemy['x'], enemy['y']) for enemy in self.area_content(area_data)['enemies']]
+            area_data.aggregate = AreaAggregate.from_positions(positions, area_data.x, area_data.y,
+                                                               area_data.area_size,
+                                                               spawn_margin(self.config, 0, self.config.enemy.size))
+        return area_data.aggregate
+    
+    def promote_area(self, area_data: AreaData):
+        if area_data.aggregate is not None:
+            area_data.aggregate.apply(area_data.enemies)
+            area_data.aggregate = None
+    
+    def update_lod(self, player: Player, dt: float):
+        current_area = self.get_area_at_position(player.x, player.y)
+        if not current_area or self.lod_radius <= 0:
+            self.lod_areas = []
+            return
+        
+        get_area = lambda x, y: self.areas_data.get((x, y))
+        self.lod_areas = [area_data for area_data in lod_neighbours(get_area, current_area.grid_x,
+                                                                    current_area.grid_y, self.lod_radius)
+                          if not area_data.active]
+        speed = self.config.enemy.speed
+        for area_data in self.lod_areas:
+            self.demote_area(area_data).tick(player.x, player.y, speed, dt, self.lod_tick_interval)
     
-    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float):
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0):
         for area_data in self.active_areas:
             if not area_data.loaded:
                 continue
             
-            for enemy in area_data.enemies:
-                enemy.draw(screen, camera_x, camera_y)
-            
-            for item in area_data.items:
-                item.draw(screen, camera_x, camera_y)
+            if area_data.collision is not None:
+                draw_walls(screen, area_data.x, area_data.y, area_data.collision, self.config.world.tile_size,
+                           camera_x, camera_y)
+        self.draw_entities(screen, camera_x, camera_y, alpha)
     
     def draw_grid(self, screen: pygame.Surface, camera_x: float, camera_y: float):
         for area_data in self.areas_data.values():
@@ -290,6 +341,26 @@ class DynamicAreaManager:
                 text_surface = font.render(status_text, True, (0, 255, 0))
                 screen.blit(text_surface, (screen_rect.x + 5, screen_rect.y + 5))
     
+    def render_shapes(self) -> Tuple[List, List, List]:
+        rects = []
+        labels = []
+        for area_data in self.areas_data.values():
+            if area_data.active:
+                color = (100, 100, 100) if area_data.loaded else (150, 100, 100)
+            else:
+                color = (50, 50, 50)
+            rects.append((color, area_data.x, area_data.y, area_data.area_size, area_data.area_size, 2))
+            if area_data.loaded:
+                labels.append(("L", area_data.x + 5, area_data.y + 5, (0, 255, 0)))
+        walls = [(area_data.x, area_data.y, area_data.collision) for area_data in self.active_areas
+                 if area_data.loaded and area_data.collision is not None]
+        return rects, labels, walls
+    
+    def area_states(self) -> List[Tuple[int, int, bool, bool, int]]:
+        return [(area_data.grid_x, area_data.grid_y, area_data.active, area_data.loaded,
+                 area_data.aggregate.count if area_data.aggregate is not None else len(area_data.enemies))
+                for area_data in self.areas_data.values()]
+    
     def get_memory_stats(self) -> Dict:
         total_enemies = sum(len(area.enemies) for area in self.loaded_areas)
         total_items = sum(len(area.items) for area in self.loaded_areas)
@@ -300,9 +371,22 @@ class DynamicAreaManager:
             'total_areas': len(self.areas_data),
             'total_enemies': total_enemies,
             'total_items': total_items,
-            'memory_usage': f"{len(self.loaded_areas)}/{self.max_loaded_areas} áreas"
+            'memory_usage': f"{len(self.loaded_areas)}/{self.max_loaded_areas} áreas",
+            'pools': pool_stats(),
+            **self.memory_stats()
         }
     
+    def memory_areas(self) -> List[AreaData]:
+        return self.loaded_areas
+    
+    def disk_bytes(self) -> int:
+        return files_bytes(os.path.join(self.cache_dir, filename) for filename in os.listdir(self.cache_dir)
+                           if filename.startswith('area_') and filename.endswith('.json'))
+    
+    def release_content(self):
+        for area_data in self.loaded_areas:
+            release_entities(area_data.enemies, area_data.items)
+    
     def cleanup_cache(self):
         for area_data in self.areas_data.values():
             if area_data.loaded:
@@ -312,4 +396,61 @@ class DynamicAreaManager:
     def clear_cache(self):
         for filename in os.listdir(self.cache_dir):
             if filename.startswith('area_') and filename.endswith('.json'):
-                os.remove(os.path.join(self.cache_dir, filename))
\ No newline at end of file
+                os.remove(os.path.join(self.cache_dir, filename))
+    
+    @property
+    def enemies(self) -> List[Enemy]:
+        all_enemies = []
+        for area_data in self.active_areas:
+            all_enemies.extend(area_data.enemies)
+        return all_enemies
+    
+    def remove_enemies(self, enemies: List[Enemy]):
+        for enemy in enemies:
+            for area_data in self.loaded_areas:
+                if enemy in area_data.enemies:
+                    area_data.enemies.remove(enemy)
+                    enemy_pool.release(enemy)
+                    break
+    
+    def snapshot(self) -> List[Dict]:
+        areas = []
+        for area_data in self.areas_data.values():
+            if area_data.loaded:
+                if area_data.aggregate is not None:
+                    area_data.aggregate.apply(area_data.enemies)
+                enemies, items = area_data.enemies, area_data.items
+            else:
+                content = self.area_content(area_data)
+                if area_data.aggregate is not None:
+                    area_data.aggregate.apply_to_data(content['enemies'])
+                enemies = build_enemies(content['enemies'], self.config)
+                items = build_items(content['items'], self.config)
+            areas.append(serialize_area(area_data.grid_x, area_data.grid_y, area_data.active, enemies, items))
+            if not area_data.loaded:
+                release_entities(enemies, items)
+        return areas
+    
+    def restore(self, areas_data: List[Dict]):
+        for saved in areas_data:
+            area_data = self.areas_data.get((saved['grid_x'], saved['grid_y']))
+            if not area_data:
+                continue
+            area_data.active = saved['active']
+            area_data.aggregate = None
+            if area_data.loaded:
+                release_entities(area_data.enemies, area_data.items)
+                area_data.enemies = build_enemies(saved['enemies'], self.config)
+                area_data.items = build_items(saved['items'], self.config)
+            else:
+                # Áreas fora da memória vão direto para o cache, sem criar entidades
+                self.write_area_cache(area_data, {
+                    'enemies': saved['enemies'],
+                    'items': [{'x': item['x'], 'y': item['y'], 'type': item['item_type'], 'symbol': item['symbol']}
+                              for item in saved['items']]
+                })
+        
+        self.active_areas = [area_data for area_data in self.areas_data.values() if area_data.active]
+        for area_data in self.active_areas:
+            self.load_area(area_data)
+        self.scheduler.reset()
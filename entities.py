@@ -1,11 +1,16 @@
 import pygame
 import math
-from typing import Tuple
+from typing import Tuple, Union
+from game_config import EnemyConfig, ItemConfig, PlayerConfig
+from sprites import DIRECTION_STEP, input_heading, player_sprites
 
 class Entity:
     def __init__(self, x: float, y: float, size: int, color: Tuple[int, int, int]):
         self.x = x
         self.y = y
+        # Posição no passo de simulação anterior, para interpolar o desenho
+        self.prev_x = x
+        self.prev_y = y
         self.size = size
         self.color = color
         self.health = 100
@@ -18,12 +23,29 @@ class Entity:
     def get_rect(self) -> pygame.Rect:
         return pygame.Rect(self.x - self.size, self.y - self.size, self.size * 2, self.size * 2)
     
-    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float):
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
-        
+    def touches(self, other: 'Entity') -> bool:
+        """Mesmo resultado de get_rect().colliderect(other.get_rect()), sem criar Rects a cada quadro"""
+        left, top = int(self.x - self.size), int(self.y - self.size)
+        other_left, other_top = int(other.x - other.size), int(other.y - other.size)
+        return (left < other_left + other.size * 2 and other_left < left + self.size * 2 and
+                top < other_top + other.size * 2 and other_top < top + self.size * 2)
+    
+    def save_previous(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def screen_position(self, camera_x: float, camera_y: float, alpha: float = 1.0) -> Tuple[int, int]:
+        """Posição na tela em alpha entre o passo anterior (0) e o atual (1)"""
+        return (int(self.prev_x + (self.x - self.prev_x) * alpha - camera_x),
+                int(self.prev_y + (self.y - self.prev_y) * alpha - camera_y))
+    
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0):
+        """Desenha em alpha entre a posição do passo anterior (0) e a atual (1)"""
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, alpha)
         pygame.draw.circle(screen, self.color, (screen_x, screen_y), self.size)
-
+        self.draw_health_bar(screen, screen_x, screen_y)
+    
+    def draw_health_bar(self, screen: pygame.Surface, screen_x: int, screen_y: int):
         bar_width = self.size * 2
         bar_height = 4
         bar_x = screen_x - bar_width // 2
@@ -34,19 +56,30 @@ class Entity:
         pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
 
 class Player(Entity):
-    def __init__(self, x: float, y: float, config: dict):
-        super().__init__(x, y, config['size'], config['color'])
-        self.max_health = config['max_health']
+    def __init__(self, x: float, y: float, config: Union[PlayerConfig, dict]):
+        config = PlayerConfig.coerce(config)
+        super().__init__(x, y, config.size, config.color)
+        self.max_health = config.max_health
         self.health = self.max_health
-        self.speed = config['speed']
-        self.direction = 0
+        self.speed = config.speed
+        # Índice da direção entre sprites.DIRECTIONS (0 = direita)
+        self.heading = 0
         self.health_items = 0
         self.ammo_items = 0
     
-    def move(self, dx: float, dy: float, dt: float):
+    @property
+    def direction(self) -> float:
+        """Direção em radianos, já quantizada"""
+        return self.heading * DIRECTION_STEP
+    
+    def move(self, dx: float, dy: float, dt: float, collision=None):
         if dx != 0 or dy != 0:
-            self.direction = math.atan2(dy, dx)
+            self.heading = input_heading(dx, dy)
         
+        if collision is not None:
+            self.x, self.y = collision.move_box(self.x, self.y, self.size, dx * self.speed * dt,
+                                                dy * self.speed * dt)
+            return
         self.x += dx * self.speed * dt
         self.y += dy * self.speed * dt
     
@@ -55,6 +88,12 @@ class Player(Entity):
         if self.health < 0:
             self.health = 0
     
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0):
+        """Um blit do sprite pré-desenhado para a direção atual, mais a barra de vida"""
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, alpha)
+        player_sprites.blit(screen, self.color, self.size, self.heading, screen_x, screen_y)
+        self.draw_health_bar(screen, screen_x, screen_y)
+    
     def heal(self, amount: int):
         self.health += amount
         if self.health > self.max_health:
@@ -83,32 +122,61 @@ class Player(Entity):
         return []
 
 class Enemy(Entity):
-    def __init__(self, x: float, y: float, config: dict):
-        super().__init__(x, y, config['size'], config['color'])
-        self.max_health = config['health']
+    def __init__(self, x: float, y: float, config: Union[EnemyConfig, dict]):
+        self.reset(x, y, config)
+    
+    def reset(self, x: float, y: float, config: Union[EnemyConfig, dict]):
+        """Deixa o inimigo como recém-criado; usado pelos pools (pools.py)"""
+        config = EnemyConfig.coerce(config)
+        Entity.__init__(self, x, y, config.size, config.color)
+        self.max_health = config.health
         self.health = self.max_health
-        self.speed = config['speed']
-        self.damage = config['damage']
-        self.damage_interval = config['damage_interval']
-        self.last_damage_time = 0
-    
-    def update(self, player: Player, dt: float) -> bool:
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        self.speed = config.speed
+        self.damage = config.damage
+        self.damage_interval = config.damage_interval
+        self.damage_cooldown = 0.0
+        # Direção até o jogador, recalculada só quando steer é verdadeiro
+        self.dir_x = 0.0
+        self.dir_y = 0.0
+        self.steered = False
+    
+    def update(self, player: Player, dt: float, steer: bool = True, field=None, collision=None) -> bool:
+        old_x, old_y = self.x, self.y
+        self.advance(player, dt, steer, field)
+        if collision is not None:
+            collision.resolve(self, old_x, old_y)
+        return self.contact(player, dt)
+    
+    def advance(self, player: Player, dt: float, steer: bool = True, field=None):
+        """Direção (quando steer) e integração da posição, sem paredes"""
+        if steer or not self.steered:
+            direction = field.direction(self.x, self.y) if field is not None else None
+            if direction is not None:
+                self.dir_x, self.dir_y = direction
+            else:
+                dx = player.x - self.x
+                dy = player.y - self.y
+                distance = math.sqrt(dx*dx + dy*dy)
+                
+                if distance > 0:
+                    self.dir_x = dx / distance
+                    self.dir_y = dy / distance
+                else:
+                    self.dir_x = self.dir_y = 0.0
+            self.steered = True
         
-        if distance > 0:
-            dx /= distance
-            dy /= distance
-            
-            self.x += dx * self.speed * dt
-            self.y += dy * self.speed * dt
+        self.x += self.dir_x * self.speed * dt
+        self.y += self.dir_y * self.speed * dt
+    
+    def contact(self, player: Player, dt: float) -> bool:
+        """Recarga e dano por contato depois do movimento; retorna se está vivo"""
+        if self.damage_cooldown > 0:
+            self.damage_cooldown -= dt
         
-        if self.get_rect().colliderect(player.get_rect()):
-            current_time = pygame.time.get_ticks() / 1000.0
-            if current_time - self.last_damage_time >= self.damage_interval:
+        if self.touches(player):
+            if self.damage_cooldown <= 0:
                 player.take_damage(self.damage)
-                self.last_damage_time = current_time
+                self.damage_cooldown = self.damage_interval
         
         return self.health > 0
     
@@ -118,19 +186,21 @@ class Enemy(Entity):
             self.health = 0
 
 class Item(Entity):
-    def __init__(self, x: float, y: float, item_type: str, config: dict):
-        super().__init__(x, y, config['size'], config['color'])
+    def __init__(self, x: float, y: float, item_type: str, config: Union[ItemConfig, dict]):
+        self.reset(x, y, item_type, config)
+    
+    def reset(self, x: float, y: float, item_type: str, config: Union[ItemConfig, dict]):
+        """Deixa o item como recém-criado; usado pelos pools (pools.py)"""
+        config = ItemConfig.coerce(config, item_type)
+        Entity.__init__(self, x, y, config.size, config.color)
         self.item_type = item_type
         self.config = config
+        self.symbol = config.symbol or '?'
         self.health = 1
         self.max_health = 1
     
-    @property
-    def symbol(self) -> str:
-        return self.config.get('symbol', '?')
-    
     def collect(self, player: Player) -> bool:
-        if self.get_rect().colliderect(player.get_rect()):
+        if self.touches(player):
             if self.item_type == 'health':
                 player.health_items += 1
             elif self.item_type == 'ammo':
@@ -145,6 +215,6 @@ class Item(Entity):
         pygame.draw.circle(screen, self.color, (screen_x, screen_y), self.size)
         
         font = pygame.font.Font(None, 24)
-        text = font.render(self.config['symbol'], True, (255, 255, 255))
+        text = font.render(self.symbol, True, (255, 255, 255))
         text_rect = text.get_rect(center=(screen_x, screen_y))
         screen.blit(text, text_rect)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from entities import Player
+from game_config import GameConfig
+
+Cell = Tuple[int, int]
+Direction = Tuple[float, float]
+
+DIAGONAL = 1.0 / math.sqrt(2.0)
+# Vizinhos na ordem de desempate: primeiro os ortogonais
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class FlowField:
+    """Campo de direções até o jogador sobre as células das áreas ativas.
+
+    Uma busca em largura parte da célula do jogador e marca a distância de
+    cada célula livre (paredes e áreas inativas ficam de fora); cada célula
+    aponta para a vizinha mais próxima do jogador. O campo só é refeito
+    quando o jogador muda de célula, e o conjunto de células livres só
+    quando as áreas ativas mudam; os inimigos apenas consultam a direção
+    da célula onde estão.
+    """
+
+    def __init__(self, config: GameConfig, collision=None):
+        self.cell_size = config.simulation.flow_cell_size
+        self.area_size = config.world.area_size
+        # collision.CollisionMap; sem ele nenhuma célula é bloqueada
+        self.collision = collision
+        self.key = None
+        self.areas = None
+        # Células livres de cada área; as paredes não mudam depois de criadas
+        self.area_cells: Dict[Cell, List[Cell]] = {}
+        self.free: Set[Cell] = set()
+        self.target: Optional[Cell] = None
+        self.distances: Dict[Cell, int] = {}
+        self.directions: Dict[Cell, Optional[Direction]] = {}
+        # Incrementa a cada cálculo; o modo paralelo reenvia o campo só quando muda
+        self.version = 0
+
+    def cell_at(self, x: float, y: float) -> Cell:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def update(self, player: Player, active_areas: Iterable) -> bool:
+        """Recalcula o campo se o jogador mudou de célula; retorna se recalculou"""
+        target = self.cell_at(player.x, player.y)
+        areas = tuple(sorted((area.grid_x, area.grid_y) for area in active_areas))
+        if (target, areas) == self.key:
+            return False
+        if areas != self.areas:
+            self.areas = areas
+            self.free = self.free_cells(areas)
+        self.key = (target, areas)
+        self.compute(target)
+        return True
+
+    def free_cells(self, areas: Iterable[Cell]) -> Set[Cell]:
+        cells = set()
+        for key in areas:
+            area_cells = self.area_cells.get(key)
+            if area_cells is None:
+                area_cells = self.area_cells[key] = self._area_cells(*key)
+            cells.update(area_cells)
+        return cells
+
+    def _area_cells(self, grid_x: int, grid_y: int) -> List[Cell]:
+        """Células cujo centro cai dentro da área e fora das paredes"""
+        size = self.cell_size
+        left, top = grid_x * self.area_size, grid_y * self.area_size
+        cells = []
+        for cell_y in range(-(-top // size), -(-(top + self.area_size) // size)):
+            for cell_x in range(-(-left // size), -(-(left + self.area_size) // size)):
+                center_x, center_y = (cell_x + 0.5) * size, (cell_y + 0.5) * size
+                if self.collision is None or not self.collision.blocked_at(center_x, center_y):
+                    cells.append((cell_x, cell_y))
+        return cells
+
+    def compute(self, target: Cell):
+        self.version += 1
+        self.target = target
+        free = self.free
+        distances = {target: 0}
+        queue = deque([target])
+        while queue:
+            cell = queue.popleft()
+            x, y = cell
+            next_distance = distances[cell] + 1
+            for dx, dy in NEIGHBOURS:
+                neighbour = (x + dx, y + dy)
+                if neighbour in distances or neighbour not in free:
+                    continue
+                # Diagonal só sem cortar o canto de uma parede
+                if dx and dy and ((x + dx, y) not in free or (x, y + dy) not in free):
+                    continue
+                distances[neighbour] = next_distance
+                queue.append(neighbour)
+        self.distances = distances
+        # Direções calculadas sob demanda, só nas células com inimigos
+        self.directions = {}
+
+    def direction(self, x: float, y: float) -> Optional[Direction]:
+        """Direção da célula; None na célula do jogador ou fora do campo
+        (o inimigo então segue direto para o jogador)"""
+        cell = self.cell_at(x, y)
+        try:
+            return self.directions[cell]
+        except KeyError:
+            direction = self.directions[cell] = self._cell_direction(cell)
+            return direction
+
+    def all_directions(self) -> Dict[Cell, Direction]:
+        """Direções de todas as células alcançáveis (usado pelo modo paralelo)"""
+        for cell in self.distances:
+            if cell not in self.directions:
+                self.directions[cell] = self._cell_direction(cell)
+        return {cell: direction for cell, direction in self.directions.items() if direction is not None}
+
+    def _cell_direction(self, cell: Cell) -> Optional[Direction]:
+        distance = self.distances.get(cell)
+        if not distance:
+            return None
+        x, y = cell
+        target_x, target_y = self.target
+        best = None
+        for dx, dy in NEIGHBOURS:
+            neighbour_distance = self.distances.get((x + dx, y + dy))
+            if neighbour_distance is None or neighbour_distance >= distance:
+                continue
+            if dx and dy and ((x + dx, y) not in self.free or (x, y + dy) not in self.free):
+                continue
+            # Entre vizinhas igualmente próximas, a que fica mais perto em linha reta
+            rank = (neighbour_distance, (x + dx - target_x) ** 2 + (y + dy - target_y) ** 2)
+            if best is None or rank < best[0]:
+                best = (rank, dx, dy)
+        _, dx, dy = best
+        return (dx * DIAGONAL, dy * DIAGONAL) if dx and dy else (float(dx), float(dy))
+
+
+def create_flow_field(config: GameConfig, collision=None) -> Optional[FlowField]:
+    return FlowField(config, collision) if config.simulation.pursuit == 'flow' else None
@@ -1,23 +1,46 @@
 import pygame
 import sys
 import os
-import yaml
 import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
 from entities import Player
-from world import World
+from world_backend import create_world
 from camera import Camera
 from game_state import GameStateManager, create_preset_scenario, generate_random_scenario
 from pause_menu import PauseMenu
+from game_config import GameConfig, load_config
+from startup_timing import StartupTimer
+from gc_control import GCController
+from memory_stats import overlay_lines, process_rss, saves_bytes, surfaces_bytes
+from timestep import FixedTimestep, FramePacing
+from quality import QualityController
+from minimap import Minimap
+from render_snapshot import RenderSnapshot, SnapshotRenderer, capture_snapshot
+
+MEMORY_REFRESH = 0.5
+# Pausado ou no fim de jogo, o laço acorda ao menos a cada IDLE_TIMEOUT_MS sem eventos
+IDLE_TIMEOUT_MS = 250
+
 
 class Game:
-    def __init__(self, config_path: str = 'config.yaml'):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+    def __init__(self, config_path: str = 'config.yaml', config: Union[GameConfig, Dict] = None, seed: int = None,
+                 timer: StartupTimer = None):
+        self.timer = timer or StartupTimer()
+        with self.timer.measure('config'):
+            if config:
+                self.config = GameConfig.coerce(config)
+            else:
+                self.config = load_config(config_path)
         
-        self.window_width = self.config['game']['window_width']
-        self.window_height = self.config['game']['window_height']
-        self.fps = self.config['game']['fps']
-        self.survival_time = self.config['game']['survival_time']
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.world_rng = random.Random(self.seed)
+        
+        self.window_width = self.config.game.window_width
+        self.window_height = self.config.game.window_height
+        self.fps = self.config.game.fps
+        self.survival_time = self.config.game.survival_time
         
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption("Jogo de Sobrevivência")
@@ -26,83 +49,183 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
-        self.world = World(config_path)
+        # No backend estático só a área central é gerada aqui; as outras ficam para os primeiros quadros
+        with self.timer.measure('world_gen'):
+            self.world = create_world(self.config, seed=self.world_rng.getrandbits(32))
         self.camera = Camera(self.window_width, self.window_height)
         
-        area_size = self.config['world']['area_size']
+        area_size = self.config.world.area_size
         center_x = area_size + area_size // 2
         center_y = area_size + area_size // 2
-        self.player = Player(center_x, center_y, self.config['player'])
+        self.player = Player(center_x, center_y, self.config.player)
         
         self.state_manager = GameStateManager(self.world, self.player, self.config)
         self.pause_menu = PauseMenu(self.window_width, self.window_height)
         
-        self.game_start_time = 0
+        self.elapsed_time = 0.0
         self.game_running = True
         self.game_over = False
         self.victory = False
         self.paused = False
         
         self.keys_pressed = set()
+        self.frame_inputs = []
+        self.recorder = None
+        self.first_frame_drawn = False
+        self.print_startup_report = False
+        self.gc = GCController(self.config.simulation.gc)
+        simulation = self.config.simulation
+        self.timestep = FixedTimestep(simulation.tick_rate, simulation.max_steps) if simulation.tick_rate > 0 else None
+        self.pacing = FramePacing()
+        # Fração do próximo passo de simulação já decorrida, usada no desenho
+        self.alpha = 1.0
+        # profiling.StackSampler / AllocationTracker, criados na primeira vez que F6 / F7 é usada
+        self.sampler = None
+        self.allocations = None
+        # Overlay de memória e ritmo dos quadros (F3), recalculado a cada MEMORY_REFRESH segundos
+        self.show_memory = False
+        self.memory_lines = []
+        self.memory_age = 0.0
+        # Textos do HUD já renderizados, por (fonte, texto, cor)
+        self.text_cache: Dict = {}
+        # game.pipeline: a simulação do quadro roda numa thread enquanto a principal
+        # desenha o snapshot do quadro anterior; custa um quadro a mais entre a
+        # entrada e a imagem
+        self.pipeline = None
+        self.snapshot = None
+        if self.config.game.pipeline:
+            self.pipeline = ThreadPoolExecutor(max_workers=1, thread_name_prefix='simulacao')
+        # Níveis de qualidade reduzidos também desenham a partir de snapshots,
+        # numa superfície menor quando render_scale < 1
+        self.snapshot_renderer = SnapshotRenderer(self.config.world.tile_size)
+        self.world_surface = None
+        quality = self.config.quality
+        self.quality = QualityController(quality.levels, 1000.0 / (quality.target_fps or self.fps), quality.adaptive)
+        # Malha inteira de áreas no canto da tela (M)
+        self.show_minimap = True
+        self.minimap = Minimap(self.config.world.grid_size, self.config.world.area_size,
+                               self.config.spawn.enemies_per_area * 2)
+        self.apply_quality()
     
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.game_running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                self.keys_pressed.add(event.key)
-                
-                if event.key == pygame.K_ESCAPE:
-                    if not self.game_over:
-                        self.pause_menu.toggle()
-                        self.paused = self.pause_menu.visible
-                elif event.key == pygame.K_h and not self.paused:
-                    self.player.use_health_item()
-                elif event.key == pygame.K_j and not self.paused:
-                    killed_enemies = self.player.use_ammo_item(
-                        self.world.enemies,
-                        self.config['items']['ammo']['damage'],
-                        self.config['items']['ammo']['radius']
-                    )
-                    for enemy in killed_enemies:
-                        for area in self.world.areas:
-                            if enemy in area.enemies:
-                                area.enemies.remove(enemy)
-                                break
-                elif event.key == pygame.K_F5 and not self.paused:
-                    self.save_state()
-                elif event.key == pygame.K_F9 and not self.paused:
-                    self.load_state()
-            
-            elif event.type == pygame.KEYUP:
-                self.keys_pressed.discard(event.key)
+    def handle_events(self, events: List[pygame.event.Event] = None):
+        self.frame_inputs = []
+        for event in pygame.event.get() if events is None else events:
+            action = self.process_event(event)
+            if action in ("main_menu", "quit"):
+                return action
+    
+    def wait_for_events(self) -> List[pygame.event.Event]:
+        """Com a tela parada, dorme em event.wait até chegar um evento (ou
+        IDLE_TIMEOUT_MS) em vez de girar o laço na taxa de quadros"""
+        event = pygame.event.wait(IDLE_TIMEOUT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+    
+    def idle_redraw(self, events: List[pygame.event.Event]) -> bool:
+        """Se o quadro parado precisa ser redesenhado: mudança de foco nos
+        botões da pausa, overlay F3 ligado ou qualquer evento além de movimento do mouse"""
+        if self.pause_menu.dirty or self.show_memory:
+            return True
+        return any(event.type != pygame.MOUSEMOTION for event in events)
+    
+    def process_event(self, event: pygame.event.Event):
+        """Trata um evento; teclas e ações do menu ficam em frame_inputs para gravação"""
+        if event.type == pygame.QUIT:
+            self.game_running = False
+        
+        elif event.type == pygame.KEYDOWN:
+            self.keys_pressed.add(event.key)
+            self.frame_inputs.append(('key', event.key))
             
-            if self.pause_menu.visible:
-                action = self.pause_menu.handle_event(event)
-                if action == "resume":
-                    self.paused = False
-                elif action == "restart":
-                    self.restart()
-                elif action == "main_menu":
-                    self.game_running = False
-                    return "main_menu"
-                elif action == "quit":
-                    self.game_running = False
-                    return "quit"
+            if event.key == pygame.K_ESCAPE:
+                if not self.game_over:
+                    self.pause_menu.toggle()
+                    self.paused = self.pause_menu.visible
+            elif event.key == pygame.K_h and not self.paused:
+                self.player.use_health_item()
+            elif event.key == pygame.K_j and not self.paused:
+                killed_enemies = self.player.use_ammo_item(
+                    self.world.enemies,
+                    self.config.items.ammo.damage,
+                    self.config.items.ammo.radius
+                )
+                self.world.remove_enemies(killed_enemies)
+            elif event.key == pygame.K_F5 and not self.paused:
+                self.save_state()
+            elif event.key == pygame.K_F9 and not self.paused:
+                self.load_state()
+            elif event.key == pygame.K_F3:
+                self.show_memory = not self.show_memory
+                self.memory_age = MEMORY_REFRESH
+                # Na pausa, o quadro congelado é capturado de novo com ou sem o overlay
+                self.pause_menu.invalidate()
+            elif event.key == pygame.K_m:
+                self.show_minimap = not self.show_minimap
+                self.pause_menu.invalidate()
+            elif event.key == pygame.K_F6:
+                self.start_profiler()
+            elif event.key == pygame.K_F7:
+                self.toggle_allocation_capture()
+        
+        elif event.type == pygame.KEYUP:
+            self.keys_pressed.discard(event.key)
+        
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.pause_menu.redraw()
+        
+        if self.pause_menu.visible:
+            action = self.pause_menu.handle_event(event)
+            if action != "none" and event.type != pygame.KEYDOWN:
+                self.frame_inputs.append(('menu', action))
+            return self.apply_menu_action(action)
     
+    def apply_menu_action(self, action: str):
+        if action == "resume":
+            self.paused = False
+        elif action == "restart":
+            self.restart()
+        elif action == "main_menu":
+            self.game_running = False
+            return "main_menu"
+        elif action == "quit":
+            self.game_running = False
+            return "quit"
+    
+    def tick(self, dt: float):
+        """Avança um quadro de simulação a partir do estado atual das teclas"""
+        if pygame.K_r in self.keys_pressed and self.game_over:
+            self.restart()
+        
+        if self.world.generate_pending() == 0:
+            self.gc.world_ready()
+        
+        if self.timestep is None:
+            self.update(dt)
+            self.pacing.record(dt)
+            return
+        
+        steps = self.timestep.advance(dt)
+        for _ in range(steps):
+            self.save_previous()
+            self.update(self.timestep.step)
+        self.alpha = self.timestep.alpha
+        self.pacing.record(dt, steps)
+    
+    def save_previous(self):
+        """Guarda as posições antes de um passo, para o desenho interpolar até as novas"""
+        self.player.save_previous()
+        self.camera.save_previous()
+        for enemy in self.world.enemies:
+            enemy.save_previous()
     
     def update(self, dt: float):
         if self.game_over or self.paused:
             return
         
-        if self.game_start_time == 0:
-            self.game_start_time = pygame.time.get_ticks() / 1000.0
-        
-        current_time = pygame.time.get_ticks() / 1000.0
-        elapsed_time = current_time - self.game_start_time
+        self.elapsed_time += dt
         
-        if elapsed_time >= self.survival_time:
+        if self.elapsed_time >= self.survival_time:
             self.victory = True
             self.game_over = True
             return
@@ -121,7 +244,7 @@ class Game:
             dx *= 0.707
             dy *= 0.707
         
-        self.player.move(dx, dy, dt)
+        self.player.move(dx, dy, dt, self.world.collision)
         
         if self.player.health <= 0:
             self.game_over = True
@@ -131,61 +254,207 @@ class Game:
         self.camera.follow(self.player.x, self.player.y)
         self.camera.update(dt)
     
-    def draw(self):
-        self.screen.fill((20, 20, 20))
-        
-        camera_x, camera_y = self.camera.get_position()
-        
-        self.world.draw_grid(self.screen, camera_x, camera_y)
-        self.world.draw(self.screen, camera_x, camera_y)
-        self.player.draw(self.screen, camera_x, camera_y)
+    def memory_report(self) -> Dict:
+        """Memória estimada por subsistema, em bytes, e o RSS do processo (None sem psutil)"""
+        world = self.world.memory_stats()
+        return {
+            'rss': process_rss(),
+            'subsystems': {
+                'Mundo': world['world_bytes'],
+                'Pools': world['pool_bytes'],
+                'Textos do HUD': surfaces_bytes(tuple(self.text_cache.values())),
+                'Cache de áreas': world['disk_bytes'],
+                'Saves': saves_bytes()
+            },
+            'world': world
+        }
+    
+    def refresh_overlay(self, dt: float):
+        """Recalcula as linhas do overlay F3 a cada MEMORY_REFRESH segundos"""
+        self.memory_age += dt
+        if self.memory_age < MEMORY_REFRESH:
+            return
+        self.memory_age = 0.0
+        pacing = self.pacing.summary()
+        rate = f"{self.config.simulation.tick_rate:g}Hz" if self.timestep else "dt variável"
+        lines = [f"Quadro: {pacing['frame_ms']:.1f}ms ±{pacing['jitter_ms']:.1f} | "
+                 f"p95 {pacing['p95_ms']:.1f}ms | sim {rate}, {pacing['steps_per_frame']:.1f}/quadro"]
+        lines.extend(overlay_lines(self.memory_report()))
+        self.memory_lines = lines
+    
+    def draw_overlay(self, lines: List[str]):
+        for index, line in enumerate(lines):
+            text = self.render_text(self.small_font, line, (180, 220, 255))
+            self.screen.blit(text, (10, 130 + index * 22))
+    
+    def apply_quality(self):
+        self.world.decimate_ai(self.quality.level.ai_interval)
+    
+    def draw(self, dt: float = 0.0):
+        if self.draw_paused():
+            return
+        if self.quality.level.full:
+            self.screen.fill((20, 20, 20))
+            
+            camera_x, camera_y = self.camera.get_position(self.alpha)
+            
+            self.world.draw_grid(self.screen, camera_x, camera_y)
+            self.world.draw(self.screen, camera_x, camera_y, self.alpha)
+            self.player.draw(self.screen, camera_x, camera_y, self.alpha)
+        else:
+            self.draw_world(capture_snapshot(self))
         
         self.draw_ui()
+        if self.show_memory:
+            self.refresh_overlay(dt)
+            self.draw_overlay(self.memory_lines)
         
+        self.present()
+    
+    def present(self):
+        """Mostra o quadro; ao pausar, ele vira o fundo congelado da pausa"""
         self.pause_menu.draw(self.screen)
-        
         pygame.display.flip()
     
-    def draw_ui(self):
-        health_text = self.font.render(f"Vida: {self.player.health}", True, (255, 255, 255))
+    def draw_paused(self) -> bool:
+        """Com a pausa já sobre um quadro congelado, só as áreas dos botões que
+        mudaram de foco são redesenhadas e enviadas com display.update"""
+        if not self.pause_menu.visible or self.pause_menu.frozen is None:
+            return False
+        rects = self.pause_menu.draw(self.screen)
+        if rects:
+            pygame.display.update(rects)
+        return True
+    
+    def simulate(self, dt: float) -> RenderSnapshot:
+        """Um quadro de simulação do modo pipeline; não toca na tela"""
+        self.tick(dt)
+        if self.show_memory:
+            self.refresh_overlay(dt)
+        return capture_snapshot(self)
+    
+    def draw_world(self, snapshot: RenderSnapshot):
+        """Mundo e jogador no nível de qualidade atual; abaixo de render_scale 1
+        o desenho é feito em world_surface e ampliado para a janela"""
+        level = self.quality.level
+        if level.render_scale == 1:
+            self.screen.fill((20, 20, 20))
+            self.snapshot_renderer.draw(self.screen, snapshot, level)
+            return
+        size = (max(1, int(self.window_width * level.render_scale)),
+                max(1, int(self.window_height * level.render_scale)))
+        if self.world_surface is None or self.world_surface.get_size() != size:
+            self.world_surface = pygame.Surface(size)
+        self.world_surface.fill((20, 20, 20))
+        self.snapshot_renderer.draw(self.world_surface, snapshot, level)
+        pygame.transform.scale(self.world_surface, self.screen.get_size(), self.screen)
+    
+    def draw_snapshot(self, snapshot: RenderSnapshot):
+        if self.draw_paused():
+            return
+        self.draw_world(snapshot)
+        self.draw_ui(snapshot.hud)
+        if snapshot.overlay:
+            self.draw_overlay(snapshot.overlay)
+        
+        self.present()
+    
+    def pipeline_frame(self, dt: float):
+        """Simula este quadro na thread de simulação enquanto desenha o anterior.
+        Eventos são tratados antes do submit, então só o desenho (que lê apenas
+        o snapshot imutável) corre junto com a simulação. A entrada deste quadro
+        só aparece na tela no próximo: um quadro a mais de latência."""
+        pending = self.pipeline.submit(self.simulate, dt)
+        if self.snapshot is not None:
+            self.draw_snapshot(self.snapshot)
+        self.snapshot = pending.result()
+    
+    def render_text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) > 256:
+                self.text_cache.clear()
+            surface = self.text_cache[key] = font.render(text, True, color)
+        return surface
+    
+    def hud_state(self) -> Dict:
+        """Valores que o HUD mostra, lidos do estado da simulação"""
+        scheduled = self.world.scheduler.last
+        return {
+            'health': self.player.health,
+            'enemies': self.world.enemy_count,
+            'health_items': self.player.health_items,
+            'ammo_items': self.player.ammo_items,
+            'remaining_time': max(0, self.survival_time - self.elapsed_time),
+            'active_areas': len(self.world.active_areas),
+            'deferred': scheduled.staggered + scheduled.over_budget,
+            'quality': self.quality.level.name,
+            'areas': self.world.area_states() if self.show_minimap and self.minimap.due else (),
+            'position': (self.player.x, self.player.y),
+            'paused': self.paused,
+            'game_over': self.game_over,
+            'victory': self.victory
+        }
+    
+    def draw_ui(self, hud: Dict = None):
+        hud = hud or self.hud_state()
+        health_text = self.render_text(self.font, f"Vida: {hud['health']}", (255, 255, 255))
         self.screen.blit(health_text, (10, 10))
         
-        active_enemies = len(self.world.enemies)
-        enemies_text = self.small_font.render(f"Inimigos: {active_enemies}", True, (255, 255, 255))
+        enemies_text = self.render_text(self.small_font, f"Inimigos: {hud['enemies']}", (255, 255, 255))
         self.screen.blit(enemies_text, (10, 50))
         
-        health_items_text = self.small_font.render(f"➕: {self.player.health_items}", True, (255, 255, 255))
+        health_items_text = self.render_text(self.small_font, f"➕: {hud['health_items']}", (255, 255, 255))
         self.screen.blit(health_items_text, (10, 75))
         
-        ammo_items_text = self.small_font.render(f"⚡: {self.player.ammo_items}", True, (255, 255, 255))
+        ammo_items_text = self.render_text(self.small_font, f"⚡: {hud['ammo_items']}", (255, 255, 255))
         self.screen.blit(ammo_items_text, (10, 100))
         
-        current_time = pygame.time.get_ticks() / 1000.0
-        elapsed_time = current_time - self.game_start_time
-        remaining_time = max(0, self.survival_time - elapsed_time)
-        
-        time_text = self.font.render(f"Tempo: {remaining_time:.1f}s", True, (255, 255, 255))
+        time_text = self.render_text(self.font, f"Tempo: {hud['remaining_time']:.1f}s", (255, 255, 255))
         self.screen.blit(time_text, (self.window_width - 200, 10))
         
-        active_areas_text = self.small_font.render(f"Áreas Ativas: {len(self.world.active_areas)}", True, (255, 255, 255))
+        active_areas_text = self.render_text(self.small_font, f"Áreas Ativas: {hud['active_areas']}", (255, 255, 255))
         self.screen.blit(active_areas_text, (self.window_width - 200, 50))
         
-        if self.paused:
-            controls_text = self.small_font.render("ESC: Continuar | PAUSADO", True, (255, 255, 0))
+        if hud['deferred']:
+            deferred_text = self.render_text(self.small_font, f"Adiadas: {hud['deferred']}", (200, 200, 200))
+            self.screen.blit(deferred_text, (self.window_width - 200, 75))
+        
+        quality_text = self.render_text(self.small_font, f"Qualidade: {hud['quality']}", (200, 200, 200))
+        self.screen.blit(quality_text, (self.window_width - 200, 125))
+        
+        if self.show_minimap:
+            self.minimap.update(hud['areas'])
+            width, height = self.minimap.surface.get_size()
+            self.minimap.draw(self.screen, self.window_width - width - 10, self.window_height - height - 40,
+                              *hud['position'])
+        
+        profiling = []
+        if self.sampler is not None and self.sampler.running:
+            profiling.append(f"Perfil: {self.sampler.remaining:.0f}s")
+        if self.allocations is not None and self.allocations.tracing:
+            profiling.append("Alocações: F7")
+        if profiling:
+            profiling_text = self.render_text(self.small_font, " | ".join(profiling), (255, 120, 120))
+            self.screen.blit(profiling_text, (self.window_width - 200, 100))
+        
+        if hud['paused']:
+            controls_text = self.render_text(self.small_font, "ESC: Continuar | PAUSADO", (255, 255, 0))
         else:
-            controls_text = self.small_font.render("WASD: Mover | H: ➕ | J: ⚡ | F5: Salvar | F9: Carregar | ESC: Pausar", True, (200, 200, 200))
+            controls_text = self.render_text(self.small_font, "WASD: Mover | H: ➕ | J: ⚡ | M: Mapa | F5: Salvar | F9: Carregar | ESC: Pausar", (200, 200, 200))
         self.screen.blit(controls_text, (10, self.window_height - 30))
         
-        if self.game_over:
-            if self.victory:
-                result_text = self.font.render("VITÓRIA!", True, (0, 255, 0))
+        if hud['game_over']:
+            if hud['victory']:
+                result_text = self.render_text(self.font, "VITÓRIA!", (0, 255, 0))
             else:
-                result_text = self.font.render("GAME OVER", True, (255, 0, 0))
+                result_text = self.render_text(self.font, "GAME OVER", (255, 0, 0))
             
             text_rect = result_text.get_rect(center=(self.window_width//2, self.window_height//2))
             self.screen.blit(result_text, text_rect)
             
-            restart_text = self.small_font.render("Pressione R para reiniciar", True, (255, 255, 255))
+            restart_text = self.render_text(self.small_font, "Pressione R para reiniciar", (255, 255, 255))
             restart_rect = restart_text.get_rect(center=(self.window_width//2, self.window_height//2 + 50))
             self.screen.blit(restart_text, restart_rect)
     
@@ -214,35 +483,92 @@ class Game:
         except Exception as e:
             print(f"❌ Erro ao carregar estado: {e}")
     
+    def start_profiler(self, duration: float = 5.0):
+        """Amostra a pilha do jogo por alguns segundos sem pausá-lo"""
+        if self.sampler is not None and self.sampler.running:
+            return
+        from profiling import StackSampler
+        self.sampler = StackSampler(duration)
+        self.sampler.start()
+        print(f"📊 Amostrando por {duration:.0f}s...")
+    
+    def toggle_allocation_capture(self):
+        """Primeira vez: liga o tracemalloc; segunda: grava a diferença de alocações"""
+        if self.allocations is None:
+            from profiling import AllocationTracker
+            self.allocations = AllocationTracker()
+        report = self.allocations.toggle()
+        if report:
+            print(f"📊 Alocações salvas em: {report}")
+        else:
+            print("📊 Rastreando alocações; F7 de novo para gravar a diferença")
     
     def restart(self):
-        self.world = World()
-        area_size = self.config['world']['area_size']
+        self.world.close()
+        # O mundo antigo estava congelado; volta ao coletor e o novo é congelado quando terminar de gerar
+        self.gc.unfreeze()
+        self.world = create_world(self.config, seed=self.world_rng.getrandbits(32))
+        area_size = self.config.world.area_size
         center_x = area_size + area_size // 2
         center_y = area_size + area_size // 2
-        self.player = Player(center_x, center_y, self.config['player'])
+        self.player = Player(center_x, center_y, self.config.player)
         self.state_manager = GameStateManager(self.world, self.player, self.config)
         self.pause_menu = PauseMenu(self.window_width, self.window_height)
-        self.game_start_time = 0
+        self.apply_quality()
+        self.elapsed_time = 0.0
         self.game_over = False
         self.victory = False
         self.paused = False
     
     def run(self):
-        while self.game_running:
-            dt = self.clock.tick(self.fps) / 1000.0
-            
-            action = self.handle_events()
-            if action == "main_menu":
-                return "main_menu"
-            elif action == "quit":
-                return "quit"
-            
-            if pygame.K_r in self.keys_pressed and self.game_over:
-                self.restart()
-            
-            self.update(dt)
-            self.draw()
+        self.gc.start()
+        try:
+            while self.game_running:
+                idle = self.paused or self.game_over
+                events = None
+                if idle:
+                    events = self.wait_for_events()
+                    dt = self.clock.tick() / 1000.0
+                else:
+                    dt = self.clock.tick(self.fps) / 1000.0
+                self.gc.begin_frame()
+                # get_rawtime: trabalho do quadro anterior, sem a espera do clock.tick;
+                # parado, o tempo é de espera e não diz nada sobre a qualidade
+                if not idle and self.quality.record(self.clock.get_rawtime(), dt):
+                    self.apply_quality()
+                
+                action = self.handle_events(events)
+                if self.recorder:
+                    self.recorder.record_frame(dt, self.keys_pressed, self.frame_inputs)
+                if action == "main_menu":
+                    return "main_menu"
+                elif action == "quit":
+                    return "quit"
+                
+                if idle:
+                    # tick continua rodando para o replay ver os mesmos quadros
+                    self.tick(dt)
+                    if self.idle_redraw(events):
+                        self.draw(dt)
+                elif self.pipeline is None:
+                    self.tick(dt)
+                    self.draw(dt)
+                else:
+                    self.pipeline_frame(dt)
+                # Coletas ficam para depois do flip, dentro da espera do clock.tick
+                self.gc.end_frame(idle=self.paused or self.game_over)
+                if not self.first_frame_drawn:
+                    self.first_frame_drawn = True
+                    self.timer.mark('first_frame')
+                    if self.print_startup_report:
+                        print(self.timer.report())
+        finally:
+            if self.pipeline is not None:
+                self.pipeline.shutdown()
+            self.world.close()
+            self.gc.stop()
+            if self.recorder:
+                self.recorder.close()
         
         pygame.quit()
         return "quit"
\ No newline at end of file
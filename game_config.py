@@ -0,0 +1,469 @@
+import copy
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+Color = Tuple[int, int, int]
+
+# Valores usados quando uma chave não aparece no arquivo (os mesmos do config.yaml)
+DEFAULTS: Dict[str, Dict[str, Any]] = {
+    'game': {'window_width': 1200, 'window_height': 800, 'fps': 30, 'survival_time': 90, 'pipeline': False},
+    'player': {'size': 20, 'speed': 200, 'max_health': 100, 'color': [0, 255, 0]},
+    'enemy': {'size': 15, 'speed': 120, 'health': 60, 'damage': 15, 'damage_interval': 1.0,
+              'color': [255, 165, 0], 'separation_radius': 0, 'separation_strength': 240,
+              'separation_neighbors': 6},
+    'items': {
+        'health': {'size': 10, 'heal_amount': 30, 'damage': 0, 'radius': 0,
+                   'color': [255, 255, 0], 'symbol': '➕'},
+        'ammo': {'size': 10, 'heal_amount': 0, 'damage': 50, 'radius': 150,
+                 'color': [0, 255, 255], 'symbol': '⚡'}
+    },
+    'world': {'grid_size': 3, 'area_size': 500, 'activation_distance': 80, 'max_active_areas': 4,
+              'backend': 'static', 'max_loaded_areas': 6, 'lod_radius': 1, 'lod_tick_interval': 0.25,
+              'walls': False, 'tile_size': 25, 'memory_budget_mb': 0},
+    'spawn': {'enemies_per_area': 8, 'health_items_per_area': 1, 'ammo_items_per_area': 1},
+    'simulation': {'update_budget_ms': 0, 'max_lag': 0.25, 'steering_interval': 1, 'workers': 0,
+                   'pursuit': 'direct', 'flow_cell_size': 25, 'separation_budget': 0, 'gc': 'managed',
+                   'tick_rate': 30, 'max_steps': 5},
+    'quality': {'adaptive': True, 'target_fps': 0, 'levels': [
+        {'name': 'Alta', 'health_bars': True, 'detail': True, 'render_scale': 1.0, 'ai_interval': 1},
+        {'name': 'Média', 'health_bars': False, 'detail': True, 'render_scale': 1.0, 'ai_interval': 1},
+        {'name': 'Baixa', 'health_bars': False, 'detail': False, 'render_scale': 0.75, 'ai_interval': 2},
+        {'name': 'Mínima', 'health_bars': False, 'detail': False, 'render_scale': 0.5, 'ai_interval': 4}
+    ]}
+}
+
+# Defaults de cada nível de quality.levels: o desenho completo
+QUALITY_LEVEL_DEFAULTS: Dict[str, Any] = DEFAULTS['quality']['levels'][0]
+
+
+class ConfigError(ValueError):
+    def __init__(self, errors: List[str], source: str = None):
+        self.errors = errors
+        prefix = f"Configuração inválida ({source})" if source else "Configuração inválida"
+        super().__init__(prefix + ":\n  - " + "\n  - ".join(errors))
+
+
+class _Reader:
+    """Lê uma seção com defaults, acumulando erros em vez de parar no primeiro"""
+
+    def __init__(self, data: Any, path: str, defaults: Dict, errors: List[str]):
+        if data is None:
+            data = {}
+        elif not isinstance(data, dict):
+            errors.append(f"{path}: deve ser um mapeamento")
+            data = {}
+        self.data = data
+        self.path = path
+        self.defaults = defaults
+        self.errors = errors
+
+    def _get(self, key: str) -> Any:
+        return self.data.get(key, self.defaults.get(key))
+
+    def number(self, key: str, minimum: float = 0, integer: bool = False, strict: bool = False):
+        value = self._get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            self.errors.append(f"{self.path}.{key}: esperado número, recebido {value!r}")
+            return self.defaults.get(key, 0)
+        if integer and not float(value).is_integer():
+            self.errors.append(f"{self.path}.{key}: esperado inteiro, recebido {value!r}")
+        if value < minimum or (strict and value == minimum):
+            relation = 'maior que' if strict else 'no mínimo'
+            self.errors.append(f"{self.path}.{key}: deve ser {relation} {minimum}, recebido {value!r}")
+        return int(value) if integer else value
+
+    def color(self, key: str) -> Color:
+        value = self._get(key)
+        if (not isinstance(value, (list, tuple)) or len(value) != 3 or
+                not all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+            self.errors.append(f"{self.path}.{key}: esperado [r, g, b] entre 0 e 255, recebido {value!r}")
+            return tuple(self.defaults[key])
+        return tuple(value)
+
+    def text(self, key: str) -> str:
+        value = self._get(key)
+        if not isinstance(value, str):
+            self.errors.append(f"{self.path}.{key}: esperado texto, recebido {value!r}")
+            return str(self.defaults.get(key, ''))
+        return value
+
+    def flag(self, key: str) -> bool:
+        value = self._get(key)
+        if not isinstance(value, bool):
+            self.errors.append(f"{self.path}.{key}: esperado true ou false, recebido {value!r}")
+            return bool(self.defaults.get(key, False))
+        return value
+
+    def choice(self, key: str, options: Tuple[str, ...]) -> str:
+        value = self._get(key)
+        if value not in options:
+            self.errors.append(f"{self.path}.{key}: esperado um de {', '.join(options)}, recebido {value!r}")
+            return self.defaults.get(key, options[0])
+        return value
+
+    def section(self, key: str) -> '_Reader':
+        return _Reader(self.data.get(key), f"{self.path}.{key}", self.defaults.get(key, {}), self.errors)
+
+    def entries(self, key: str, defaults: Dict) -> List['_Reader']:
+        """Lista não vazia de mapeamentos, cada um lido com os mesmos defaults"""
+        value = self._get(key)
+        if not isinstance(value, list) or not value:
+            self.errors.append(f"{self.path}.{key}: esperada lista não vazia, recebido {value!r}")
+            value = self.defaults.get(key, [])
+        return [_Reader(entry, f"{self.path}.{key}[{index}]", defaults, self.errors)
+                for index, entry in enumerate(value)]
+
+
+def _raise_if(errors: List[str]):
+    if errors:
+        raise ConfigError(errors)
+
+
+class _Section:
+    """Base das seções: dataclasses congeladas com __slots__ que ainda podem
+    ser copiadas e enviadas via pickle"""
+    __slots__ = ()
+
+    def __reduce__(self):
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+
+@dataclass(frozen=True)
+class GameSettings(_Section):
+    __slots__ = ('window_width', 'window_height', 'fps', 'survival_time', 'pipeline')
+    window_width: int
+    window_height: int
+    fps: int
+    survival_time: float
+    # Simulação do próximo quadro numa thread enquanto o atual é desenhado (render_snapshot.py)
+    pipeline: bool
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'GameSettings':
+        return cls(r.number('window_width', 1, True), r.number('window_height', 1, True),
+                   r.number('fps', 1, True), r.number('survival_time', 0, strict=True), r.flag('pipeline'))
+
+
+@dataclass(frozen=True)
+class PlayerConfig(_Section):
+    __slots__ = ('size', 'speed', 'max_health', 'color')
+    size: int
+    speed: float
+    max_health: int
+    color: Color
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'PlayerConfig':
+        return cls(r.number('size', 1, True), r.number('speed'),
+                   r.number('max_health', 1, True), r.color('color'))
+
+    @classmethod
+    def coerce(cls, config) -> 'PlayerConfig':
+        if isinstance(config, cls):
+            return config
+        errors: List[str] = []
+        result = cls.read(_Reader(config, 'player', DEFAULTS['player'], errors))
+        _raise_if(errors)
+        return result
+
+
+@dataclass(frozen=True)
+class EnemyConfig(_Section):
+    __slots__ = ('size', 'speed', 'health', 'damage', 'damage_interval', 'color', 'separation_radius',
+                 'separation_strength', 'separation_neighbors')
+    size: int
+    speed: float
+    health: int
+    damage: int
+    damage_interval: float
+    color: Color
+    # Inimigos a menos de separation_radius se afastam (0 desliga), até
+    # separation_strength pixels/s, olhando no máximo separation_neighbors vizinhos
+    separation_radius: float
+    separation_strength: float
+    separation_neighbors: int
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'EnemyConfig':
+        return cls(r.number('size', 1, True), r.number('speed'), r.number('health', 1, True),
+                   r.number('damage', 0, True), r.number('damage_interval'), r.color('color'),
+                   r.number('separation_radius'), r.number('separation_strength'),
+                   r.number('separation_neighbors', 1, True))
+
+    @classmethod
+    def coerce(cls, config) -> 'EnemyConfig':
+        if isinstance(config, cls):
+            return config
+        errors: List[str] = []
+        result = cls.read(_Reader(config, 'enemy', DEFAULTS['enemy'], errors))
+        _raise_if(errors)
+        return result
+
+
+@dataclass(frozen=True)
+class ItemConfig(_Section):
+    __slots__ = ('size', 'color', 'symbol', 'heal_amount', 'damage', 'radius')
+    size: int
+    color: Color
+    symbol: str
+    heal_amount: int
+    damage: int
+    radius: float
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'ItemConfig':
+        return cls(r.number('size', 1, True), r.color('color'), r.text('symbol'),
+                   r.number('heal_amount', 0, True), r.number('damage', 0, True), r.number('radius'))
+
+    @classmethod
+    def coerce(cls, config, item_type: str = 'health') -> 'ItemConfig':
+        if isinstance(config, cls):
+            return config
+        errors: List[str] = []
+        defaults = DEFAULTS['items'].get(item_type, DEFAULTS['items']['health'])
+        result = cls.read(_Reader(config, f'items.{item_type}', defaults, errors))
+        _raise_if(errors)
+        return result
+
+
+@dataclass(frozen=True)
+class ItemsConfig(_Section):
+    __slots__ = ('health', 'ammo')
+    health: ItemConfig
+    ammo: ItemConfig
+
+    def get(self, item_type: str) -> ItemConfig:
+        return getattr(self, item_type)
+
+
+@dataclass(frozen=True)
+class WorldConfig(_Section):
+    __slots__ = ('grid_size', 'area_size', 'activation_distance', 'max_active_areas', 'backend',
+                 'max_loaded_areas', 'lod_radius', 'lod_tick_interval', 'walls', 'tile_size', 'memory_budget_mb')
+    grid_size: int
+    area_size: int
+    activation_distance: float
+    max_active_areas: int
+    # 'static' (world.World) ou 'dynamic' (dynamic_world.DynamicAreaManager)
+    backend: str
+    # Só usado pelo backend dinâmico
+    max_loaded_areas: int
+    # Áreas inativas a até lod_radius células do jogador rodam o modelo agregado
+    # (0 desliga), avançando a cada lod_tick_interval segundos
+    lod_radius: int
+    lod_tick_interval: float
+    # Borda de parede em cada área, com uma passagem no meio de cada lado;
+    # com paredes area_size precisa ser múltiplo de tile_size
+    walls: bool
+    tile_size: int
+    # Limite de memória estimada das áreas carregadas no backend dinâmico (0 = sem limite)
+    memory_budget_mb: float
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'WorldConfig':
+        world = cls(r.number('grid_size', 1, True), r.number('area_size', 1, True),
+                    r.number('activation_distance'), r.number('max_active_areas', 1, True),
+                    r.choice('backend', ('static', 'dynamic')), r.number('max_loaded_areas', 1, True),
+                    r.number('lod_radius', 0, True), r.number('lod_tick_interval', 0, strict=True),
+                    r.flag('walls'), r.number('tile_size', 1, True), r.number('memory_budget_mb'))
+        if world.walls and world.tile_size > 0 and world.area_size % world.tile_size:
+            r.errors.append(f"{r.path}.tile_size: com paredes deve dividir area_size ({world.area_size}), "
+                            f"recebido {world.tile_size}")
+        return world
+
+
+@dataclass(frozen=True)
+class SpawnConfig(_Section):
+    __slots__ = ('enemies_per_area', 'health_items_per_area', 'ammo_items_per_area')
+    enemies_per_area: int
+    health_items_per_area: int
+    ammo_items_per_area: int
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'SpawnConfig':
+        return cls(r.number('enemies_per_area', 0, True), r.number('health_items_per_area', 0, True),
+                   r.number('ammo_items_per_area', 0, True))
+
+
+@dataclass(frozen=True)
+class SimulationConfig(_Section):
+    __slots__ = ('update_budget_ms', 'max_lag', 'steering_interval', 'workers', 'pursuit', 'flow_cell_size',
+                 'separation_budget', 'gc', 'tick_rate', 'max_steps')
+    # Orçamento por quadro para as áreas fora da tela (0 = sem limite, determinístico)
+    update_budget_ms: float
+    # Atraso máximo de uma área adiada antes de ser atualizada mesmo sem orçamento
+    max_lag: float
+    # A cada quantas atualizações cada inimigo recalcula a direção
+    steering_interval: int
+    # Processos que atualizam as áreas ativas em paralelo (0 = no processo principal)
+    workers: int
+    # 'direct': cada inimigo segue em linha reta; 'flow': consulta o campo de
+    # direções (flow_field.py), que contorna paredes
+    pursuit: str
+    flow_cell_size: int
+    # Máximo de inimigos separados por quadro, em rodízio (0 = todos)
+    separation_budget: int
+    # 'managed': coleta de lixo só entre quadros (gc_control.py); 'auto': a do Python
+    gc: str
+    # Passos fixos de simulação por segundo (0 = um passo por quadro com o dt do quadro)
+    # e máximo de passos por quadro para alcançar o tempo real
+    tick_rate: float
+    max_steps: int
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'SimulationConfig':
+        return cls(r.number('update_budget_ms'), r.number('max_lag', 0, strict=True),
+                   r.number('steering_interval', 1, True), r.number('workers', 0, True),
+                   r.choice('pursuit', ('direct', 'flow')), r.number('flow_cell_size', 1, True),
+                   r.number('separation_budget', 0, True), r.choice('gc', ('auto', 'managed')),
+                   r.number('tick_rate'), r.number('max_steps', 1, True))
+
+
+@dataclass(frozen=True)
+class QualityLevel(_Section):
+    __slots__ = ('name', 'health_bars', 'detail', 'render_scale', 'ai_interval')
+    name: str
+    health_bars: bool
+    # Símbolos dos itens, borda das paredes e marcas das áreas carregadas
+    detail: bool
+    # Fração da resolução da janela em que o mundo é desenhado antes de ser ampliado
+    render_scale: float
+    # Multiplica simulation.steering_interval
+    ai_interval: int
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'QualityLevel':
+        level = cls(r.text('name'), r.flag('health_bars'), r.flag('detail'),
+                    r.number('render_scale', 0, strict=True), r.number('ai_interval', 1, True))
+        if level.render_scale > 1:
+            r.errors.append(f"{r.path}.render_scale: deve ser no máximo 1, recebido {level.render_scale!r}")
+        return level
+
+    @property
+    def full(self) -> bool:
+        """Desenho completo, pelo caminho normal de Game.draw"""
+        return self.health_bars and self.detail and self.render_scale == 1
+
+
+@dataclass(frozen=True)
+class QualityConfig(_Section):
+    __slots__ = ('adaptive', 'target_fps', 'levels')
+    # Desce e sobe pelos níveis para manter o tempo de quadro de target_fps (quality.py)
+    adaptive: bool
+    # 0 = game.fps
+    target_fps: float
+    # Do mais completo ao mais leve; o jogo começa no primeiro
+    levels: Tuple[QualityLevel, ...]
+
+    @classmethod
+    def read(cls, r: _Reader) -> 'QualityConfig':
+        return cls(r.flag('adaptive'), r.number('target_fps'),
+                   tuple(QualityLevel.read(level) for level in r.entries('levels', QUALITY_LEVEL_DEFAULTS)))
+
+
+@dataclass(frozen=True)
+class GameConfig(_Section):
+    """Configuração validada e imutável, compartilhada por Game, World e entidades"""
+    __slots__ = ('game', 'player', 'enemy', 'items', 'world', 'spawn', 'simulation', 'quality', 'extra')
+    game: GameSettings
+    player: PlayerConfig
+    enemy: EnemyConfig
+    items: ItemsConfig
+    world: WorldConfig
+    spawn: SpawnConfig
+    simulation: SimulationConfig
+    quality: QualityConfig
+    # Seções desconhecidas, preservadas para salvar o arquivo de volta
+    extra: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, data: Dict, source: str = None) -> 'GameConfig':
+        errors: List[str] = []
+        if data is None:
+            data = {}
+        if not isinstance(data, dict):
+            raise ConfigError(["a raiz deve ser um mapeamento"], source)
+
+        def section(name: str) -> _Reader:
+            return _Reader(data.get(name), name, DEFAULTS[name], errors)
+
+        items = section('items')
+        config = cls(
+            game=GameSettings.read(section('game')),
+            player=PlayerConfig.read(section('player')),
+            enemy=EnemyConfig.read(section('enemy')),
+            items=ItemsConfig(ItemConfig.read(items.section('health')), ItemConfig.read(items.section('ammo'))),
+            world=WorldConfig.read(section('world')),
+            spawn=SpawnConfig.read(section('spawn')),
+            simulation=SimulationConfig.read(section('simulation')),
+            quality=QualityConfig.read(section('quality')),
+            extra={key: copy.deepcopy(value) for key, value in data.items() if key not in DEFAULTS}
+        )
+        if errors:
+            raise ConfigError(errors, source)
+        return config
+
+    @classmethod
+    def coerce(cls, config) -> 'GameConfig':
+        """Aceita um GameConfig pronto ou um dicionário no formato do config.yaml"""
+        if isinstance(config, cls):
+            return config
+        return cls.from_dict(config)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def section(value) -> Dict[str, Any]:
+            result = {}
+            for name in value.__slots__:
+                field = getattr(value, name)
+                if hasattr(field, '__slots__'):
+                    field = section(field)
+                elif isinstance(field, tuple):
+                    field = [section(entry) if hasattr(entry, '__slots__') else entry for entry in field]
+                result[name] = field
+            return result
+
+        data = section(self)
+        data.pop('extra')
+        data.update(copy.deepcopy(self.extra))
+        return data
+
+
+_cache: Dict[str, Tuple[int, int, GameConfig]] = {}
+
+
+def load_config(path: str = 'config.yaml') -> GameConfig:
+    """Carrega e valida um arquivo de configuração, reaproveitando o resultado
+    enquanto o arquivo não muda (mesmo mtime e tamanho)"""
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    cached = _cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    with open(key, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    config = GameConfig.from_dict(data, source=path)
+    _cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
+def clear_config_cache():
+    _cache.clear()
+
+
+def merge_config(base: Dict, overrides: Optional[Dict]) -> Dict:
+    """Aplica as seções parciais de um cenário sobre uma configuração completa"""
+    result = copy.deepcopy(base)
+
+    def deep_update(base_dict, update_dict):
+        for key, value in update_dict.items():
+            if isinstance(value, dict) and isinstance(base_dict.get(key), dict):
+                deep_update(base_dict[key], value)
+            else:
+                base_dict[key] = copy.deepcopy(value)
+
+    deep_update(result, overrides or {})
+    return result
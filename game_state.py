@@ -2,8 +2,9 @@ import json
 import yaml
 import random
 import pygame
-from typing import Dict, List, Any
-from entities import Player, Enemy, Item
+from typing import Dict, List, Any, Union
+from game_config import GameConfig
+from state_stream import iter_save_records, write_binary_save
 
 class GameState:
     def __init__(self):
@@ -34,6 +35,9 @@ class GameState:
         with open(filename, 'w', encoding='utf-8') as f:
             yaml.dump(state, f, default_flow_style=False, allow_unicode=True)
     
+    def save_to_binary(self, filename: str):
+        write_binary_save(filename, self.metadata, self.player_data, self.areas_data, self.game_config)
+    
     def load_from_json(self, filename: str):
         with open(filename, 'r', encoding='utf-8') as f:
             state = json.load(f)
@@ -51,21 +55,41 @@ class GameState:
         self.player_data = state.get('player', {})
         self.areas_data = state.get('areas', [])
         self.game_config = state.get('config', {})
+    
+    def load_from_binary(self, filename: str):
+        self.areas_data = []
+        for kind, data in iter_save_records(filename):
+            if kind == 'metadata':
+                self.metadata = data
+            elif kind == 'player':
+                self.player_data = data
+            elif kind == 'config':
+                self.game_config = data
+            elif kind == 'area':
+                area = {key: value for key, value in data.items() if key != 'index'}
+                area['enemies'] = []
+                area['items'] = []
+                self.areas_data.append(area)
+            elif kind == 'enemy':
+                self.areas_data[-1]['enemies'].append(data)
+            elif kind == 'item':
+                self.areas_data[-1]['items'].append(data)
 
 class GameStateManager:
-    def __init__(self, world, player, config):
+    def __init__(self, world, player, config: Union[GameConfig, Dict]):
         self.world = world
         self.player = player
-        self.config = config
+        self.config = GameConfig.coerce(config)
     
     def capture_current_state(self) -> GameState:
         state = GameState()
+        state.areas_data = self.world.snapshot()
         
         state.metadata = {
             'timestamp': pygame.time.get_ticks() / 1000.0,
             'active_areas_count': len(self.world.active_areas),
-            'total_enemies': sum(len(area.enemies) for area in self.world.areas),
-            'total_items': sum(len(area.items) for area in self.world.areas)
+            'total_enemies': sum(len(area['enemies']) for area in state.areas_data),
+            'total_items': sum(len(area['items']) for area in state.areas_data)
         }
         
         state.player_data = {
@@ -77,37 +101,7 @@ class GameStateManager:
             'ammo_items': self.player.ammo_items
         }
         
-        state.areas_data = []
-        for area in self.world.areas:
-            area_data = {
-                'grid_x': area.grid_x,
-                'grid_y': area.grid_y,
-                'active': area.active,
-                'enemies': [],
-                'items': []
-            }
-            
-            for enemy in area.enemies:
-                enemy_data = {
-                    'x': enemy.x,
-                    'y': enemy.y,
-                    'health': enemy.health,
-                    'max_health': enemy.max_health
-                }
-                area_data['enemies'].append(enemy_data)
-            
-            for item in area.items:
-                item_data = {
-                    'x': item.x,
-                    'y': item.y,
-                    'item_type': item.item_type,
-                    'symbol': item.symbol
-                }
-                area_data['items'].append(item_data)
-            
-            state.areas_data.append(area_data)
-        
-        state.game_config = self.config.copy()
+        state.game_config = self.config.to_dict()
         
         return state
     
@@ -119,26 +113,7 @@ class GameStateManager:
         self.player.health_items = state.player_data['health_items']
         self.player.ammo_items = state.player_data['ammo_items']
         
-        for i, area_data in enumerate(state.areas_data):
-            if i < len(self.world.areas):
-                area = self.world.areas[i]
-                area.active = area_data['active']
-                
-                area.enemies.clear()
-                for enemy_data in area_data['enemies']:
-                    enemy = Enemy(enemy_data['x'], enemy_data['y'], self.config['enemy'])
-                    enemy.health = enemy_data['health']
-                    enemy.max_health = enemy_data['max_health']
-                    area.enemies.append(enemy)
-                
-                area.items.clear()
-                for item_data in area_data['items']:
-                    item_config = self.config['items'][item_data['item_type']]
-                    item = Item(item_data['x'], item_data['y'], item_data['item_type'], item_config)
-                    item.symbol = item_data['symbol']
-                    area.items.append(item)
-        
-        self.world.active_areas = [area for area in self.world.areas if area.active]
+        self.world.restore(state.areas_data)
 
 def create_preset_scenario(scenario_name: str) -> Dict:
     presets = {
@@ -159,7 +134,7 @@ def create_preset_scenario(scenario_name: str) -> Dict:
         'nightmare': {
             'world': {'area_size': 600, 'activation_distance': 120, 'max_active_areas': 6},
             'spawn': {'enemies_per_area': 25, 'health_items_per_area': 1, 'ammo_items_per_area': 1},
-            'enemy': {'speed': 150, 'damage': 25, 'health': 40},
+            'enemy': {'speed': 150, 'damage': 25, 'health': 40, 'separation_radius': 30},
             'player': {'speed': 250, 'max_health': 80},
             'items': {'ammo': {'damage': 50, 'radius': 150}},
             'game': {'survival_time': 120}
@@ -177,7 +152,8 @@ def create_preset_scenario(scenario_name: str) -> Dict:
             'enemy': {'speed': 80, 'damage': 5, 'health': 20},
             'player': {'speed': 400, 'max_health': 200},
             'items': {'ammo': {'damage': 100, 'radius': 200}},
-            'game': {'survival_time': 30, 'fps': 30}
+            'game': {'survival_time': 30, 'fps': 30},
+            'simulation': {'update_budget_ms': 6}
         }
     }
     
@@ -0,0 +1,166 @@
+import gc
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class GCMonitor:
+    """Mede as pausas do coletor de ciclos (gc.callbacks) e as atribui ao
+    quadro em que aconteceram.
+
+    timeline guarda os últimos quadros como (duração do quadro, tempo de GC
+    dentro do quadro, coletas dentro do quadro), em milissegundos. Coletas
+    entre end_frame e o próximo begin_frame (na fronteira do quadro ou na
+    pausa) contam à parte, em boundary_ms.
+    """
+
+    def __init__(self, history: int = 600):
+        self.timeline: Deque[Tuple[float, float, int]] = deque(maxlen=history)
+        self.in_frame = False
+        self.frame_start = 0.0
+        # (geração, duração em ms) das coletas do quadro atual
+        self.frame_pauses: List[Tuple[int, float]] = []
+        self.pauses = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.boundary_ms = 0.0
+        self._started: Optional[float] = None
+        self.installed = False
+
+    def install(self):
+        if not self.installed:
+            gc.callbacks.append(self._callback)
+            self.installed = True
+
+    def uninstall(self):
+        if self.installed:
+            gc.callbacks.remove(self._callback)
+            self.installed = False
+
+    def _callback(self, phase: str, info: Dict):
+        if phase == 'start':
+            self._started = time.perf_counter()
+            return
+        if self._started is None:
+            return
+        duration = (time.perf_counter() - self._started) * 1000.0
+        self._started = None
+        self.pauses += 1
+        self.total_ms += duration
+        self.max_ms = max(self.max_ms, duration)
+        if self.in_frame:
+            self.frame_pauses.append((info.get('generation', 0), duration))
+        else:
+            self.boundary_ms += duration
+
+    def begin_frame(self):
+        self.in_frame = True
+        self.frame_pauses = []
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self) -> Tuple[float, float, int]:
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000.0
+        self.in_frame = False
+        sample = (frame_ms, sum(duration for _, duration in self.frame_pauses), len(self.frame_pauses))
+        self.timeline.append(sample)
+        return sample
+
+    def summary(self) -> Dict:
+        frames_with_gc = [sample for sample in self.timeline if sample[2]]
+        return {
+            'gc_pauses': self.pauses,
+            'gc_ms_total': self.total_ms,
+            'gc_ms_max': self.max_ms,
+            'gc_ms_boundary': self.boundary_ms,
+            'gc_frames': len(frames_with_gc),
+            'gc_frame_ms_max': max((sample[1] for sample in frames_with_gc), default=0.0)
+        }
+
+
+class GCController:
+    """Modo de coleta durante a partida (simulation.gc).
+
+    'auto' deixa o coletor do Python como está e só mede as pausas.
+    'managed' desliga a coleta automática enquanto o jogo roda: depois que
+    o mundo termina de ser gerado os objetos vivos vão para a geração
+    permanente (gc.freeze), e as coletas acontecem só em end_frame, depois
+    de desenhar o quadro, seguindo os mesmos limiares do coletor automático.
+    Em pausa ou fim de jogo uma coleta completa é feita uma vez.
+    """
+
+    def __init__(self, mode: str = 'managed', monitor: GCMonitor = None):
+        self.mode = mode
+        self.monitor = monitor or GCMonitor()
+        self.frozen = False
+        self.idle = False
+        self.was_enabled = True
+        self.running = False
+
+    @property
+    def managed(self) -> bool:
+        return self.mode == 'managed'
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.monitor.install()
+        if self.managed:
+            self.was_enabled = gc.isenabled()
+            gc.disable()
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self.monitor.uninstall()
+        if self.managed:
+            self.unfreeze()
+            if self.was_enabled:
+                gc.enable()
+
+    def world_ready(self):
+        """Chamado quando o mundo termina de ser gerado"""
+        if self.managed and self.running and not self.frozen:
+            gc.collect()
+            gc.freeze()
+            self.frozen = True
+
+    def unfreeze(self):
+        """Devolve os objetos congelados ao coletor (ex.: o mundo antigo no reinício)"""
+        if self.frozen:
+            gc.unfreeze()
+            self.frozen = False
+
+    def begin_frame(self):
+        self.monitor.begin_frame()
+
+    def end_frame(self, idle: bool = False) -> Tuple[float, float, int]:
+        sample = self.monitor.end_frame()
+        if self.managed and self.running:
+            self.collect(idle)
+        return sample
+
+    def collect(self, idle: bool = False):
+        if idle:
+            if not self.idle:
+                gc.collect()
+            self.idle = True
+            return
+        self.idle = False
+        generation = due_generation()
+        if generation is not None:
+            gc.collect(generation)
+
+
+def due_generation() -> Optional[int]:
+    """A geração mais velha que o coletor automático teria coletado agora"""
+    counts = gc.get_count()
+    thresholds = gc.get_threshold()
+    due = None
+    for generation in range(min(len(counts), len(thresholds))):
+        if thresholds[generation] and counts[generation] >= thresholds[generation]:
+            due = generation
+        else:
+            break
+    return due
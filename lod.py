@@ -0,0 +1,107 @@
+import math
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+# Quanto o grupo se adensa por segundo enquanto persegue o jogador, e o
+# quanto ele pode se contrair em relação à distribuição original
+DENSITY_DRIFT = 0.2
+MIN_SCALE = 0.3
+# Distância mínima entre o centróide e a borda da área
+EDGE_MARGIN = 20
+
+
+class AreaAggregate:
+    """Modelo grosseiro dos inimigos de uma área inativa próxima.
+
+    Guarda só o centróide, o deslocamento de cada inimigo em relação a ele e
+    uma escala de densidade. A cada passo o centróide anda em direção ao
+    jogador (sem sair da área) e o grupo se contrai; ao promover a área, as
+    posições concretas são reconstruídas a partir desse estado.
+    """
+
+    __slots__ = ('cx', 'cy', 'offsets', 'scale', 'bounds', 'limits', 'pending')
+
+    def __init__(self, cx: float, cy: float, offsets: List[Tuple[float, float]],
+                 bounds: Tuple[float, float, float, float],
+                 limits: Optional[Tuple[float, float, float, float]] = None):
+        self.cx = cx
+        self.cy = cy
+        self.offsets = offsets
+        self.scale = 1.0
+        self.bounds = bounds
+        # Retângulo em que cada inimigo materializado precisa caber (fora das paredes)
+        self.limits = limits
+        # dt acumulado desde o último passo (o modelo roda em taxa reduzida)
+        self.pending = 0.0
+
+    @classmethod
+    def from_positions(cls, positions: Sequence[Tuple[float, float]], x: float, y: float,
+                       size: float, margin: float = 0.0) -> 'AreaAggregate':
+        """margin > 0 prende as posições materializadas a essa distância da borda"""
+        bounds = (x + EDGE_MARGIN, y + EDGE_MARGIN, x + size - EDGE_MARGIN, y + size - EDGE_MARGIN)
+        limits = (x + margin, y + margin, x + size - margin, y + size - margin) if margin > 0 else None
+        if not positions:
+            return cls(x + size / 2, y + size / 2, [], bounds, limits)
+        cx = sum(p[0] for p in positions) / len(positions)
+        cy = sum(p[1] for p in positions) / len(positions)
+        return cls(cx, cy, [(px - cx, py - cy) for px, py in positions], bounds, limits)
+
+    @property
+    def count(self) -> int:
+        return len(self.offsets)
+
+    def tick(self, target_x: float, target_y: float, speed: float, dt: float, interval: float):
+        """Acumula dt e avança o modelo quando completa um intervalo"""
+        self.pending += dt
+        if self.pending >= interval:
+            self.advance(target_x, target_y, speed, self.pending)
+            self.pending = 0.0
+
+    def advance(self, target_x: float, target_y: float, speed: float, dt: float):
+        if not self.offsets:
+            return
+        dx = target_x - self.cx
+        dy = target_y - self.cy
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance > 0:
+            step = min(distance, speed * dt)
+            self.cx += dx / distance * step
+            self.cy += dy / distance * step
+
+        left, top, right, bottom = self.bounds
+        self.cx = min(max(self.cx, left), right)
+        self.cy = min(max(self.cy, top), bottom)
+        self.scale = max(MIN_SCALE, self.scale * (1.0 - DENSITY_DRIFT * dt))
+
+    def positions(self) -> Iterator[Tuple[float, float]]:
+        if self.limits is None:
+            for ox, oy in self.offsets:
+                yield self.cx + ox * self.scale, self.cy + oy * self.scale
+            return
+        left, top, right, bottom = self.limits
+        for ox, oy in self.offsets:
+            yield (min(max(self.cx + ox * self.scale, left), right),
+                   min(max(self.cy + oy * self.scale, top), bottom))
+
+    def apply(self, enemies) -> None:
+        """Materializa as posições nos inimigos concretos (mesma ordem); a
+        posição anterior acompanha, para a interpolação não partir da antiga"""
+        for enemy, (x, y) in zip(enemies, self.positions()):
+            enemy.x = x
+            enemy.y = y
+            enemy.save_previous()
+            enemy.steered = False
+
+    def apply_to_data(self, enemies_data: List[dict]) -> None:
+        for enemy_data, (x, y) in zip(enemies_data, self.positions()):
+            enemy_data['x'] = x
+            enemy_data['y'] = y
+
+
+def lod_neighbours(get_area: Callable[[int, int], Optional[object]], grid_x: int, grid_y: int,
+                   radius: int) -> Iterator:
+    """Áreas a até radius células (Chebyshev) da área do jogador, linha a linha"""
+    for y in range(grid_y - radius, grid_y + radius + 1):
+        for x in range(grid_x - radius, grid_x + radius + 1):
+            area = get_area(x, y)
+            if area is not None:
+                yield area
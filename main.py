@@ -1,42 +1,84 @@
 #!/usr/bin/env python3
-import pygame
 import sys
 import os
-import yaml
-from game import Game
-from menu import MainMenu
-from game_state import create_preset_scenario, generate_random_scenario
+from startup_timing import StartupTimer
+
+# Módulos do jogo (mundo, entidades, estados, yaml) só são importados quando
+# uma partida começa; o menu sobe apenas com pygame e menu.py
+
+# Sem eventos nem nada a redesenhar, o menu acorda ao menos a cada MENU_IDLE_MS
+MENU_IDLE_MS = 500
 
 def main():
-    pygame.init()
+    timer = StartupTimer()
+    startup_report = '--startup-report' in sys.argv
+    record_path = None
+    if '--record' in sys.argv:
+        index = sys.argv.index('--record')
+        if index + 1 >= len(sys.argv):
+            print("❌ Especifique o arquivo de gravação: --record partida.rec")
+            return 1
+        record_path = sys.argv[index + 1]
     
-    screen_width = 1200
-    screen_height = 800
-    screen = pygame.display.set_mode((screen_width, screen_height))
-    pygame.display.set_caption("Binding of Pysaac - Menu Principal")
+    with timer.measure('menu_imports'):
+        import pygame
+        from menu import MainMenu
     
-    clock = pygame.time.Clock()
-    menu = MainMenu(screen_width, screen_height)
+    with timer.measure('menu_init'):
+        pygame.init()
+        
+        screen_width = 1200
+        screen_height = 800
+        screen = pygame.display.set_mode((screen_width, screen_height))
+        pygame.display.set_caption("Binding of Pysaac - Menu Principal")
+        
+        clock = pygame.time.Clock()
+        menu = MainMenu(screen_width, screen_height)
     game = None
+    # Cenário escolhido no menu; None usa o config.yaml
+    active_config = None
     
     running = True
     
     while running:
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if not events and not menu.needs_redraw:
+            # Menu parado: dorme até o próximo evento em vez de redesenhar a 60 FPS
+            event = pygame.event.wait(MENU_IDLE_MS)
+            if event.type != pygame.NOEVENT:
+                events = [event]
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                menu.invalidate()
             
             action = menu.handle_event(event)
             
             if action == "start_game":
                 try:
-                    game = Game()
+                    # Só a primeira partida é medida desde main.main; as demais, do clique
+                    if timer.get('first_frame'):
+                        timer = StartupTimer()
+                    with timer.measure('game_imports'):
+                        from game import Game
+                    game_config = active_config
+                    if record_path:
+                        game_config = replayable_config(active_config)
+                    game = Game(config=game_config, timer=timer)
+                    game.print_startup_report = startup_report
+                    if record_path:
+                        from replay import InputRecorder
+                        game.recorder = InputRecorder(record_path, game.seed, game.config)
+                        print(f"🎥 Gravando entrada em: {record_path}")
                     result = game.run()
+                    menu.invalidate()
                     if result == "main_menu":
                         continue
                     elif result == "quit":
                         running = False
                 except Exception as e:
+                    menu.invalidate()
                     print(f"Erro ao executar o jogo: {e}")
             
             elif action == "save_config":
@@ -45,20 +87,38 @@ def main():
             
             elif action.startswith("load_scenario_"):
                 scenario_name = action.replace("load_scenario_", "")
-                load_scenario(scenario_name)
-                print(f"✅ Cenário '{scenario_name}' carregado!")
+                scenario_config = load_scenario(scenario_name)
+                if scenario_config:
+                    active_config = scenario_config
+                    print(f"✅ Cenário '{scenario_name}' carregado!")
             
             elif action == "quit":
                 running = False
         
-        menu.draw(screen)
-        pygame.display.flip()
+        if menu.needs_redraw:
+            menu.draw(screen)
+            pygame.display.flip()
+            if not timer.get('menu_frame'):
+                timer.mark('menu_frame')
         clock.tick(60)
     
     pygame.quit()
     return 0
 
+def replayable_config(config):
+    """O orçamento de atualização e a qualidade adaptativa dependem do relógio
+    real; gravações rodam sem eles para que o replay chegue ao mesmo estado"""
+    import dataclasses
+    from game_config import load_config
+    
+    config = config or load_config('config.yaml')
+    simulation = dataclasses.replace(config.simulation, update_budget_ms=0)
+    quality = dataclasses.replace(config.quality, adaptive=False)
+    return dataclasses.replace(config, simulation=simulation, quality=quality)
+
 def save_custom_config(config_values):
+    import yaml
+    
     custom_config = {
         'game': {
             'window_width': 1200,
@@ -112,6 +172,10 @@ def save_custom_config(config_values):
         yaml.dump(custom_config, f, default_flow_style=False, allow_unicode=True)
 
 def load_scenario(scenario_name):
+    import yaml
+    from game_state import create_preset_scenario, generate_random_scenario
+    from game_config import ConfigError, GameConfig, load_config, merge_config
+    
     if scenario_name == 'random':
         config = generate_random_scenario()
     else:
@@ -119,26 +183,28 @@ def load_scenario(scenario_name):
     
     if not config:
         print(f"❌ Cenário '{scenario_name}' não encontrado")
-        return
-    
-    with open('config.yaml', 'r', encoding='utf-8') as f:
-        base_config = yaml.safe_load(f)
-    
-    def deep_update(base_dict, update_dict):
-        for key, value in update_dict.items():
-            if isinstance(value, dict) and key in base_dict:
-                deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
-    
-    deep_update(base_config, config)
+        return None
     
     scenario_file = f'config_{scenario_name}.yaml'
-    with open(scenario_file, 'w', encoding='utf-8') as f:
-        yaml.dump(base_config, f, default_flow_style=False, allow_unicode=True)
+    try:
+        merged = merge_config(load_config('config.yaml').to_dict(), config)
+        scenario_config = GameConfig.from_dict(merged, source=scenario_file)
+    except ConfigError as e:
+        print(f"❌ {e}")
+        return None
+    
+    # O config.yaml não é mais sobrescrito: o cenário fica só em memória e no
+    # arquivo próprio, regravado apenas quando o conteúdo muda
+    content = yaml.dump(scenario_config.to_dict(), default_flow_style=False, allow_unicode=True)
+    previous = None
+    if os.path.exists(scenario_file):
+        with open(scenario_file, 'r', encoding='utf-8') as f:
+            previous = f.read()
+    if content != previous:
+        with open(scenario_file, 'w', encoding='utf-8') as f:
+            f.write(content)
     
-    with open('config.yaml', 'w', encoding='utf-8') as f:
-        yaml.dump(base_config, f, default_flow_style=False, allow_unicode=True)
+    return scenario_config
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
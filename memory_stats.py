@@ -0,0 +1,88 @@
+import glob
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import pygame
+
+MB = 1024 * 1024
+
+# Saves que o jogo escreve no diretório atual (F5) e os do state_viewer
+SAVE_PATTERNS = ('game_state_*.json', 'game_state_*.sav', 'saves/*.json', 'saves/*.sav')
+
+
+def object_bytes(obj) -> int:
+    """Tamanho do objeto e do dicionário de atributos, sem seguir referências"""
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, '__dict__', None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes)
+    return size
+
+
+def entities_bytes(entities: List) -> int:
+    """Estimativa de uma lista de entidades de um mesmo tipo: o tamanho da
+    primeira vale para todas, para a conta não percorrer milhares de objetos"""
+    size = sys.getsizeof(entities)
+    if entities:
+        size += len(entities) * object_bytes(entities[0])
+    return size
+
+
+def area_bytes(area) -> int:
+    """Memória de uma área carregada: entidades, bitmap de colisão e modelo agregado"""
+    size = entities_bytes(area.enemies) + entities_bytes(area.items)
+    if area.collision is not None:
+        size += sys.getsizeof(area.collision)
+    if area.aggregate is not None:
+        size += object_bytes(area.aggregate)
+    return size
+
+
+def surfaces_bytes(surfaces: Iterable[pygame.Surface]) -> int:
+    return sum(surface.get_bytesize() * surface.get_width() * surface.get_height() for surface in surfaces)
+
+
+def files_bytes(paths: Iterable[str]) -> int:
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def saves_bytes(patterns=SAVE_PATTERNS) -> int:
+    return files_bytes(path for pattern in patterns for path in glob.glob(pattern))
+
+
+def process_rss() -> Optional[int]:
+    """Memória residente do processo; None sem o psutil"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def format_bytes(size: Optional[float]) -> str:
+    if size is None:
+        return '?'
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def overlay_lines(report: Dict) -> List[str]:
+    """Linhas do overlay de memória (F3) a partir de Game.memory_report()"""
+    world = report['world']
+    lines = [f"RSS: {format_bytes(report['rss'])}"]
+    for name, size in report['subsystems'].items():
+        lines.append(f"{name}: {format_bytes(size)}")
+    lines.append(f"Áreas em memória: {len(world['area_bytes'])}")
+    if world['budget_bytes']:
+        lines.append(f"Orçamento: {format_bytes(world['world_bytes'])} / {format_bytes(world['budget_bytes'])}")
+    return lines
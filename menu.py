@@ -1,9 +1,11 @@
 import pygame
-import yaml
 import os
 from typing import List, Dict, Any
 
 class MenuButton:
+    """Botão em modo retido: cada estado (normal e em foco) é desenhado uma vez
+    numa superfície guardada, e dirty indica que o foco mudou desde o último draw"""
+    
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: tuple, hover_color: tuple, font_size: int = 36):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
@@ -13,36 +15,48 @@ class MenuButton:
         self.font = pygame.font.Font(None, font_size)
         self.shadow_offset = 3
         self.border_radius = 8
+        self.surfaces: Dict[bool, pygame.Surface] = {}
+        self.dirty = True
     
-    def draw(self, screen: pygame.Surface):
-        shadow_rect = pygame.Rect(
-            self.rect.x + self.shadow_offset,
-            self.rect.y + self.shadow_offset,
-            self.rect.width,
-            self.rect.height
-        )
-        pygame.draw.rect(screen, (0, 0, 0, 100), shadow_rect, border_radius=self.border_radius)
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Área da tela que o botão ocupa, com a sombra"""
+        return pygame.Rect(self.rect.x, self.rect.y, self.rect.width + self.shadow_offset,
+                           self.rect.height + self.shadow_offset)
+    
+    def render(self, hovered: bool) -> pygame.Surface:
+        surface = pygame.Surface(self.bounds.size, pygame.SRCALPHA)
+        rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        shadow_rect = rect.move(self.shadow_offset, self.shadow_offset)
+        pygame.draw.rect(surface, (0, 0, 0), shadow_rect, border_radius=self.border_radius)
         
-        color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=self.border_radius)
+        color = self.hover_color if hovered else self.color
+        pygame.draw.rect(surface, color, rect, border_radius=self.border_radius)
         
-        border_color = (255, 255, 255) if self.hovered else (200, 200, 200)
-        pygame.draw.rect(screen, border_color, self.rect, 3, border_radius=self.border_radius)
+        border_color = (255, 255, 255) if hovered else (200, 200, 200)
+        pygame.draw.rect(surface, border_color, rect, 3, border_radius=self.border_radius)
         
         text_surface = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=self.rect.center)
+        text_rect = text_surface.get_rect(center=rect.center)
         
         shadow_text = self.font.render(self.text, True, (0, 0, 0))
-        shadow_rect = text_rect.copy()
-        shadow_rect.x += 2
-        shadow_rect.y += 2
-        screen.blit(shadow_text, shadow_rect)
-        
-        screen.blit(text_surface, text_rect)
+        surface.blit(shadow_text, text_rect.move(2, 2))
+        surface.blit(text_surface, text_rect)
+        return surface
+    
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        surface = self.surfaces.get(self.hovered)
+        if surface is None:
+            surface = self.surfaces[self.hovered] = self.render(self.hovered)
+        self.dirty = False
+        return screen.blit(surface, self.rect.topleft)
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.dirty = True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 return True
@@ -53,12 +67,25 @@ class Slider:
         self.rect = pygame.Rect(x, y, width, height)
         self.min_val = min_val
         self.max_val = max_val
-        self.value = initial_val
+        self._value = initial_val
         self.label = label
         self.dragging = False
         self.font = pygame.font.Font(None, 24)
         self.label_font = pygame.font.Font(None, 28)
         self.border_radius = 6
+        # Texto do rótulo já renderizado: (texto, sombra, superfície)
+        self.label_cache = None
+        self.dirty = True
+    
+    @property
+    def value(self) -> float:
+        return self._value
+    
+    @value.setter
+    def value(self, value: float):
+        if value != self._value:
+            self._value = value
+            self.dirty = True
     
     def draw(self, screen: pygame.Surface):
         pygame.draw.rect(screen, (60, 60, 60), self.rect, border_radius=self.border_radius)
@@ -81,11 +108,13 @@ class Slider:
         pygame.draw.rect(screen, (200, 200, 200), slider_rect, 2, border_radius=4)
         
         label_text = f"{self.label}: {self.value:.0f}"
-        text_surface = self.label_font.render(label_text, True, (255, 255, 255))
-        
-        shadow_text = self.label_font.render(label_text, True, (0, 0, 0))
+        if self.label_cache is None or self.label_cache[0] != label_text:
+            self.label_cache = (label_text, self.label_font.render(label_text, True, (0, 0, 0)),
+                                self.label_font.render(label_text, True, (255, 255, 255)))
+        _, shadow_text, text_surface = self.label_cache
         screen.blit(shadow_text, (self.rect.x + 2, self.rect.y - 35))
         screen.blit(text_surface, (self.rect.x, self.rect.y - 33))
+        self.dirty = False
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -96,8 +125,8 @@ class Slider:
             self.dragging = False
         elif event.type == pygame.MOUSEMOTION and self.dragging:
             rel_x = event.pos[0] - self.rect.x
-            self.value = self.min_val + (rel_x / self.rect.width) * (self.max_val - self.min_val)
-            self.value = max(self.min_val, min(self.max_val, self.value))
+            value = self.min_val + (rel_x / self.rect.width) * (self.max_val - self.min_val)
+            self.value = max(self.min_val, min(self.max_val, value))
             return True
         return False
 
@@ -108,6 +137,10 @@ class MainMenu:
         self.current_screen = "main"
         self.font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 24)
+        # Fundo, padrão e títulos de cada tela, desenhados uma vez
+        self.backgrounds: Dict[str, pygame.Surface] = {}
+        self.descriptions: Dict[str, pygame.Surface] = {}
+        self.dirty = True
         
         self.setup_main_menu()
         self.setup_config_menu()
@@ -178,6 +211,30 @@ class MainMenu:
             MenuButton(80, 600, 200, 60, "⬅️ VOLTAR", (80, 80, 80), (120, 120, 120), 36)
         )
     
+    @property
+    def widgets(self) -> list:
+        """Botões e sliders da tela atual"""
+        if self.current_screen == "main":
+            return self.main_buttons
+        elif self.current_screen == "config":
+            return self.config_sliders + self.config_buttons
+        elif self.current_screen == "scenarios":
+            return self.scenario_buttons
+        return []
+    
+    @property
+    def needs_redraw(self) -> bool:
+        """Se algo mudou desde o último draw; sem isso o laço do menu só espera eventos"""
+        return self.dirty or any(widget.dirty for widget in self.widgets)
+    
+    def invalidate(self):
+        """Força o próximo draw (troca de tela, janela exposta, volta do jogo)"""
+        self.dirty = True
+    
+    def show_screen(self, name: str):
+        self.current_screen = name
+        self.invalidate()
+    
     def handle_event(self, event: pygame.event.Event) -> str:
         if self.current_screen == "main":
             return self.handle_main_menu(event)
@@ -193,9 +250,9 @@ class MainMenu:
                 if i == 0:
                     return "start_game"
                 elif i == 1:
-                    self.current_screen = "config"
+                    self.show_screen("config")
                 elif i == 2:
-                    self.current_screen = "scenarios"
+                    self.show_screen("scenarios")
                 elif i == 3:
                     return "quit"
         return "none"
@@ -211,14 +268,14 @@ class MainMenu:
                 elif button.text == "🔄 RESETAR":
                     self.reset_config_sliders()
                 elif button.text == "⬅️ VOLTAR":
-                    self.current_screen = "main"
+                    self.show_screen("main")
         return "none"
     
     def handle_scenarios_menu(self, event: pygame.event.Event) -> str:
         for button in self.scenario_buttons:
             if button.handle_event(event):
                 if button.text == "⬅️ VOLTAR":
-                    self.current_screen = "main"
+                    self.show_screen("main")
                 elif hasattr(button, 'scenario_key'):
                     return f"load_scenario_{button.scenario_key}"
         return "none"
@@ -249,13 +306,28 @@ class MainMenu:
             'player_max_health': int(self.config_sliders[9].value)
         }
     
-    def draw(self, screen: pygame.Surface):
-        screen.fill((15, 15, 25))
+    def render_background(self, name: str) -> pygame.Surface:
+        background = pygame.Surface((self.screen_width, self.screen_height))
+        background.fill((15, 15, 25))
         
         for y in range(0, self.screen_height, 40):
             for x in range(0, self.screen_width, 40):
                 if (x + y) % 80 == 0:
-                    pygame.draw.rect(screen, (25, 25, 35), (x, y, 20, 20))
+                    pygame.draw.rect(background, (25, 25, 35), (x, y, 20, 20))
+        
+        if name == "main":
+            self.draw_main_titles(background)
+        elif name == "config":
+            self.draw_config_titles(background)
+        elif name == "scenarios":
+            self.draw_scenarios_titles(background)
+        return background
+    
+    def draw(self, screen: pygame.Surface):
+        background = self.backgrounds.get(self.current_screen)
+        if background is None:
+            background = self.backgrounds[self.current_screen] = self.render_background(self.current_screen)
+        screen.blit(background, (0, 0))
         
         if self.current_screen == "main":
             self.draw_main_menu(screen)
@@ -263,8 +335,9 @@ class MainMenu:
             self.draw_config_menu(screen)
         elif self.current_screen == "scenarios":
             self.draw_scenarios_menu(screen)
+        self.dirty = False
     
-    def draw_main_menu(self, screen: pygame.Surface):
+    def draw_main_titles(self, screen: pygame.Surface):
         title_font = pygame.font.Font(None, 72)
         title = title_font.render("BINDING OF PYSAAC", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen_width//2, 120))
@@ -285,11 +358,12 @@ class MainMenu:
         shadow_sub_rect.y += 2
         screen.blit(shadow_subtitle, shadow_sub_rect)
         screen.blit(subtitle, subtitle_rect)
-        
+    
+    def draw_main_menu(self, screen: pygame.Surface):
         for button in self.main_buttons:
             button.draw(screen)
     
-    def draw_config_menu(self, screen: pygame.Surface):
+    def draw_config_titles(self, screen: pygame.Surface):
         title_font = pygame.font.Font(None, 56)
         title = title_font.render("⚙️ CONFIGURAÇÃO DE BALANCEAMENTO", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen_width//2, 80))
@@ -320,14 +394,15 @@ class MainMenu:
         shadow_player = section_font.render("👤 JOGADOR", True, (0, 0, 0))
         screen.blit(shadow_player, (player_rect.x + 2, player_rect.y + 2))
         screen.blit(player_title, player_rect)
-        
+    
+    def draw_config_menu(self, screen: pygame.Surface):
         for slider in self.config_sliders:
             slider.draw(screen)
         
         for button in self.config_buttons:
             button.draw(screen)
     
-    def draw_scenarios_menu(self, screen: pygame.Surface):
+    def draw_scenarios_titles(self, screen: pygame.Surface):
         title_font = pygame.font.Font(None, 56)
         title = title_font.render("📊 CENÁRIOS DE TESTE", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen_width//2, 80))
@@ -348,20 +423,26 @@ class MainMenu:
         shadow_sub_rect.y += 2
         screen.blit(shadow_subtitle, shadow_sub_rect)
         screen.blit(subtitle, subtitle_rect)
-        
+    
+    def render_description(self, description: str) -> pygame.Surface:
+        box = pygame.Surface((300, 50), pygame.SRCALPHA)
+        desc_bg = box.get_rect()
+        pygame.draw.rect(box, (20, 20, 30), desc_bg, border_radius=8)
+        pygame.draw.rect(box, (100, 100, 120), desc_bg, 2, border_radius=8)
+        
+        desc_text = self.small_font.render(description, True, (255, 255, 200))
+        desc_rect = desc_text.get_rect(center=desc_bg.center)
+        
+        shadow_desc = self.small_font.render(description, True, (0, 0, 0))
+        box.blit(shadow_desc, desc_rect.move(2, 2))
+        box.blit(desc_text, desc_rect)
+        return box
+    
+    def draw_scenarios_menu(self, screen: pygame.Surface):
         for button in self.scenario_buttons:
             button.draw(screen)
             if hasattr(button, 'description') and button.hovered:
-                desc_bg = pygame.Rect(620, button.rect.y - 5, 300, 50)
-                pygame.draw.rect(screen, (20, 20, 30), desc_bg, border_radius=8)
-                pygame.draw.rect(screen, (100, 100, 120), desc_bg, 2, border_radius=8)
-                
-                desc_text = self.small_font.render(button.description, True, (255, 255, 200))
-                desc_rect = desc_text.get_rect(center=desc_bg.center)
-                
-                shadow_desc = self.small_font.render(button.description, True, (0, 0, 0))
-                shadow_rect = desc_rect.copy()
-                shadow_rect.x += 2
-                shadow_rect.y += 2
-                screen.blit(shadow_desc, shadow_rect)
-                screen.blit(desc_text, desc_rect)
\ No newline at end of file
+                box = self.descriptions.get(button.description)
+                if box is None:
+                    box = self.descriptions[button.description] = self.render_description(button.description)
+                screen.blit(box, (620, button.rect.y - 5))
@@ -0,0 +1,79 @@
+import math
+from typing import Dict, Iterable, Tuple
+
+import pygame
+
+# (coluna, linha, ativa, em memória, inimigos) de cada área, de WorldBackend.area_states()
+AreaState = Tuple[int, int, bool, bool, int]
+
+MINIMAP_SIZE = 150
+DENSITY_LEVELS = 8
+BACKGROUND = (15, 15, 15)
+PLAYER_COLOR = (0, 255, 0)
+
+
+def density_color(level: int) -> Tuple[int, int, int]:
+    """Do cinza escuro (sem inimigos) ao vermelho (densidade máxima)"""
+    fraction = level / (DENSITY_LEVELS - 1)
+    return (int(35 + 220 * fraction), int(35 * (1 - fraction)), int(35 * (1 - fraction)))
+
+
+def outline_color(active: bool, loaded: bool) -> Tuple[int, int, int]:
+    if active:
+        return (200, 200, 200)
+    return (70, 120, 70) if loaded else (50, 50, 50)
+
+
+class Minimap:
+    """Malha inteira de áreas em uma superfície pequena, uma célula por área.
+
+    A superfície fica em cache e, a cada refresh quadros, só as células cuja
+    situação mudou (ativa, em memória ou faixa de densidade) são repintadas.
+    O custo por quadro depende do número de áreas, não do de inimigos: as
+    contagens vêm de len() das listas de cada área.
+    """
+
+    def __init__(self, grid_size: int, area_size: int, reference: int, size: int = MINIMAP_SIZE,
+                 refresh: int = 6):
+        self.grid_size = grid_size
+        self.area_size = area_size
+        # Inimigos por área que correspondem à densidade máxima
+        self.reference = max(1, reference)
+        self.cell = max(2, size // grid_size)
+        self.surface = pygame.Surface((self.cell * grid_size, self.cell * grid_size))
+        self.surface.fill(BACKGROUND)
+        self.refresh = refresh
+        self.frame = 0
+        self.states: Dict[Tuple[int, int], Tuple[bool, bool, int]] = {}
+        self.repainted = 0
+
+    def density(self, enemies: int) -> int:
+        return min(DENSITY_LEVELS - 1, math.ceil(enemies / self.reference * (DENSITY_LEVELS - 1)))
+
+    @property
+    def due(self) -> bool:
+        """O próximo update() repinta; fora disso não vale buscar area_states()"""
+        return self.frame % self.refresh == 0
+
+    def update(self, areas: Iterable[AreaState]) -> int:
+        """Repinta as células que mudaram; retorna quantas, 0 fora dos quadros de atualização"""
+        self.frame += 1
+        if (self.frame - 1) % self.refresh:
+            return 0
+        repainted = 0
+        for grid_x, grid_y, active, loaded, enemies in areas:
+            state = (active, loaded, self.density(enemies))
+            if self.states.get((grid_x, grid_y)) == state:
+                continue
+            self.states[(grid_x, grid_y)] = state
+            rect = pygame.Rect(grid_x * self.cell, grid_y * self.cell, self.cell, self.cell)
+            self.surface.fill(density_color(state[2]), rect)
+            pygame.draw.rect(self.surface, outline_color(active, loaded), rect, 1)
+            repainted += 1
+        self.repainted += repainted
+        return repainted
+
+    def draw(self, screen: pygame.Surface, x: int, y: int, player_x: float, player_y: float):
+        screen.blit(self.surface, (x, y))
+        scale = self.cell / self.area_size
+        pygame.draw.circle(screen, PLAYER_COLOR, (x + int(player_x * scale), y + int(player_y * scale)), 2)
@@ -0,0 +1,451 @@
+import atexit
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from entities import Enemy, Player
+from game_config import GameConfig
+from collision import resolve_boxes
+from pools import enemy_pool
+from scheduler import update_items
+
+# Colunas de cada inimigo no bloco compartilhado
+X, Y, HEALTH, MAX_HEALTH, COOLDOWN, DIR_X, DIR_Y, FLAGS = range(8)
+NUM_FIELDS = 8
+# Bits de FLAGS
+ALIVE = 1
+STEERED = 2
+
+MIN_CAPACITY = 16
+
+AreaKey = Tuple[int, int]
+
+
+def _field(column: int, cast=float):
+    def get(self):
+        return cast(self._row[column])
+
+    def set(self, value):
+        self._row[column] = value
+
+    return property(get, set)
+
+
+class SharedEnemy(Enemy):
+    """Inimigo cujo estado mora em uma linha de um EntityBlock.
+
+    Para o resto do jogo (desenho, munição, snapshot) é um Enemy comum; os
+    workers leem e escrevem a mesma memória sem copiar objetos.
+    """
+
+    x = _field(X)
+    y = _field(Y)
+    health = _field(HEALTH, int)
+    max_health = _field(MAX_HEALTH, int)
+    damage_cooldown = _field(COOLDOWN)
+    dir_x = _field(DIR_X)
+    dir_y = _field(DIR_Y)
+
+    def __init__(self, block: 'EntityBlock', slot: int, x: float, y: float, config):
+        self.block = block
+        self.slot = slot
+        self._row = block.array[slot]
+        self._row[FLAGS] = ALIVE
+        super().__init__(x, y, config)
+
+    @property
+    def steered(self) -> bool:
+        return bool(int(self._row[FLAGS]) & STEERED)
+
+    @steered.setter
+    def steered(self, value: bool):
+        flags = int(self._row[FLAGS])
+        self._row[FLAGS] = (flags | STEERED) if value else (flags & ~STEERED)
+
+
+class EntityBlock:
+    """Bloco de memória compartilhada com os inimigos de uma área"""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(MIN_CAPACITY, capacity)
+        self.shm = shared_memory.SharedMemory(create=True, size=self.capacity * NUM_FIELDS * 8)
+        self.array = np.ndarray((self.capacity, NUM_FIELDS), dtype=np.float64, buffer=self.shm.buf)
+        self.array[:] = 0.0
+        self.views: List[Optional[SharedEnemy]] = [None] * self.capacity
+        self.free: List[int] = []
+        # Linhas [0, used) já foram usadas alguma vez; o resto nunca
+        self.used = 0
+        self.live = 0
+        # Lista de inimigos da área à qual o bloco pertence
+        self.owner: Optional[list] = None
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def full(self) -> bool:
+        return not self.free and self.used >= self.capacity
+
+    def add(self, enemy: Enemy, config) -> SharedEnemy:
+        slot = self.free.pop() if self.free else self.used
+        if slot == self.used:
+            self.used += 1
+        view = SharedEnemy(self, slot, enemy.x, enemy.y, config)
+        view.health = enemy.health
+        view.max_health = enemy.max_health
+        view.damage_cooldown = enemy.damage_cooldown
+        view.dir_x = enemy.dir_x
+        view.dir_y = enemy.dir_y
+        view.steered = enemy.steered
+        self.views[slot] = view
+        self.live += 1
+        return view
+
+    def remove(self, slot: int):
+        view = self.views[slot]
+        if view is not None:
+            # A view pode continuar referenciada (ex.: lista de mortos); ela
+            # fica com uma cópia da linha e deixa de apontar para o bloco
+            view._row = view._row.copy()
+        self.array[slot, FLAGS] = 0.0
+        self.views[slot] = None
+        self.free.append(slot)
+        self.live -= 1
+
+    def grow(self) -> 'EntityBlock':
+        """Copia o bloco para um maior e move as views para ele; o bloco
+        antigo fica vazio e deve ser liberado por quem chamou"""
+        bigger = EntityBlock(self.capacity * 2)
+        bigger.array[:self.used] = self.array[:self.used]
+        bigger.used = self.used
+        bigger.live = self.live
+        bigger.free = list(self.free)
+        bigger.owner = self.owner
+        for slot, view in enumerate(self.views[:self.used]):
+            if view is not None:
+                view.block = bigger
+                view._row = bigger.array[slot]
+                bigger.views[slot] = view
+        self.views = []
+        return bigger
+
+    def release(self):
+        # As views soltas deixam de apontar para a memória antes de fechá-la
+        for view in self.views:
+            if view is not None:
+                view._row = view._row.copy()
+        self.views = []
+        self.array = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # Ainda há uma fatia do array viva; a memória é solta quando ela for coletada
+            pass
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def field_arrays(field) -> Tuple:
+    """Campo de direções como grade densa (NaN onde o inimigo segue direto)"""
+    directions = field.all_directions()
+    if not directions:
+        return field.cell_size, 0, 0, np.full((1, 1, 2), np.nan)
+    cells = directions.keys()
+    min_x = min(cell[0] for cell in cells)
+    min_y = min(cell[1] for cell in cells)
+    width = max(cell[0] for cell in cells) - min_x + 1
+    height = max(cell[1] for cell in cells) - min_y + 1
+    grid = np.full((height, width, 2), np.nan)
+    for (cell_x, cell_y), direction in directions.items():
+        grid[cell_y - min_y, cell_x - min_x] = direction
+    return field.cell_size, min_x, min_y, grid
+
+
+def sample_field(field: Tuple, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    cell_size, min_x, min_y, grid = field
+    # floor_divide segue o // do Python, usado por FlowField.cell_at
+    column = np.floor_divide(x, cell_size).astype(np.int64) - min_x
+    row = np.floor_divide(y, cell_size).astype(np.int64) - min_y
+    inside = (column >= 0) & (column < grid.shape[1]) & (row >= 0) & (row < grid.shape[0])
+    directions = np.full((len(x), 2), np.nan)
+    directions[inside] = grid[row[inside], column[inside]]
+    return directions
+
+
+def resolve_collisions(collision: Tuple, data: np.ndarray, old_x: np.ndarray, old_y: np.ndarray, half: float):
+    """CollisionMap.resolve em lote sobre as linhas de um bloco"""
+    data[:, X], data[:, Y] = resolve_boxes(collision, data[:, X], data[:, Y], old_x, old_y, half)
+
+
+def advance_block(array: np.ndarray, used: int, dt: float, tick: int, player_rect: Tuple[int, int, int, int],
+                  target: Tuple[float, float], params: Tuple, field: Optional[Tuple] = None, collision: Optional[Tuple] = None):
+    """Avança os inimigos vivos de um bloco; mesmas contas de Enemy.update.
+
+    Retorna (acertos no jogador, linhas mortas).
+    """
+    speed, size, damage_interval, steering_interval = params
+    rows = array[:used]
+    live = np.nonzero(rows[:, FLAGS].astype(np.int64) & ALIVE)[0]
+    if not len(live):
+        return 0, []
+
+    data = rows[live]
+    flags = data[:, FLAGS].astype(np.int64)
+    steer = ((tick + live) % steering_interval == 0) | ((flags & STEERED) == 0)
+    if steer.any():
+        dx = target[0] - data[steer, X]
+        dy = target[1] - data[steer, Y]
+        distance = np.sqrt(dx * dx + dy * dy)
+        moving = distance > 0
+        safe = np.where(moving, distance, 1.0)
+        dir_x = np.where(moving, dx / safe, 0.0)
+        dir_y = np.where(moving, dy / safe, 0.0)
+        if field is not None:
+            sampled = sample_field(field, data[steer, X], data[steer, Y])
+            found = ~np.isnan(sampled[:, 0])
+            dir_x = np.where(found, sampled[:, 0], dir_x)
+            dir_y = np.where(found, sampled[:, 1], dir_y)
+        data[steer, DIR_X] = dir_x
+        data[steer, DIR_Y] = dir_y
+        data[steer, FLAGS] = flags[steer] | STEERED
+
+    old_x, old_y = data[:, X].copy(), data[:, Y].copy()
+    data[:, X] += data[:, DIR_X] * speed * dt
+    data[:, Y] += data[:, DIR_Y] * speed * dt
+    if collision is not None:
+        resolve_collisions(collision, data, old_x, old_y, size)
+
+    cooling = data[:, COOLDOWN] > 0
+    data[cooling, COOLDOWN] -= dt
+
+    left = np.trunc(data[:, X] - size)
+    top = np.trunc(data[:, Y] - size)
+    width = size * 2
+    px, py, pw, ph = player_rect
+    touching = (left < px + pw) & (top < py + ph) & (left + width > px) & (top + width > py)
+    hits = touching & (data[:, COOLDOWN] <= 0)
+    data[hits, COOLDOWN] = damage_interval
+
+    # Como em Enemy.update, o inimigo morto ainda anda neste passo e só então sai
+    dead = data[:, HEALTH] <= 0
+    data[dead, FLAGS] = 0.0
+    rows[live] = data
+    return int(hits.sum()), live[dead].tolist()
+
+
+def _worker_main(conn):
+    """Laço de um worker: recebe os blocos de um quadro, avança e responde"""
+    attached: Dict[str, Tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+    # Campo de direções e mapa de colisão; só chegam quando mudam
+    state = {'field': None, 'collision': None}
+
+    def attach(name: str, capacity: int) -> np.ndarray:
+        entry = attached.get(name)
+        if entry is None or entry[1].shape[0] != capacity:
+            shm = shared_memory.SharedMemory(name=name)
+            entry = (shm, np.ndarray((capacity, NUM_FIELDS), dtype=np.float64, buffer=shm.buf))
+            attached[name] = entry
+        return entry[1]
+
+    try:
+        while True:
+            message = conn.recv()
+            if message[0] == 'stop':
+                break
+            if message[0] == 'release':
+                entry = attached.pop(message[1], None)
+                if entry:
+                    shm, entry = entry[0], None
+                    shm.close()
+                continue
+
+            _, player_rect, target, params, updates, jobs = message
+            state.update(updates)
+            results = []
+            for name, capacity, used, dt, tick in jobs:
+                array = attach(name, capacity)
+                results.append(advance_block(array, used, dt, tick, player_rect, target, params,
+                                             state['field'], state['collision']))
+            conn.send(results)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        while attached:
+            shm = attached.popitem()[1][0]
+            shm.close()
+
+
+class ParallelAreaUpdater:
+    """Atualiza as áreas ativas em processos separados (simulation.workers).
+
+    O scheduler enfileira as áreas devidas com queue(); flush() distribui os
+    blocos entre os workers, espera todos responderem (a barreira do
+    quadro) e aplica no processo principal o dano no jogador e a remoção dos
+    mortos. A migração entre áreas é a mesma do modo serial
+    (WorldBackend.migrate_enemies), que marca as áreas mexidas com
+    invalidate(). Itens continuam no processo principal. Os Enemy do pool copiados para um
+    bloco são devolvidos ao pool na hora; as views (SharedEnemy) não entram
+    na contagem dele.
+    """
+
+    def __init__(self, config: GameConfig, workers: int):
+        self.config = config
+        self.workers = workers
+        self.steering_interval = config.simulation.steering_interval
+        self.blocks: Dict[AreaKey, EntityBlock] = {}
+        self.batch: List[Tuple[object, float, int]] = []
+        # Áreas cuja lista mudou de composição desde o último flush
+        self.stale: Set[AreaKey] = set()
+        self.closed = False
+        # Versão do campo de direções que cada worker tem (None = sem campo)
+        # e se já recebeu o mapa de colisão, que não muda
+        self.field_versions: List[Optional[int]] = [None] * workers
+        self.collision_sent = [False] * workers
+        self.collision_arrays = None
+
+        # Os workers herdam o rastreador de recursos do processo principal;
+        # um rastreador próprio apagaria os blocos de novo ao sair
+        resource_tracker.ensure_running()
+        self.connections = []
+        self.processes = []
+        for _ in range(workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker_main, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+        atexit.register(self.close)
+
+    def queue(self, area, player: Player, dt: float, tick: int):
+        self.batch.append((area, dt, tick))
+
+    def invalidate(self, area):
+        """A lista da área ganhou ou perdeu inimigos fora do flush"""
+        self.stale.add((area.grid_x, area.grid_y))
+
+    def block_for(self, area) -> EntityBlock:
+        """Bloco da área, (re)criado quando a lista de inimigos foi trocada"""
+        key = (area.grid_x, area.grid_y)
+        block = self.blocks.get(key)
+        stale = key in self.stale
+        self.stale.discard(key)
+        if block is not None and block.owner is area.enemies:
+            if stale or block.live != len(area.enemies):
+                self._sync(area, block)
+            return self.blocks[key]
+        if block is not None:
+            self._release(block)
+
+        block = EntityBlock(len(area.enemies) * 2)
+        block.owner = area.enemies
+        originals = list(area.enemies)
+        area.enemies[:] = [block.add(enemy, self.config.enemy) for enemy in originals]
+        # O estado foi copiado para o bloco; os Enemy do pool voltam para ele
+        enemy_pool.release_all(originals)
+        self.blocks[key] = block
+        return block
+
+    def flush(self, player: Player, field=None, collision=None):
+        if not self.batch:
+            return
+        batch, self.batch = self.batch, []
+
+        jobs = [[] for _ in self.connections]
+        loads = [0] * len(self.connections)
+        entries = []
+        for area, dt, tick in sorted(batch, key=lambda entry: -len(entry[0].enemies)):
+            block = self.block_for(area)
+            worker = loads.index(min(loads))
+            loads[worker] += block.used
+            jobs[worker].append((block.name, block.capacity, block.used, dt, tick))
+            entries.append((worker, len(jobs[worker]) - 1, area))
+
+        rect = player.get_rect()
+        enemy = self.config.enemy
+        params = (enemy.speed, enemy.size, enemy.damage_interval, self.steering_interval)
+        message = ('tick', (rect.x, rect.y, rect.w, rect.h), (player.x, player.y), params)
+        version = field.version if field is not None else None
+        arrays = None
+        if collision is not None and self.collision_arrays is None:
+            self.collision_arrays = collision.arrays()
+        for worker, (connection, worker_jobs) in enumerate(zip(self.connections, jobs)):
+            if not worker_jobs:
+                continue
+            updates = {}
+            if self.field_versions[worker] != version:
+                if field is not None and arrays is None:
+                    arrays = field_arrays(field)
+                updates['field'] = arrays
+                self.field_versions[worker] = version
+            if self.collision_arrays is not None and not self.collision_sent[worker]:
+                updates['collision'] = self.collision_arrays
+                self.collision_sent[worker] = True
+            connection.send(message + (updates, worker_jobs))
+        results = [connection.recv() if worker_jobs else [] for connection, worker_jobs in zip(self.connections, jobs)]
+
+        for worker, index, area in entries:
+            hits, dead_slots = results[worker][index]
+            for _ in range(hits):
+                player.take_damage(enemy.damage)
+            if dead_slots:
+                self._remove_slots(area, self.blocks[(area.grid_x, area.grid_y)], dead_slots)
+
+        for area, dt, tick in batch:
+            update_items(area.items, player)
+
+    def _sync(self, area, block: EntityBlock):
+        """Alinha o bloco à lista da área depois de mudanças feitas fora do
+        flush (ex.: remove_enemies pelo item de munição, migrações)"""
+        present = {id(enemy) for enemy in area.enemies}
+        for slot, view in enumerate(block.views[:block.used]):
+            if view is not None and id(view) not in present:
+                block.remove(slot)
+        # Conjunto fixado antes de _add, que pode trocar o bloco por um maior
+        own = {id(view) for view in block.views[:block.used] if view is not None}
+        originals = list(area.enemies)
+        area.enemies[:] = [enemy if id(enemy) in own else self._add(area, enemy) for enemy in originals]
+        enemy_pool.release_all(originals)
+
+    def _add(self, area, enemy: Enemy) -> SharedEnemy:
+        key = (area.grid_x, area.grid_y)
+        block = self.blocks[key]
+        if block.full:
+            old, block = block, block.grow()
+            self.blocks[key] = block
+            self._release(old)
+        return block.add(enemy, self.config.enemy)
+
+    def _remove_slots(self, area, block: EntityBlock, slots: List[int]):
+        views = {id(block.views[slot]) for slot in slots if block.views[slot] is not None}
+        area.enemies[:] = [view for view in area.enemies if id(view) not in views]
+        for slot in slots:
+            block.remove(slot)
+
+    def _release(self, block: EntityBlock):
+        for connection in self.connections:
+            connection.send(('release', block.name))
+        block.release()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for connection in self.connections:
+            try:
+                connection.send(('stop',))
+                connection.close()
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.terminate()
+        for block in self.blocks.values():
+            block.release()
+        self.blocks.clear()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Mede o tempo de atualização do mundo com 0, 1, 2, ... workers no cenário
+'performance' (9 áreas ativas com 200 inimigos cada) e imprime o ganho em
+relação ao modo serial.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from entities import Player
+from game_config import DEFAULTS, GameConfig, merge_config
+from game_state import create_preset_scenario
+from world import World
+
+DT = 1.0 / 30.0
+
+
+def benchmark_config(workers: int) -> GameConfig:
+    # Todas as 9 áreas ativas e em faixa 0, sem orçamento: a mesma carga em todo quadro
+    overrides = merge_config(create_preset_scenario('performance'), {
+        'game': {'window_width': 6000, 'window_height': 6000},
+        'player': {'max_health': 10 ** 9},
+        'world': {'activation_distance': 3000, 'lod_radius': 0},
+        'simulation': {'update_budget_ms': 0, 'workers': workers}
+    })
+    return GameConfig.from_dict(merge_config(DEFAULTS, overrides))
+
+
+def measure(workers: int, frames: int, warmup: int, seed: int) -> Dict:
+    world = World(config=benchmark_config(workers), seed=seed)
+    area_size = world.area_size
+    player = Player(area_size * 1.5, area_size * 1.5, world.config.player)
+    try:
+        for _ in range(warmup):
+            world.update(player, DT)
+        samples = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            world.update(player, DT)
+            samples.append((time.perf_counter() - start) * 1000.0)
+    finally:
+        world.close()
+    return {'workers': workers, 'enemies': len(world.enemies), 'active_areas': len(world.active_areas),
+            'ms_mean': statistics.mean(samples), 'ms_p95': sorted(samples)[int(len(samples) * 0.95) - 1]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ganho da atualização paralela das áreas por número de workers")
+    parser.add_argument("--workers", type=int, nargs='+',
+                        help="Quantidades de workers a medir (padrão: 1, 2, 4, ... até o número de CPUs)")
+    parser.add_argument("--frames", type=int, default=150, help="Quadros medidos por configuração")
+    parser.add_argument("--warmup", type=int, default=15, help="Quadros descartados antes de medir")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", action="store_true", help="Imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    counts = args.workers
+    if not counts:
+        counts, workers = [], 1
+        while workers <= (os.cpu_count() or 1):
+            counts.append(workers)
+            workers *= 2
+    results: List[Dict] = [measure(workers, args.frames, args.warmup, args.seed)
+                           for workers in [0] + [count for count in counts if count > 0]]
+    serial = results[0]['ms_mean']
+    for result in results:
+        result['speedup'] = serial / result['ms_mean'] if result['ms_mean'] else 0.0
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print("=" * 50)
+    print("⚙️  ATUALIZAÇÃO PARALELA DAS ÁREAS")
+    print("=" * 50)
+    print(f"🖥️  CPUs: {os.cpu_count()} | 👾 Inimigos: {results[0]['enemies']} em "
+          f"{results[0]['active_areas']} áreas ativas")
+    print(f"{'Workers':>8} {'Média (ms)':>11} {'p95 (ms)':>9} {'Ganho':>7}")
+    for result in results:
+        label = 'serial' if result['workers'] == 0 else str(result['workers'])
+        print(f"{label:>8} {result['ms_mean']:>11.2f} {result['ms_p95']:>9.2f} {result['speedup']:>6.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,24 @@
 import pygame
-from typing import List
+from typing import List, Optional
+
+from menu import MenuButton
 
 class PauseMenu:
+    """Menu de pausa desenhado sobre o último quadro do jogo congelado.
+
+    Ao pausar, freeze guarda uma cópia da tela já com o escurecimento e a
+    caixa do menu; enquanto a pausa durar, draw só repõe esse quadro sob os
+    botões que mudaram de foco. O custo não depende do tamanho do mundo, e
+    hide (continuar, reiniciar, voltar ao menu) descarta o quadro.
+    """
+    
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.visible = False
+        self.frozen: Optional[pygame.Surface] = None
+        # Se a tela já mostra o quadro congelado inteiro
+        self.presented = False
         self.font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 36)
         
@@ -30,12 +43,37 @@ class PauseMenu:
     
     def show(self):
         self.visible = True
+        self.invalidate()
     
     def hide(self):
         self.visible = False
+        self.invalidate()
     
     def toggle(self):
-        self.visible = not self.visible
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+    
+    def invalidate(self):
+        """Descarta o quadro congelado; o próximo draw do jogo captura outro"""
+        self.frozen = None
+        self.presented = False
+    
+    def redraw(self):
+        """Repõe a pausa inteira no próximo draw (janela exposta)"""
+        self.presented = False
+    
+    def freeze(self, screen: pygame.Surface):
+        """Guarda o quadro do jogo em screen, já escurecido e com a caixa do menu"""
+        self.frozen = screen.copy()
+        self.draw_panel(self.frozen)
+        self.presented = False
+    
+    @property
+    def dirty(self) -> bool:
+        """Se algum botão mudou de foco desde o último draw"""
+        return self.visible and any(button.dirty for button in self.buttons)
     
     def handle_event(self, event: pygame.event.Event) -> str:
         if not self.visible:
@@ -62,10 +100,30 @@ class PauseMenu:
         
         return "none"
     
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Desenha a pausa sobre o quadro congelado; retorna as áreas alteradas"""
         if not self.visible:
-            return
-        
+            return []
+        if self.frozen is None:
+            self.freeze(screen)
+        
+        if not self.presented:
+            screen.blit(self.frozen, (0, 0))
+            for button in self.buttons:
+                button.draw(screen)
+            self.presented = True
+            return [screen.get_rect()]
+        
+        rects = []
+        for button in self.buttons:
+            if button.dirty:
+                bounds = button.bounds
+                screen.blit(self.frozen, bounds, bounds)
+                button.draw(screen)
+                rects.append(bounds)
+        return rects
+    
+    def draw_panel(self, screen: pygame.Surface):
         overlay = pygame.Surface((self.screen_width, self.screen_height))
         overlay.set_alpha(128)
         overlay.fill((0, 0, 0))
@@ -104,51 +162,3 @@ class PauseMenu:
         shadow_inst_rect.y += 2
         screen.blit(shadow_instruction, shadow_inst_rect)
         screen.blit(instruction, instruction_rect)
-        
-        for button in self.buttons:
-            button.draw(screen)
-
-class MenuButton:
-    def __init__(self, x: int, y: int, width: int, height: int, text: str, color: tuple, hover_color: tuple, font_size: int = 36):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
-        self.color = color
-        self.hover_color = hover_color
-        self.hovered = False
-        self.font = pygame.font.Font(None, font_size)
-        self.shadow_offset = 3
-        self.border_radius = 8
-    
-    def draw(self, screen: pygame.Surface):
-        shadow_rect = pygame.Rect(
-            self.rect.x + self.shadow_offset,
-            self.rect.y + self.shadow_offset,
-            self.rect.width,
-            self.rect.height
-        )
-        pygame.draw.rect(screen, (0, 0, 0, 100), shadow_rect, border_radius=self.border_radius)
-        
-        color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=self.border_radius)
-        
-        border_color = (255, 255, 255) if self.hovered else (200, 200, 200)
-        pygame.draw.rect(screen, border_color, self.rect, 3, border_radius=self.border_radius)
-        
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        
-        shadow_text = self.font.render(self.text, True, (0, 0, 0))
-        shadow_rect = text_rect.copy()
-        shadow_rect.x += 2
-        shadow_rect.y += 2
-        screen.blit(shadow_text, shadow_rect)
-        
-        screen.blit(text_surface, text_rect)
-    
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                return True
-        return False
\ No newline at end of file
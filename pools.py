@@ -0,0 +1,111 @@
+from typing import Dict, Iterable, List
+
+from entities import Enemy, Item
+
+
+class PoolStats:
+    def __init__(self):
+        # acquire atendido pela lista livre / por um objeto novo
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        # Entidades fora do pool agora e o máximo já visto
+        self.in_use = 0
+        self.high_water = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class EntityPool:
+    """Lista livre de entidades de um tipo, reiniciadas no lugar com reset().
+
+    Só aceita objetos exatamente do tipo do pool: subclasses como
+    parallel.SharedEnemy apontam para memória que não pertence a elas e não
+    podem ser reaproveitadas. Quem devolve uma entidade não deve mais usá-la.
+    """
+
+    def __init__(self, kind: type, max_free: int = 10000):
+        self.kind = kind
+        self.max_free = max_free
+        self.free: List = []
+        self.stats = PoolStats()
+
+    def acquire(self, *args):
+        stats = self.stats
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args)
+            stats.hits += 1
+        else:
+            entity = self.kind(*args)
+            stats.misses += 1
+        stats.in_use += 1
+        if stats.in_use > stats.high_water:
+            stats.high_water = stats.in_use
+        return entity
+
+    def acquire_many(self, positions: List, *args) -> List:
+        """acquire para cada (x, y) de positions, com a contagem feita uma vez só"""
+        free = self.free
+        reused = min(len(free), len(positions))
+        entities = free[len(free) - reused:]
+        del free[len(free) - reused:]
+        for entity, (x, y) in zip(entities, positions):
+            entity.reset(x, y, *args)
+        kind = self.kind
+        entities.extend(kind(x, y, *args) for x, y in positions[reused:])
+
+        stats = self.stats
+        stats.hits += reused
+        stats.misses += len(positions) - reused
+        stats.in_use += len(positions)
+        if stats.in_use > stats.high_water:
+            stats.high_water = stats.in_use
+        return entities
+
+    def release(self, entity):
+        if type(entity) is not self.kind:
+            return
+        stats = self.stats
+        stats.in_use = max(0, stats.in_use - 1)
+        if len(self.free) < self.max_free:
+            self.free.append(entity)
+            stats.released += 1
+
+    def release_all(self, entities: Iterable):
+        for entity in entities:
+            self.release(entity)
+
+    def reset_stats(self):
+        self.stats = PoolStats()
+
+    def report(self) -> Dict:
+        stats = self.stats
+        return {
+            'free': len(self.free),
+            'in_use': stats.in_use,
+            'high_water': stats.high_water,
+            'hits': stats.hits,
+            'misses': stats.misses,
+            'hit_rate': round(stats.hit_rate, 3)
+        }
+
+
+# Compartilhados por todos os mundos, para sobreviver ao Game.restart
+enemy_pool = EntityPool(Enemy)
+item_pool = EntityPool(Item)
+
+
+def release_entities(enemies: List[Enemy], items: List[Item]):
+    """Devolve o conteúdo das listas aos pools e as esvazia"""
+    enemy_pool.release_all(enemies)
+    item_pool.release_all(items)
+    enemies.clear()
+    items.clear()
+
+
+def pool_stats() -> Dict:
+    return {'enemies': enemy_pool.report(), 'items': item_pool.report()}
@@ -0,0 +1,201 @@
+import marshal
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_DIR = 'profiles'
+
+# Identificação de uma função no formato do pstats: (arquivo, linha, nome)
+FunctionKey = Tuple[str, int, str]
+
+
+def _function_key(frame) -> FunctionKey:
+    code = frame.f_code
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def _timestamp() -> str:
+    now = time.time()
+    return time.strftime('%Y%m%d_%H%M%S', time.localtime(now)) + f"_{int(now * 1000) % 1000:03d}"
+
+
+def _label(key: FunctionKey) -> str:
+    filename, _, name = key
+    return f"{os.path.splitext(os.path.basename(filename))[0]}:{name}"
+
+
+class StackSampler:
+    """Amostra a pilha da thread principal de tempos em tempos, a partir de
+    uma thread própria, sem instrumentar as chamadas como o cProfile.
+
+    O jogo continua rodando enquanto a amostragem acontece; no fim os
+    resultados vão para disco como pilhas colapsadas (formato do
+    flamegraph.pl / speedscope) e como um arquivo .prof que o pstats lê.
+    """
+
+    def __init__(self, duration: float = 5.0, interval: float = 0.005, output_dir: str = PROFILE_DIR,
+                 thread_id: int = None):
+        self.duration = duration
+        self.interval = interval
+        self.output_dir = output_dir
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        # Pilhas amostradas, da raiz para a folha: número de amostras e tempo
+        # coberto por elas (o intervalo real entre amostras, que com o GIL
+        # ocupado pode passar de interval)
+        self.stacks: Counter = Counter()
+        self.seconds: Counter = Counter()
+        self.samples = 0
+        self.started = 0.0
+        self.thread: Optional[threading.Thread] = None
+        self.files: List[str] = []
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.duration - (time.perf_counter() - self.started))
+
+    def start(self):
+        if self.running:
+            return
+        self.started = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self.thread.start()
+
+    def join(self):
+        if self.thread is not None:
+            self.thread.join()
+
+    def _run(self):
+        end = self.started + self.duration
+        last = self.started
+        while True:
+            now = time.perf_counter()
+            self.sample(now - last)
+            last = now
+            if now >= end:
+                break
+            time.sleep(self.interval)
+        self.files = self.write()
+        print(f"📊 Perfil salvo em: {', '.join(self.files)} ({self.samples} amostras)")
+
+    def sample(self, elapsed: float = None):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        stack = []
+        while frame is not None:
+            stack.append(_function_key(frame))
+            frame = frame.f_back
+        stack.reverse()
+        stack = tuple(stack)
+        self.stacks[stack] += 1
+        self.seconds[stack] += self.interval if elapsed is None else elapsed
+        self.samples += 1
+
+    def collapsed(self) -> List[str]:
+        """Uma linha por pilha: 'raiz;...;folha contagem'"""
+        return [f"{';'.join(_label(key) for key in stack)} {count}"
+                for stack, count in self.stacks.most_common()]
+
+    def pstats_data(self) -> Dict:
+        """Estatísticas no formato que pstats.Stats carrega de um arquivo:
+        {função: (chamadas primitivas, chamadas, tempo próprio, tempo acumulado, {chamador: (...)})}.
+        'chamadas' conta amostras, não chamadas de verdade."""
+        samples: Counter = Counter()
+        own: Counter = Counter()
+        total: Counter = Counter()
+        callers: Dict[FunctionKey, Dict[FunctionKey, List[float]]] = {}
+        for stack, count in self.stacks.items():
+            seconds = self.seconds[stack]
+            own[stack[-1]] += seconds
+            for key in set(stack):
+                samples[key] += count
+                total[key] += seconds
+            for caller, callee in set(zip(stack, stack[1:])):
+                entry = callers.setdefault(callee, {}).setdefault(caller, [0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+
+        stats = {}
+        for key, count in samples.items():
+            caller_stats = {caller: (calls, calls, seconds, seconds)
+                            for caller, (calls, seconds) in callers.get(key, {}).items()}
+            stats[key] = (count, count, own[key], total[key], caller_stats)
+        return stats
+
+    def write(self) -> List[str]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"sample_{_timestamp()}")
+        with open(base + '.collapsed', 'w', encoding='utf-8') as f:
+            f.write("\n".join(self.collapsed()) + "\n")
+        with open(base + '.prof', 'wb') as f:
+            marshal.dump(self.pstats_data(), f)
+        return [base + '.collapsed', base + '.prof']
+
+
+class AllocationTracker:
+    """Diferença de alocações entre duas capturas do tracemalloc.
+
+    A primeira chamada de toggle liga o tracemalloc e guarda a captura de
+    referência; a segunda compara com ela, escreve o relatório por módulo e
+    desliga o rastreamento, que deixa cada alocação mais cara enquanto está
+    ligado.
+    """
+
+    def __init__(self, output_dir: str = PROFILE_DIR, frames: int = 1, top: int = 30):
+        self.output_dir = output_dir
+        self.frames = frames
+        self.top = top
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def tracing(self) -> bool:
+        return self.baseline is not None
+
+    def toggle(self) -> Optional[str]:
+        """Começa ou termina uma medição; retorna o relatório quando termina"""
+        if not self.tracing:
+            self.start()
+            return None
+        return self.finish()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.baseline = tracemalloc.take_snapshot()
+
+    def finish(self) -> str:
+        snapshot = tracemalloc.take_snapshot()
+        baseline, self.baseline = self.baseline, None
+        tracemalloc.stop()
+        return self.write(self.report(baseline, snapshot))
+
+    def report(self, baseline: tracemalloc.Snapshot, snapshot: tracemalloc.Snapshot) -> List[str]:
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        baseline = baseline.filter_traces(ignore)
+        snapshot = snapshot.filter_traces(ignore)
+
+        lines = ["# Alocações por módulo (diferença em bytes, diferença em blocos, total atual)"]
+        for diff in snapshot.compare_to(baseline, 'filename')[:self.top]:
+            filename = diff.traceback[0].filename
+            lines.append(f"{diff.size_diff:+12d} {diff.count_diff:+8d} {diff.size:12d}  {filename}")
+        lines.append("")
+        lines.append("# Linhas que mais cresceram")
+        for diff in snapshot.compare_to(baseline, 'lineno')[:self.top]:
+            frame = diff.traceback[0]
+            lines.append(f"{diff.size_diff:+12d} {diff.count_diff:+8d}  {frame.filename}:{frame.lineno}")
+        return lines
+
+    def write(self, lines: List[str]) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        filename = os.path.join(self.output_dir, f"alloc_{_timestamp()}.txt")
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        return filename
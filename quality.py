@@ -0,0 +1,61 @@
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+from game_config import QualityLevel
+
+
+class QualityController:
+    """Escolhe o nível de quality.levels a partir do tempo de trabalho dos quadros.
+
+    A média dos últimos window quadros acima de target_ms * degrade desce um
+    nível; abaixo de target_ms * recover sobe um. Depois de cada troca há
+    cooldown segundos sem nova decisão, e um nível que foi abandonado por
+    estar lento só é tentado de novo depois de retry segundos, para o
+    controle não ficar alternando entre dois níveis vizinhos.
+    """
+
+    def __init__(self, levels: Tuple[QualityLevel, ...], target_ms: float, adaptive: bool = True,
+                 window: int = 30, degrade: float = 1.15, recover: float = 0.7, cooldown: float = 1.0,
+                 retry: float = 10.0):
+        self.levels = levels
+        self.target_ms = target_ms
+        self.adaptive = adaptive
+        self.degrade = degrade
+        self.recover = recover
+        self.cooldown = cooldown
+        self.retry = retry
+        self.index = 0
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.elapsed = 0.0
+        self.wait = 0.0
+        # Momento em que cada nível foi deixado por estar lento
+        self.abandoned: Dict[int, float] = {}
+        self.changes = 0
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def record(self, work_ms: float, dt: float) -> bool:
+        """Registra um quadro; retorna True quando o nível mudou"""
+        if not self.adaptive:
+            return False
+        self.elapsed += dt
+        self.wait -= dt
+        self.samples.append(work_ms)
+        if self.wait > 0 or len(self.samples) < self.samples.maxlen:
+            return False
+
+        mean = sum(self.samples) / len(self.samples)
+        if mean > self.target_ms * self.degrade and self.index < len(self.levels) - 1:
+            self.abandoned[self.index] = self.elapsed
+            self.index += 1
+        elif (mean < self.target_ms * self.recover and self.index > 0 and
+              self.elapsed - self.abandoned.get(self.index - 1, -self.retry) >= self.retry):
+            self.index -= 1
+        else:
+            return False
+        self.samples.clear()
+        self.wait = self.cooldown
+        self.changes += 1
+        return True
@@ -0,0 +1,134 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from camera import transform_points, visible_points
+
+Color = Tuple[int, int, int]
+
+HEALTH_BAR_BACK = (255, 0, 0)
+HEALTH_BAR_FRONT = (0, 255, 0)
+SYMBOL_COLOR = (255, 255, 255)
+
+
+def enemy_array(enemies: Sequence) -> np.ndarray:
+    """Uma linha por inimigo: prev_x, prev_y, x, y, fração de vida, tamanho"""
+    array = np.array([(enemy.prev_x, enemy.prev_y, enemy.x, enemy.y, enemy.health / enemy.max_health, enemy.size)
+                      for enemy in enemies], dtype=np.float64)
+    return array if len(array) else array.reshape((0, 6))
+
+
+def item_array(items: Sequence) -> np.ndarray:
+    """Uma linha por item: x, y, tamanho"""
+    array = np.array([(item.x, item.y, item.size) for item in items], dtype=np.float64)
+    return array if len(array) else array.reshape((0, 3))
+
+
+class BatchRenderer:
+    """Desenho de inimigos e itens em lote.
+
+    As posições de todas as entidades passam pela câmera de uma vez
+    (camera.transform_points), as que estão fora da tela são descartadas em
+    bloco e o resto vira listas de Surface.blits agrupadas por tipo:
+    círculos, fundos e frentes das barras de vida, símbolos. Círculos e
+    barras são superfícies pré-desenhadas com pygame.draw, guardadas por
+    cor e tamanho, então o resultado é o mesmo pixel a pixel de Entity.draw.
+    """
+
+    def __init__(self):
+        self.circles: Dict[Tuple[Color, int], pygame.Surface] = {}
+        self.bars: Dict[Tuple[Color, int, int], pygame.Surface] = {}
+        self.symbols: Dict[str, pygame.Surface] = {}
+        self.font = None
+
+    def circle(self, color: Color, radius: int) -> pygame.Surface:
+        key = (color, radius)
+        surface = self.circles.get(key)
+        if surface is None:
+            # Transparência por colorkey com a cor inversa, que nunca é a do círculo
+            transparent = tuple(255 - channel for channel in color)
+            surface = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+            surface.fill(transparent)
+            surface.set_colorkey(transparent, pygame.RLEACCEL)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            self.circles[key] = surface
+        return surface
+
+    def bar(self, color: Color, width: int, height: int) -> pygame.Surface:
+        key = (color, width, height)
+        surface = self.bars.get(key)
+        if surface is None:
+            surface = self.bars[key] = pygame.Surface((max(1, width), height))
+            surface.fill(color)
+        return surface
+
+    def symbol(self, text: str) -> pygame.Surface:
+        surface = self.symbols.get(text)
+        if surface is None:
+            if self.font is None:
+                self.font = pygame.font.Font(None, 24)
+            surface = self.symbols[text] = self.font.render(text, True, SYMBOL_COLOR)
+        return surface
+
+    def draw_enemies(self, screen: pygame.Surface, enemies: np.ndarray, colors: Sequence[Color],
+                     camera_x: float, camera_y: float, alpha: float = 1.0, scale: float = 1.0,
+                     health_bars: bool = True):
+        """Inimigos no formato de enemy_array, interpolados em alpha"""
+        if not len(enemies):
+            return
+        xs = enemies[:, 0] + (enemies[:, 2] - enemies[:, 0]) * alpha
+        ys = enemies[:, 1] + (enemies[:, 3] - enemies[:, 1]) * alpha
+        screen_x, screen_y = transform_points(xs, ys, camera_x, camera_y, scale)
+        radii = (enemies[:, 5] * scale).astype(int)
+        bar_offset = int(8 * scale)
+        width, height = screen.get_size()
+        # A barra de vida fica acima do círculo
+        visible = np.flatnonzero(visible_points(screen_x, screen_y, radii + bar_offset + 5, width, height))
+        if not len(visible):
+            return
+
+        xs = screen_x[visible].tolist()
+        ys = screen_y[visible].tolist()
+        sizes = radii[visible].tolist()
+        circle = self.circle
+        screen.blits([(circle(tuple(colors[index]), size), (x - size, y - size))
+                      for index, x, y, size in zip(visible.tolist(), xs, ys, sizes)], doreturn=False)
+        if not health_bars:
+            return
+
+        bar_height = max(1, int(4 * scale))
+        fill = (enemies[visible, 4] * (radii[visible] * 2)).astype(int).tolist()
+        back = []
+        front = []
+        for x, y, size, filled in zip(xs, ys, sizes, fill):
+            position = (x - size, y - size - bar_offset)
+            back.append((self.bar(HEALTH_BAR_BACK, size * 2, bar_height), position))
+            if filled > 0:
+                front.append((self.bar(HEALTH_BAR_FRONT, size * 2, bar_height), position,
+                              (0, 0, filled, bar_height)))
+        screen.blits(back, doreturn=False)
+        screen.blits(front, doreturn=False)
+
+    def draw_items(self, screen: pygame.Surface, items: np.ndarray, colors: Sequence[Color], symbols: Sequence[str],
+                   camera_x: float, camera_y: float, scale: float = 1.0, detail: bool = True):
+        """Itens no formato de item_array; com detail, o símbolo centralizado"""
+        if not len(items):
+            return
+        screen_x, screen_y = transform_points(items[:, 0], items[:, 1], camera_x, camera_y, scale)
+        radii = (items[:, 2] * scale).astype(int)
+        width, height = screen.get_size()
+        visible = np.flatnonzero(visible_points(screen_x, screen_y, radii + 20, width, height)).tolist()
+        if not visible:
+            return
+
+        positions: List[Tuple[int, int, int]] = [(int(screen_x[index]), int(screen_y[index]), int(radii[index]))
+                                                 for index in visible]
+        screen.blits([(self.circle(tuple(colors[index]), size), (x - size, y - size))
+                      for index, (x, y, size) in zip(visible, positions)], doreturn=False)
+        if detail:
+            labels = []
+            for index, (x, y, _) in zip(visible, positions):
+                text = self.symbol(symbols[index])
+                labels.append((text, text.get_rect(center=(x, y))))
+            screen.blits(labels, doreturn=False)
@@ -0,0 +1,142 @@
+from typing import Dict, Tuple
+
+import numpy as np
+import pygame
+
+from game_config import Color, QualityLevel
+from render_batch import BatchRenderer, enemy_array, item_array
+from sprites import player_sprites
+from walls import draw_walls
+
+
+def frozen(values, dtype, columns: int = 0) -> np.ndarray:
+    """Array somente leitura; vazio com o formato certo quando não há valores"""
+    array = np.array(values, dtype=dtype)
+    if not len(array):
+        array = array.reshape((0, columns) if columns else (0,))
+    array.setflags(write=False)
+    return array
+
+
+class RenderSnapshot:
+    """Tudo o que um quadro desenha, copiado do estado da simulação ao fim de
+    um tick. Os arrays são somente leitura e nada aponta para entidades
+    vivas, então a simulação pode seguir para o próximo tick enquanto outro
+    estágio desenha este (Game.run com game.pipeline).
+
+    enemies e items estão nos formatos de render_batch.enemy_array e
+    item_array; as cores vão em tuplas à parte. player: prev_x, prev_y, x,
+    y, fração de vida, tamanho e direção (índice de sprites.DIRECTIONS).
+    """
+
+    __slots__ = ('enemies', 'enemy_colors', 'items', 'item_colors', 'item_symbols', 'player', 'player_color',
+                 'camera', 'alpha', 'rects', 'labels', 'walls', 'hud', 'overlay')
+
+    def __init__(self, enemies: np.ndarray, enemy_colors: Tuple[Color, ...], items: np.ndarray,
+                 item_colors: Tuple[Color, ...],
+                 item_symbols: Tuple[str, ...], player: np.ndarray, player_color: Tuple[int, int, int],
+                 camera: np.ndarray, alpha: float, rects: Tuple, labels: Tuple, walls: Tuple, hud: Dict,
+                 overlay: Tuple[str, ...]):
+        self.enemies = enemies
+        self.enemy_colors = enemy_colors
+        self.items = items
+        self.item_colors = item_colors
+        self.item_symbols = item_symbols
+        self.player = player
+        self.player_color = player_color
+        self.camera = camera
+        self.alpha = alpha
+        self.rects = rects
+        self.labels = labels
+        self.walls = walls
+        self.hud = hud
+        self.overlay = overlay
+
+    def camera_position(self) -> Tuple[float, float]:
+        prev_x, prev_y, x, y = self.camera
+        return prev_x + (x - prev_x) * self.alpha, prev_y + (y - prev_y) * self.alpha
+
+
+def capture_snapshot(game) -> RenderSnapshot:
+    """Copia do jogo o que draw() usaria neste quadro"""
+    world = game.world
+    enemies = world.enemies
+    items = world.items
+    player = game.player
+    camera = game.camera
+    rects, labels, walls = world.render_shapes()
+    return RenderSnapshot(
+        enemies=frozen(enemy_array(enemies), np.float64, 6),
+        enemy_colors=tuple(enemy.color for enemy in enemies),
+        items=frozen(item_array(items), np.float64, 3),
+        item_colors=tuple(item.color for item in items),
+        item_symbols=tuple(item.symbol for item in items),
+        player=frozen((player.prev_x, player.prev_y, player.x, player.y, player.health / player.max_health,
+                       player.size, player.heading), np.float64),
+        player_color=tuple(player.color),
+        camera=frozen((camera.prev_x, camera.prev_y, camera.x, camera.y), np.float64),
+        alpha=game.alpha,
+        rects=tuple(rects),
+        labels=tuple(labels),
+        walls=tuple(walls),
+        hud=game.hud_state(),
+        overlay=tuple(game.memory_lines) if game.show_memory else ()
+    )
+
+
+class SnapshotRenderer:
+    """Desenha um RenderSnapshot como Game.draw desenharia o estado vivo.
+
+    Com um QualityLevel o desenho pode omitir as barras de vida dos
+    inimigos, os detalhes (símbolos dos itens, borda das paredes, marcas
+    das áreas) e ser feito numa superfície render_scale vezes menor.
+    """
+
+    def __init__(self, tile_size: int):
+        self.tile_size = tile_size
+        self.batch = BatchRenderer()
+        self.label_font = pygame.font.Font(None, 20)
+        self.labels: Dict[Tuple, pygame.Surface] = {}
+
+    def label(self, text: str, color) -> pygame.Surface:
+        key = (text, color)
+        surface = self.labels.get(key)
+        if surface is None:
+            surface = self.labels[key] = self.label_font.render(text, True, color)
+        return surface
+
+    def draw(self, screen: pygame.Surface, snapshot: RenderSnapshot, level: QualityLevel = None):
+        scale = level.render_scale if level else 1.0
+        health_bars = level.health_bars if level else True
+        detail = level.detail if level else True
+        camera_x, camera_y = snapshot.camera_position()
+
+        for color, x, y, width, height, border in snapshot.rects:
+            rect = (int((x - camera_x) * scale), int((y - camera_y) * scale), int(width * scale), int(height * scale))
+            pygame.draw.rect(screen, color, rect, max(1, int(border * scale)) if border else 0)
+        if detail:
+            for text, x, y, color in snapshot.labels:
+                screen.blit(self.label(text, color),
+                            (int((x - camera_x) * scale), int((y - camera_y) * scale)))
+        for area_x, area_y, bitmap in snapshot.walls:
+            draw_walls(screen, area_x, area_y, bitmap, self.tile_size, camera_x, camera_y, scale, detail)
+
+        self.batch.draw_enemies(screen, snapshot.enemies, snapshot.enemy_colors, camera_x, camera_y, snapshot.alpha,
+                                scale, health_bars)
+        self.batch.draw_items(screen, snapshot.items, snapshot.item_colors, snapshot.item_symbols, camera_x, camera_y,
+                              scale, detail)
+
+        alpha = snapshot.alpha
+        prev_x, prev_y, x, y, health, size, heading = snapshot.player
+        screen_x = int((prev_x + (x - prev_x) * alpha - camera_x) * scale)
+        screen_y = int((prev_y + (y - prev_y) * alpha - camera_y) * scale)
+        radius = int(size * scale)
+        player_sprites.blit(screen, snapshot.player_color, radius, int(heading), screen_x, screen_y)
+
+        # Barra de vida do jogador, como Entity.draw_health_bar
+        bar_width = radius * 2
+        bar_height = max(1, int(4 * scale))
+        bar_x = screen_x - bar_width // 2
+        bar_y = screen_y - radius - int(8 * scale)
+        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, int(bar_width * health), bar_height))
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+import argparse
+import cProfile
+import hashlib
+import json
+import os
+import pstats
+import struct
+import sys
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from game_config import GameConfig
+
+LOG_MAGIC = b'PREC'
+LOG_VERSION = 1
+
+_HEADER = struct.Struct('<4sHQI')
+_FRAME = struct.Struct('<dBB')
+_KEY_COUNT = struct.Struct('<B')
+_KEY = struct.Struct('<I')
+_INPUT = struct.Struct('<BI')
+
+_KEYS_CHANGED = 0x01
+
+INPUT_KEY = 0
+INPUT_MENU = 1
+MENU_ACTIONS = ['resume', 'restart', 'main_menu', 'quit']
+
+REPLAY_MODES = ('realtime', 'fast', 'profile')
+
+Frame = Tuple[float, Set[int], List[Tuple[str, object]]]
+
+
+class ReplayFormatError(ValueError):
+    pass
+
+
+class InputRecorder:
+    """Grava semente, configuração e a entrada de cada quadro em um log binário.
+
+    Cabeçalho sem compressão; os quadros passam por zlib e só repetem o
+    conjunto de teclas pressionadas quando ele muda.
+    """
+
+    def __init__(self, filename: str, seed: int, config):
+        self.filename = filename
+        self.fp = open(filename, 'wb')
+        config_bytes = json.dumps(GameConfig.coerce(config).to_dict(), ensure_ascii=False).encode('utf-8')
+        self.fp.write(_HEADER.pack(LOG_MAGIC, LOG_VERSION, seed, len(config_bytes)))
+        self.fp.write(config_bytes)
+        self.compressor = zlib.compressobj(9)
+        self.last_keys: Optional[Set[int]] = None
+        self.frames = 0
+
+    def record_frame(self, dt: float, keys_pressed: Iterable[int], inputs: List[Tuple[str, object]]):
+        keys = set(keys_pressed)
+        encoded_inputs = []
+        for kind, value in inputs:
+            if kind == 'key':
+                encoded_inputs.append(_INPUT.pack(INPUT_KEY, value))
+            elif kind == 'menu' and value in MENU_ACTIONS:
+                encoded_inputs.append(_INPUT.pack(INPUT_MENU, MENU_ACTIONS.index(value)))
+
+        changed = keys != self.last_keys
+        parts = [_FRAME.pack(dt, _KEYS_CHANGED if changed else 0, len(encoded_inputs))]
+        if changed:
+            parts.append(_KEY_COUNT.pack(len(keys)))
+            parts.extend(_KEY.pack(key) for key in sorted(keys))
+            self.last_keys = keys
+        parts.extend(encoded_inputs)
+
+        self.fp.write(self.compressor.compress(b''.join(parts)))
+        self.frames += 1
+
+    def close(self):
+        if self.fp.closed:
+            return
+        self.fp.write(self.compressor.flush())
+        self.fp.close()
+
+
+class InputLog:
+    """Leitura incremental de um log gravado pelo InputRecorder"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ReplayFormatError("Log de replay truncado")
+            magic, version, self.seed, config_len = _HEADER.unpack(header)
+            if magic != LOG_MAGIC:
+                raise ReplayFormatError("Arquivo não é um log de replay")
+            if version != LOG_VERSION:
+                raise ReplayFormatError(f"Versão de log não suportada: {version}")
+            self.config = json.loads(f.read(config_len).decode('utf-8'))
+            self.data_offset = f.tell()
+
+    def frames(self, chunk_size: int = 64 * 1024) -> Iterator[Frame]:
+        decompressor = zlib.decompressobj()
+        buf = b''
+        pos = 0
+        keys: Set[int] = set()
+
+        with open(self.filename, 'rb') as f:
+            f.seek(self.data_offset)
+            eof = False
+
+            def need(size: int) -> bool:
+                nonlocal buf, pos, eof
+                while len(buf) - pos < size and not eof:
+                    chunk = f.read(chunk_size)
+                    if chunk:
+                        buf = buf[pos:] + decompressor.decompress(chunk)
+                    else:
+                        buf = buf[pos:] + decompressor.flush()
+                        eof = True
+                    pos = 0
+                return len(buf) - pos >= size
+
+            while need(_FRAME.size):
+                dt, flags, n_inputs = _FRAME.unpack_from(buf, pos)
+                pos += _FRAME.size
+
+                if flags & _KEYS_CHANGED:
+                    if not need(_KEY_COUNT.size):
+                        raise ReplayFormatError("Log de replay truncado")
+                    n_keys, = _KEY_COUNT.unpack_from(buf, pos)
+                    pos += _KEY_COUNT.size
+                    if not need(n_keys * _KEY.size):
+                        raise ReplayFormatError("Log de replay truncado")
+                    keys = {key for key, in _KEY.iter_unpack(buf[pos:pos + n_keys * _KEY.size])}
+                    pos += n_keys * _KEY.size
+
+                if not need(n_inputs * _INPUT.size):
+                    raise ReplayFormatError("Log de replay truncado")
+                inputs = []
+                for kind, value in _INPUT.iter_unpack(buf[pos:pos + n_inputs * _INPUT.size]):
+                    if kind == INPUT_KEY:
+                        inputs.append(('key', value))
+                    elif kind == INPUT_MENU:
+                        inputs.append(('menu', MENU_ACTIONS[value]))
+                pos += n_inputs * _INPUT.size
+
+                yield dt, set(keys), inputs
+
+
+class ReplayReport:
+    def __init__(self):
+        self.frames = 0
+        self.sim_time = 0.0
+        self.wall_time = 0.0
+        self.frame_times: List[float] = []
+        self.fingerprint = ''
+        self.final_state: Dict = {}
+        # gc_control.GCMonitor.summary() da execução
+        self.gc: Dict = {}
+
+    def percentile(self, pct: float) -> float:
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> Dict:
+        mean = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        return {
+            'frames': self.frames,
+            'sim_time': self.sim_time,
+            'wall_time': self.wall_time,
+            'frame_ms_mean': mean * 1000.0,
+            'frame_ms_p50': self.percentile(50) * 1000.0,
+            'frame_ms_p95': self.percentile(95) * 1000.0,
+            'frame_ms_max': max(self.frame_times, default=0.0) * 1000.0,
+            'fingerprint': self.fingerprint,
+            **self.gc
+        }
+
+
+def state_fingerprint(game) -> Tuple[str, Dict]:
+    """Resumo determinístico do estado, para comparar execuções do mesmo log"""
+    enemies = sorted((enemy['x'], enemy['y'], enemy['health'])
+                     for area in game.world.snapshot() for enemy in area['enemies'])
+    player = game.player
+    final_state = {
+        'player': (player.x, player.y, player.health, player.health_items, player.ammo_items),
+        'enemies': len(enemies),
+        'elapsed_time': game.elapsed_time,
+        'game_over': game.game_over,
+        'victory': game.victory
+    }
+    digest = hashlib.sha1(repr((final_state, enemies)).encode('utf-8')).hexdigest()
+    return digest, final_state
+
+
+class Replayer:
+    """Reproduz um log sobre um Game, com ou sem desenho.
+
+    Modos: 'realtime' respeita o dt gravado, 'fast' roda o mais rápido possível
+    e 'profile' roda como 'fast' sob cProfile.
+    """
+
+    def __init__(self, log: InputLog, mode: str = 'fast', headless: bool = False):
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Modo de replay inválido: {mode}")
+        import pygame
+        from game import Game
+
+        self.pygame = pygame
+        self.log = log
+        self.mode = mode
+        self.headless = headless
+        # Salvar/carregar e as capturas de perfil mexem com arquivos em disco e não são reproduzidos
+        self.skipped_keys = (pygame.K_F5, pygame.K_F9, pygame.K_F6, pygame.K_F7)
+        self.game = Game(config=log.config, seed=log.seed)
+        self.profiler: Optional[cProfile.Profile] = None
+
+    def apply_inputs(self, keys: Set[int], inputs: List[Tuple[str, object]]) -> bool:
+        game = self.game
+        for kind, value in inputs:
+            if kind == 'key':
+                if value in self.skipped_keys:
+                    continue
+                game.process_event(self.pygame.event.Event(self.pygame.KEYDOWN, key=value))
+            elif kind == 'menu':
+                if value != 'quit':
+                    game.pause_menu.hide()
+                if game.apply_menu_action(value) in ('main_menu', 'quit'):
+                    return False
+        game.keys_pressed = set(keys)
+        return game.game_running
+
+    def run(self) -> ReplayReport:
+        report = ReplayReport()
+        perf = time.perf_counter
+        if self.mode == 'profile':
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+        gc_control = self.game.gc
+        gc_control.start()
+        start = perf()
+        try:
+            for dt, keys, inputs in self.log.frames():
+                if self.mode == 'realtime':
+                    delay = start + report.sim_time - perf()
+                    if delay > 0:
+                        time.sleep(delay)
+                    self.pygame.event.pump()
+
+                frame_start = perf()
+                gc_control.begin_frame()
+                if not self.apply_inputs(keys, inputs):
+                    break
+                self.game.tick(dt)
+                if not self.headless:
+                    self.game.draw(dt)
+                report.frame_times.append(perf() - frame_start)
+                gc_control.end_frame(idle=self.game.paused or self.game.game_over)
+
+                report.frames += 1
+                report.sim_time += dt
+        finally:
+            if self.profiler:
+                self.profiler.disable()
+            gc_control.stop()
+
+        report.wall_time = perf() - start
+        report.gc = gc_control.monitor.summary()
+        report.fingerprint, report.final_state = state_fingerprint(self.game)
+        return report
+
+
+def print_report(report: ReplayReport):
+    summary = report.summary()
+    print("=" * 50)
+    print("🎬 RELATÓRIO DO REPLAY")
+    print("=" * 50)
+    print(f"🎞️  Quadros: {summary['frames']} ({summary['sim_time']:.1f}s de jogo em {summary['wall_time']:.2f}s)")
+    print(f"⏱️  Quadro: média {summary['frame_ms_mean']:.2f}ms | p50 {summary['frame_ms_p50']:.2f}ms | "
+          f"p95 {summary['frame_ms_p95']:.2f}ms | máx {summary['frame_ms_max']:.2f}ms")
+    if report.gc:
+        print(f"🗑️  GC: {report.gc['gc_pauses']} coletas, máx {report.gc['gc_ms_max']:.2f}ms | "
+              f"{report.gc['gc_frames']} dentro de quadros (máx {report.gc['gc_frame_ms_max']:.2f}ms)")
+    print(f"👤 Jogador final: {report.final_state['player']}")
+    print(f"👾 Inimigos restantes: {report.final_state['enemies']}")
+    print(f"🔑 Impressão digital: {summary['fingerprint']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduz um log de entrada gravado com main.py --record")
+    parser.add_argument("log", help="Arquivo .rec gravado")
+    parser.add_argument("--mode", choices=REPLAY_MODES, default="fast",
+                        help="realtime: respeita o tempo gravado | fast: sem espera | profile: fast + cProfile")
+    parser.add_argument("--headless", action="store_true", help="Não desenha nem abre janela")
+    parser.add_argument("--profile-out", help="Arquivo .prof para as estatísticas do modo profile")
+    parser.add_argument("--json", action="store_true", help="Imprime o resumo em JSON")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    import pygame
+    pygame.init()
+    try:
+        replayer = Replayer(InputLog(args.log), args.mode, args.headless)
+        report = replayer.run()
+    finally:
+        pygame.quit()
+
+    if args.json:
+        print(json.dumps(report.summary(), indent=2))
+    else:
+        print_report(report)
+
+    if replayer.profiler:
+        profile_out = args.profile_out or os.path.splitext(args.log)[0] + '.prof'
+        replayer.profiler.dump_stats(profile_out)
+        print(f"\n📊 Perfil salvo em: {profile_out}")
+        pstats.Stats(replayer.profiler).sort_stats('cumulative').print_stats(20)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
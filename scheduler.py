@@ -0,0 +1,179 @@
+import time
+from typing import Callable, Dict, List, Tuple
+
+from entities import Player
+from game_config import GameConfig
+from pools import enemy_pool, item_pool
+
+# Períodos, em quadros, de cada faixa de prioridade
+TIER_PERIODS = (1, 2, 4)
+
+
+class _AreaSlot:
+    __slots__ = ('pending', 'phase', 'ticks')
+
+    def __init__(self, phase: int):
+        # dt acumulado desde a última atualização da área
+        self.pending = 0.0
+        self.phase = phase
+        self.ticks = 0
+
+
+class SchedulerStats:
+    def __init__(self):
+        self.updated = 0
+        # Não era a vez da área neste quadro (escalonamento por faixa)
+        self.staggered = 0
+        # Era a vez, mas o orçamento do quadro já tinha acabado
+        self.over_budget = 0
+        self.time_ms = 0.0
+
+    def as_dict(self) -> Dict:
+        return {'updated': self.updated, 'staggered': self.staggered,
+                'over_budget': self.over_budget, 'time_ms': self.time_ms}
+
+
+class AreaScheduler:
+    """Distribui a atualização das áreas ativas entre os quadros.
+
+    Faixa 0 (área do jogador ou visível na tela) atualiza todo quadro; as
+    outras a cada 2 ou 4 quadros, defasadas em rodízio, com o dt acumulado.
+    Com orçamento (update_budget_ms > 0) as áreas das faixas 1 e 2 que não
+    couberem no quadro ficam para o seguinte, até max_lag segundos de atraso.
+    Sem orçamento o escalonamento depende só dos quadros e é determinístico.
+    """
+
+    def __init__(self, config: GameConfig):
+        self.config = config
+        self.budget_ms = config.simulation.update_budget_ms
+        self.max_lag = config.simulation.max_lag
+        self.steering_interval = config.simulation.steering_interval
+        # Área visível: janela centrada no jogador, como a câmera
+        self.view_half_width = config.game.window_width / 2
+        self.view_half_height = config.game.window_height / 2
+        self.slots: Dict[Tuple[int, int], _AreaSlot] = {}
+        self.next_phase = [0] * len(TIER_PERIODS)
+        self.frame = 0
+        self.last = SchedulerStats()
+        self.total = SchedulerStats()
+        self.perf = time.perf_counter
+
+    def reset(self):
+        self.slots.clear()
+        self.next_phase = [0] * len(TIER_PERIODS)
+
+    def tier(self, area, player: Player) -> int:
+        left = player.x - self.view_half_width
+        top = player.y - self.view_half_height
+        right = player.x + self.view_half_width
+        bottom = player.y + self.view_half_height
+        area_right = area.x + area.area_size
+        area_bottom = area.y + area.area_size
+
+        dx = max(0.0, left - area_right, area.x - right)
+        dy = max(0.0, top - area_bottom, area.y - bottom)
+        if dx == 0 and dy == 0:
+            return 0
+        return 1 if max(dx, dy) <= area.area_size else 2
+
+    def run(self, areas: List, player: Player, dt: float,
+            update_area: Callable[[object, Player, float, int], None]):
+        """Atualiza as áreas devidas neste quadro chamando update_area(area, player, dt, tick)"""
+        self.frame += 1
+        stats = SchedulerStats()
+        start = self.perf()
+        budget = self.budget_ms / 1000.0
+
+        keys = set()
+        optional = []
+        for area in areas:
+            key = (area.grid_x, area.grid_y)
+            keys.add(key)
+            tier = self.tier(area, player)
+            slot = self.slots.get(key)
+            if slot is None:
+                slot = _AreaSlot(self.next_phase[tier])
+                self.next_phase[tier] += 1
+                self.slots[key] = slot
+            slot.pending += dt
+
+            period = TIER_PERIODS[tier]
+            if tier == 0 or slot.pending >= self.max_lag:
+                self._update(area, slot, player, update_area, stats)
+            elif (self.frame + slot.phase) % period == 0:
+                optional.append((area, slot))
+            else:
+                stats.staggered += 1
+
+        for area, slot in optional:
+            if budget > 0 and self.perf() - start >= budget:
+                stats.over_budget += 1
+                continue
+            self._update(area, slot, player, update_area, stats)
+
+        # Áreas que saíram do conjunto ativo perdem o dt pendente
+        for key in [key for key in self.slots if key not in keys]:
+            del self.slots[key]
+
+        stats.time_ms = (self.perf() - start) * 1000.0
+        self.last = stats
+        self.total.updated += stats.updated
+        self.total.staggered += stats.staggered
+        self.total.over_budget += stats.over_budget
+        self.total.time_ms += stats.time_ms
+
+    def _update(self, area, slot: _AreaSlot, player: Player, update_area, stats: SchedulerStats):
+        update_area(area, player, slot.pending, slot.ticks)
+        slot.pending = 0.0
+        slot.ticks += 1
+        stats.updated += 1
+
+
+def update_entities(enemies: List, items: List, player: Player, dt: float, tick: int, steering_interval: int,
+                    field=None, collision=None):
+    """Atualiza inimigos e itens de uma área, mantendo as listas (e a ordem).
+
+    A direção de cada inimigo é recalculada a cada steering_interval
+    atualizações, em rodízio; a posição integra sempre. Com field
+    (flow_field.FlowField) a direção vem do campo em vez da linha reta; com
+    collision (collision.CollisionMap) os inimigos não entram nas paredes,
+    resolvidas de uma vez para a área inteira (CollisionMap.resolve_all).
+    """
+    alive = []
+    dead = []
+    if collision is None:
+        for index, enemy in enumerate(enemies):
+            if enemy.update(player, dt, steer=(tick + index) % steering_interval == 0, field=field):
+                alive.append(enemy)
+            else:
+                dead.append(enemy)
+    else:
+        # Com paredes o passo vai em três fases para a colisão ser resolvida
+        # em lote: todos se movem, uma chamada resolve a área, depois o contato
+        old_x = [enemy.x for enemy in enemies]
+        old_y = [enemy.y for enemy in enemies]
+        for index, enemy in enumerate(enemies):
+            enemy.advance(player, dt, steer=(tick + index) % steering_interval == 0, field=field)
+        collision.resolve_all(enemies, old_x, old_y)
+        for enemy in enemies:
+            (alive if enemy.contact(player, dt) else dead).append(enemy)
+    if dead:
+        enemies[:] = alive
+        # Mortos e coletados voltam aos pools, como em remove_enemies
+        enemy_pool.release_all(dead)
+
+    update_items(items, player)
+
+
+def update_items(items: List, player: Player):
+    """Coleta os itens tocados pelo jogador e os devolve ao item_pool"""
+    # A lista só é copiada no quadro em que algum item é coletado
+    for index, item in enumerate(items):
+        if item.collect(player):
+            kept = []
+            collected = [item]
+            for other in items[index + 1:]:
+                (collected if other.collect(player) else kept).append(other)
+            items[index:] = kept
+            item_pool.release_all(collected)
+            return
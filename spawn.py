@@ -0,0 +1,73 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from entities import Enemy, Item
+from game_config import GameConfig
+from pools import enemy_pool, item_pool
+
+# Distância mínima da borda da área para inimigos e itens gerados
+ENEMY_MARGIN = 20
+ITEM_MARGIN = 15
+
+
+def spawn_margin(config: GameConfig, margin: float, size: float) -> float:
+    """Com world.walls, o centro fica a um ladrilho mais o tamanho da
+    entidade da borda, para que ninguém nasça dentro do anel de paredes"""
+    if not config.world.walls:
+        return margin
+    return max(margin, config.world.tile_size + size)
+
+
+def area_generator(seed: int, grid_x: int, grid_y: int) -> np.random.Generator:
+    """Gerador próprio de cada área, para que o conteúdo dependa só da semente"""
+    return np.random.default_rng([seed % 2**64, grid_x, grid_y])
+
+
+class AreaSpawn:
+    """Posições iniciais de uma área, sorteadas de uma vez só.
+
+    enemies, health e ammo são matrizes (n, 2) com x e y em coordenadas do
+    mundo. Os dois backends usam as mesmas posições, então com a mesma
+    semente geram exatamente o mesmo conteúdo.
+    """
+
+    def __init__(self, config: GameConfig, seed: int, grid_x: int, grid_y: int):
+        spawn = config.spawn
+        area_size = config.world.area_size
+        counts = (spawn.enemies_per_area, spawn.health_items_per_area, spawn.ammo_items_per_area)
+        margins = np.repeat([spawn_margin(config, ENEMY_MARGIN, config.enemy.size),
+                             spawn_margin(config, ITEM_MARGIN, config.items.health.size),
+                             spawn_margin(config, ITEM_MARGIN, config.items.ammo.size)],
+                            counts).astype(float)[:, None]
+
+        # Uma chamada ao gerador para a área inteira, depois escala por linha
+        unit = area_generator(seed, grid_x, grid_y).random((sum(counts), 2))
+        origin = np.array([grid_x * area_size, grid_y * area_size], dtype=float)
+        positions = origin + margins + unit * (area_size - 2 * margins)
+
+        enemies_end = counts[0]
+        health_end = enemies_end + counts[1]
+        self.enemies = positions[:enemies_end]
+        self.health = positions[enemies_end:health_end]
+        self.ammo = positions[health_end:]
+
+    def entities(self, config: GameConfig) -> Tuple[List[Enemy], List[Item]]:
+        """Inimigos e itens já prontos, tirados dos pools (pools.py)"""
+        enemies = enemy_pool.acquire_many(self.enemies.tolist(), config.enemy)
+        items = item_pool.acquire_many(self.health.tolist(), 'health', config.items.health)
+        items.extend(item_pool.acquire_many(self.ammo.tolist(), 'ammo', config.items.ammo))
+        return enemies, items
+
+    def content(self, config: GameConfig) -> Dict:
+        """Mesmo conteúdo no formato do cache de áreas, para quem não precisa
+        de objetos (modelo agregado, snapshot de áreas fora da memória)"""
+        health = config.enemy.health
+        return {
+            'enemies': [{'x': x, 'y': y, 'health': health, 'max_health': health}
+                        for x, y in self.enemies.tolist()],
+            'items': ([{'x': x, 'y': y, 'type': 'health', 'symbol': config.items.health.symbol}
+                       for x, y in self.health.tolist()] +
+                      [{'x': x, 'y': y, 'type': 'ammo', 'symbol': config.items.ammo.symbol}
+                       for x, y in self.ammo.tolist()])
+        }
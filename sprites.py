@@ -1,7 +1,86 @@
 import pygame
 import math
 import random
-from typing import Tuple, List
+from typing import Callable, Dict, Tuple, List
+
+# Direções em que os sprites direcionais são pré-desenhados; 0 = direita, sentido horário na tela
+DIRECTIONS = 16
+DIRECTION_STEP = 2 * math.pi / DIRECTIONS
+
+
+def quantize_direction(dx: float, dy: float) -> int:
+    """Índice da direção de (dx, dy) entre as DIRECTIONS possíveis"""
+    return round(math.atan2(dy, dx) / DIRECTION_STEP) % DIRECTIONS
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
+
+
+# Entrada do teclado só tem 8 direções; o índice sai de uma tabela, sem atan2
+_INPUT_HEADINGS = {(sx, sy): quantize_direction(sx, sy) for sx in (-1, 0, 1) for sy in (-1, 0, 1) if sx or sy}
+
+
+def input_heading(dx: float, dy: float) -> int:
+    """quantize_direction para o movimento do teclado (componentes 0 ou ±k)"""
+    if dx and dy and abs(dx) != abs(dy):
+        return quantize_direction(dx, dy)
+    return _INPUT_HEADINGS[(_sign(dx), _sign(dy))]
+
+
+def darker(color: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    return tuple(channel * 200 // 255 for channel in color)
+
+
+def paint_player(surface: pygame.Surface, color: Tuple[int, int, int], radius: int, angle: float):
+    """Corpo com contorno, olhos e linha de direção virados para angle,
+    com o centro em (radius, radius)"""
+    center = (radius, radius)
+    pygame.draw.circle(surface, color, center, radius)
+    pygame.draw.circle(surface, darker(color), center, radius, 2)
+
+    eye_size = max(2, radius // 4)
+    eye_distance = radius / 2
+    for side in (-0.7, 0.7):
+        eye = (radius + int(math.cos(angle + side) * eye_distance), radius + int(math.sin(angle + side) * eye_distance))
+        pygame.draw.circle(surface, (255, 255, 255), eye, eye_size)
+        pygame.draw.circle(surface, (0, 0, 0), eye, eye_size // 2)
+
+    end = (radius + int(math.cos(angle) * radius), radius + int(math.sin(angle) * radius))
+    pygame.draw.line(surface, darker(color), center, end, 2)
+
+
+class DirectionalSprites:
+    """Sprites pré-desenhados por (cor, raio, direção), criados na primeira vez
+    que são pedidos. Desenhar uma entidade direcional vira um único blit em
+    vez de refazer olhos, contornos e seno/cosseno a cada quadro."""
+
+    def __init__(self, paint: Callable[[pygame.Surface, Tuple[int, int, int], int, float], None]):
+        self.paint = paint
+        self.sprites: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+
+    def get(self, color: Tuple[int, int, int], radius: int, heading: int) -> pygame.Surface:
+        key = (color, radius, heading)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            # Magenta como transparente, a não ser que seja a cor ou o contorno do sprite
+            transparent = next(candidate for candidate in ((255, 0, 255), (1, 2, 3))
+                               if candidate not in (color, darker(color)))
+            sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+            sprite.fill(transparent)
+            sprite.set_colorkey(transparent, pygame.RLEACCEL)
+            self.paint(sprite, color, radius, heading * DIRECTION_STEP)
+            self.sprites[key] = sprite
+        return sprite
+
+    def blit(self, screen: pygame.Surface, color: Tuple[int, int, int], radius: int, heading: int,
+             x: int, y: int):
+        screen.blit(self.get(color, radius, heading), (x - radius, y - radius))
+
+
+# Compartilhado por todos os jogos do processo, então sobrevive a Game.restart
+player_sprites = DirectionalSprites(paint_player)
+
 
 class SpriteRenderer:
     def __init__(self, config=None):
@@ -20,29 +99,9 @@ class SpriteRenderer:
             self.colors['enemy'] = tuple(config['enemy']['color'])
     
     def draw_player(self, screen: pygame.Surface, x: int, y: int, size: int, direction: float = 0):
-        """Desenha o jogador com visual melhorado"""
-        body_rect = pygame.Rect(x - size//2, y - size//2, size, size)
-        pygame.draw.ellipse(screen, self.colors['player'], body_rect)
-        
-        pygame.draw.ellipse(screen, (0, 200, 0), body_rect, 2)
-        
-        eye_size = max(2, size // 8)
-        eye_offset = size // 4
-        
-        left_eye_x = x - eye_offset
-        left_eye_y = y - eye_offset
-        pygame.draw.circle(screen, (255, 255, 255), (left_eye_x, left_eye_y), eye_size)
-        pygame.draw.circle(screen, (0, 0, 0), (left_eye_x, left_eye_y), eye_size//2)
-        
-        right_eye_x = x + eye_offset
-        right_eye_y = y - eye_offset
-        pygame.draw.circle(screen, (255, 255, 255), (right_eye_x, right_eye_y), eye_size)
-        pygame.draw.circle(screen, (0, 0, 0), (right_eye_x, right_eye_y), eye_size//2)
-        
-        if direction != 0:
-            end_x = x + int(math.cos(direction) * size//2)
-            end_y = y + int(math.sin(direction) * size//2)
-            pygame.draw.line(screen, (0, 200, 0), (x, y), (end_x, end_y), 2)
+        """Desenha o jogador com visual melhorado, a partir dos sprites pré-desenhados"""
+        heading = round(direction / DIRECTION_STEP) % DIRECTIONS
+        player_sprites.blit(screen, self.colors['player'], size // 2, heading, x, y)
     
     def draw_enemy(self, screen: pygame.Surface, x: int, y: int, size: int, health: int, max_health: int):
         """Desenha inimigo com visual melhorado"""
@@ -0,0 +1,41 @@
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+
+class StartupTimer:
+    """Marca as etapas da inicialização a partir de um instante de referência
+    (normalmente o início de main.main)"""
+
+    def __init__(self, start: Optional[float] = None):
+        self.start = start if start is not None else time.perf_counter()
+        # (etapa, início relativo, duração), em segundos
+        self.steps: List[Tuple[str, float, float]] = []
+
+    @contextmanager
+    def measure(self, name: str):
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.steps.append((name, begin - self.start, end - begin))
+
+    def mark(self, name: str):
+        """Registra um instante sem duração (ex.: primeiro quadro desenhado)"""
+        self.steps.append((name, time.perf_counter() - self.start, 0.0))
+
+    def get(self, name: str) -> Optional[Tuple[float, float]]:
+        for step, offset, duration in self.steps:
+            if step == name:
+                return offset, duration
+        return None
+
+    def report(self) -> str:
+        lines = ["⏱️  Inicialização (a partir de main.main):"]
+        for name, offset, duration in self.steps:
+            if duration:
+                lines.append(f"   {name:<14} {duration * 1000.0:8.1f}ms  (t+{offset * 1000.0:.1f}ms)")
+            else:
+                lines.append(f"   {name:<14} {'':>10}  (t+{offset * 1000.0:.1f}ms)")
+        return "\n".join(lines)
@@ -0,0 +1,176 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from state_stream import iter_save_records
+
+AreaKey = Tuple[int, int]
+
+# Faixas de saúde relativa (health / max_health) usadas nos histogramas
+HEALTH_BINS = 4
+HEALTH_BIN_LABELS = ['0-25%', '25-50%', '50-75%', '75-100%']
+
+
+def _health_bin(health: float, max_health: float) -> int:
+    if max_health <= 0:
+        return 0
+    ratio = max(0.0, min(1.0, health / max_health))
+    return min(HEALTH_BINS - 1, int(ratio * HEALTH_BINS))
+
+
+def summarize_save(filename: str) -> Dict:
+    """Resume um save em contagens por área, lendo-o de forma incremental.
+
+    O resumo tem tamanho proporcional ao número de áreas, nunca ao número de
+    inimigos, e é o que trafega entre os processos do pool.
+    """
+    summary = {'file': filename, 'error': None, 'player': {}, 'areas': {}}
+    try:
+        area = None
+        for kind, data in iter_save_records(filename):
+            if kind == 'player':
+                summary['player'] = data
+            elif kind == 'area':
+                key = (data.get('grid_x', 0), data.get('grid_y', 0))
+                area = {
+                    'active': bool(data.get('active', False)),
+                    'enemies': 0,
+                    'health_sum': 0.0,
+                    'health_hist': [0] * HEALTH_BINS,
+                    'items': {}
+                }
+                summary['areas'][key] = area
+            elif kind == 'enemy':
+                health = data.get('health', 0)
+                area['enemies'] += 1
+                area['health_sum'] += health
+                area['health_hist'][_health_bin(health, data.get('max_health', 0))] += 1
+            elif kind == 'item':
+                item_type = data.get('item_type', data.get('type', '?'))
+                area['items'][item_type] = area['items'].get(item_type, 0) + 1
+    except Exception as e:
+        summary['error'] = str(e)
+    return summary
+
+
+def iter_summaries(files: List[str], workers: Optional[int] = None) -> Iterator[Dict]:
+    """Resume vários saves em paralelo, devolvendo os resumos na ordem dos arquivos"""
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(files))
+    if workers <= 1:
+        for filename in files:
+            yield summarize_save(filename)
+        return
+
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(summarize_save, files, chunksize=chunksize)
+
+
+class AreaStats:
+    def __init__(self):
+        self.saves = 0
+        self.active = 0
+        self.enemies_total = 0
+        self.enemies_min: Optional[int] = None
+        self.enemies_max = 0
+        self.health_sum = 0.0
+        self.health_hist = [0] * HEALTH_BINS
+        self.items: Dict[str, int] = {}
+
+    def add(self, area: Dict):
+        self.saves += 1
+        self.active += 1 if area['active'] else 0
+        self.enemies_total += area['enemies']
+        self.enemies_min = area['enemies'] if self.enemies_min is None else min(self.enemies_min, area['enemies'])
+        self.enemies_max = max(self.enemies_max, area['enemies'])
+        self.health_sum += area['health_sum']
+        for i, count in enumerate(area['health_hist']):
+            self.health_hist[i] += count
+        for item_type, count in area['items'].items():
+            self.items[item_type] = self.items.get(item_type, 0) + count
+
+    @property
+    def mean_enemies(self) -> float:
+        return self.enemies_total / self.saves if self.saves else 0.0
+
+    @property
+    def mean_health(self) -> float:
+        return self.health_sum / self.enemies_total if self.enemies_total else 0.0
+
+
+class SaveAggregate:
+    """Acumula resumos de saves sem guardar os resumos individuais"""
+
+    def __init__(self):
+        self.files = 0
+        self.errors: List[Tuple[str, str]] = []
+        self.areas: Dict[AreaKey, AreaStats] = {}
+        self.player_health_hist = [0] * HEALTH_BINS
+
+    def add(self, summary: Dict):
+        if summary['error']:
+            self.errors.append((summary['file'], summary['error']))
+            return
+
+        self.files += 1
+        player = summary['player']
+        if player:
+            self.player_health_hist[_health_bin(player.get('health', 0), player.get('max_health', 0))] += 1
+
+        for key, area in summary['areas'].items():
+            self.areas.setdefault(key, AreaStats()).add(area)
+
+    @property
+    def item_types(self) -> List[str]:
+        types = set()
+        for stats in self.areas.values():
+            types.update(stats.items)
+        return sorted(types)
+
+    @property
+    def health_hist(self) -> List[int]:
+        total = [0] * HEALTH_BINS
+        for stats in self.areas.values():
+            for i, count in enumerate(stats.health_hist):
+                total[i] += count
+        return total
+
+
+def aggregate_saves(files: Iterable[str], workers: Optional[int] = None) -> SaveAggregate:
+    aggregate = SaveAggregate()
+    for summary in iter_summaries(list(files), workers):
+        aggregate.add(summary)
+    return aggregate
+
+
+def diff_saves(file_a: str, file_b: str, workers: Optional[int] = None) -> Dict:
+    """Calcula as diferenças por área entre dois saves (B - A)"""
+    summary_a, summary_b = iter_summaries([file_a, file_b], workers)
+    for summary in (summary_a, summary_b):
+        if summary['error']:
+            raise ValueError(f"{summary['file']}: {summary['error']}")
+
+    empty = {'active': False, 'enemies': 0, 'health_sum': 0.0, 'health_hist': [0] * HEALTH_BINS, 'items': {}}
+    areas = {}
+    for key in sorted(set(summary_a['areas']) | set(summary_b['areas'])):
+        a = summary_a['areas'].get(key, empty)
+        b = summary_b['areas'].get(key, empty)
+        mean_a = a['health_sum'] / a['enemies'] if a['enemies'] else 0.0
+        mean_b = b['health_sum'] / b['enemies'] if b['enemies'] else 0.0
+        item_types = set(a['items']) | set(b['items'])
+        areas[key] = {
+            'enemies_a': a['enemies'],
+            'enemies_b': b['enemies'],
+            'enemies_delta': b['enemies'] - a['enemies'],
+            'mean_health_delta': mean_b - mean_a,
+            'items_delta': {t: b['items'].get(t, 0) - a['items'].get(t, 0) for t in sorted(item_types)},
+            'active_a': a['active'],
+            'active_b': b['active']
+        }
+
+    player_a, player_b = summary_a['player'], summary_b['player']
+    player = {field: player_b.get(field, 0) - player_a.get(field, 0)
+              for field in ('x', 'y', 'health', 'health_items', 'ammo_items')}
+
+    return {'areas': areas, 'player': player}
@@ -0,0 +1,441 @@
+import json
+import os
+import re
+import struct
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# Registros emitidos pelos leitores incrementais. Todos os formatos produzem a
+# mesma sequência, de modo que quem consome não precisa saber a origem:
+#   ('metadata', dict), ('player', dict), ('config', dict)
+#   ('area', {'index', 'grid_x', 'grid_y', 'active', ...})
+#   ('enemy', dict), ('item', dict)
+#   ('area_end', {'index', 'enemies', 'items'})
+Record = Tuple[str, Any]
+
+CHUNK_SIZE = 64 * 1024
+
+BINARY_MAGIC = b'PSAV'
+BINARY_VERSION = 1
+BINARY_EXTENSIONS = ('.sav',)
+
+_HEADER = struct.Struct('<4sH')
+_BLOCK = struct.Struct('<cI')
+_PLAYER = struct.Struct('<ddiiii')
+_AREA = struct.Struct('<iiBII')
+_ENEMY = struct.Struct('<ddii')
+_ITEM = struct.Struct('<ddH')
+_ITEM_TYPE = struct.Struct('<H')
+
+# Quantos registros de inimigo/item são lidos do disco por vez no formato binário
+_RECORDS_PER_READ = 1024
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# JSON incremental
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r"""
+    [\s,:]*
+    (?:
+        (?P<punct>[{}\[\]])
+      | (?P<string>"(?:[^"\\]|\\.)*")
+      | (?P<number>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?)
+      | (?P<literal>true|false|null)
+    )
+""", re.VERBOSE)
+
+_SEPARATORS_RE = re.compile(r'[\s,:]*')
+
+_LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+class JsonEventReader:
+    """Lê JSON em blocos, sem montar o documento inteiro.
+
+    `next_event` devolve eventos no estilo SAX (start_map, map_key, end_map,
+    start_array, end_array, value) e `read_value` decodifica de uma vez o
+    próximo valor completo, usado para subárvores pequenas como um inimigo.
+    A memória fica limitada ao tamanho do bloco mais o maior valor lido.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+        # Pilha de contêineres: [tipo, esperando_chave]
+        self.stack: List[list] = []
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def _expecting_key(self) -> bool:
+        return bool(self.stack) and self.stack[-1][0] == 'map' and self.stack[-1][1]
+
+    def _value_done(self):
+        if self.stack and self.stack[-1][0] == 'map':
+            self.stack[-1][1] = True
+
+    def next_event(self) -> Optional[Tuple[str, Any]]:
+        while True:
+            match = _TOKEN_RE.match(self.buf, self.pos)
+            incomplete = match is None or (
+                match.lastgroup == 'number' and
+                (match.end() == len(self.buf) or self.buf[match.end()] in '.eE+-')
+            )
+            if not incomplete or not self._fill():
+                break
+
+        if match is None:
+            if self.buf[self.pos:].strip(' \t\r\n,:'):
+                raise SaveFormatError(f"JSON inválido perto de: {self.buf[self.pos:self.pos + 40]!r}")
+            if self.stack:
+                raise SaveFormatError("JSON truncado")
+            return None
+
+        self.pos = match.end()
+        kind = match.lastgroup
+        token = match.group(kind)
+
+        if kind == 'punct':
+            if token in '{[':
+                self.stack.append(['map' if token == '{' else 'array', token == '{'])
+                return ('start_map' if token == '{' else 'start_array', None)
+            if not self.stack:
+                raise SaveFormatError(f"'{token}' inesperado")
+            closed = self.stack.pop()
+            if (token == '}') != (closed[0] == 'map'):
+                raise SaveFormatError(f"'{token}' não fecha o contêiner aberto")
+            self._value_done()
+            return ('end_map' if token == '}' else 'end_array', None)
+
+        if kind == 'string':
+            value = json.loads(token)
+        elif kind == 'number':
+            value = float(token) if any(c in token for c in '.eE') else int(token)
+        else:
+            value = _LITERALS[token]
+
+        if self._expecting_key():
+            if kind != 'string':
+                raise SaveFormatError(f"Chave inválida: {token!r}")
+            self.stack[-1][1] = False
+            return ('map_key', value)
+        self._value_done()
+        return ('value', value)
+
+    def read_value(self) -> Any:
+        """Decodifica o próximo valor inteiro (escalar, objeto ou lista)"""
+        while True:
+            self.pos = _SEPARATORS_RE.match(self.buf, self.pos).end()
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise SaveFormatError(f"JSON inválido perto de: {self.buf[self.pos:self.pos + 40]!r}")
+            if end == len(self.buf) and not isinstance(value, (dict, list, str)) and self._fill():
+                continue
+            self.pos = end
+            self._value_done()
+            return value
+
+    def peek_char(self) -> str:
+        """Próximo caractere significativo, sem consumi-lo"""
+        while True:
+            self.pos = _SEPARATORS_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+
+def _iter_json_entries(reader: JsonEventReader) -> Iterator[Any]:
+    """Percorre os elementos de uma lista já aberta, um valor por vez"""
+    while reader.peek_char() != ']':
+        yield reader.read_value()
+    reader.next_event()
+
+
+def _iter_json_area(index: int, reader: JsonEventReader) -> Iterator[Record]:
+    header: Dict[str, Any] = {'index': index}
+    header_sent = False
+    counts = {'enemies': 0, 'items': 0}
+
+    while True:
+        event = reader.next_event()
+        if event is None or event[0] == 'end_map':
+            break
+        key = event[1]
+
+        if key in counts and reader.peek_char() == '[':
+            if not header_sent:
+                header_sent = True
+                yield ('area', header)
+            reader.next_event()
+            kind = 'enemy' if key == 'enemies' else 'item'
+            for entry in _iter_json_entries(reader):
+                counts[key] += 1
+                yield (kind, entry)
+        else:
+            header[key] = reader.read_value()
+
+    if not header_sent:
+        yield ('area', header)
+    yield ('area_end', {'index': index, 'enemies': counts['enemies'], 'items': counts['items']})
+
+
+def iter_json_records(filename: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Record]:
+    """Lê um save JSON incrementalmente, área por área"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        reader = JsonEventReader(f, chunk_size)
+        if reader.next_event() != ('start_map', None):
+            raise SaveFormatError("O save deve ser um objeto JSON")
+
+        while True:
+            event = reader.next_event()
+            if event is None or event[0] == 'end_map':
+                return
+            key = event[1]
+
+            if key == 'areas' and reader.peek_char() == '[':
+                reader.next_event()
+                index = 0
+                while reader.peek_char() != ']':
+                    if reader.next_event() != ('start_map', None):
+                        raise SaveFormatError("Cada área deve ser um objeto")
+                    yield from _iter_json_area(index, reader)
+                    index += 1
+                reader.next_event()
+            elif key in ('metadata', 'player', 'config'):
+                yield (key, reader.read_value())
+            else:
+                reader.read_value()
+
+
+# ---------------------------------------------------------------------------
+# Formato binário
+# ---------------------------------------------------------------------------
+
+class BinarySaveWriter:
+    """Escreve saves no formato binário (.sav), bloco a bloco.
+
+    Metadados, jogador e configuração vão como JSON em blocos com tamanho;
+    inimigos e itens são registros de tamanho fixo, o que permite ler uma área
+    sem carregar as demais.
+    """
+
+    def __init__(self, fp: BinaryIO):
+        self.fp = fp
+        self.item_types: Dict[Tuple[str, str], int] = {}
+        self.fp.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION))
+
+    def _write_block(self, tag: bytes, payload: bytes):
+        self.fp.write(_BLOCK.pack(tag, len(payload)))
+        self.fp.write(payload)
+
+    def _write_json(self, tag: bytes, data: Dict):
+        self._write_block(tag, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def write_metadata(self, metadata: Dict):
+        self._write_json(b'M', metadata)
+
+    def write_config(self, config: Dict):
+        self._write_json(b'C', config)
+
+    def write_player(self, player: Dict):
+        self._write_block(b'P', _PLAYER.pack(
+            player.get('x', 0.0), player.get('y', 0.0),
+            int(player.get('health', 0)), int(player.get('max_health', 0)),
+            int(player.get('health_items', 0)), int(player.get('ammo_items', 0))
+        ))
+
+    def write_area(self, area: Dict):
+        enemies = area.get('enemies', [])
+        items = area.get('items', [])
+
+        codes = []
+        for item in items:
+            key = (item.get('item_type', item.get('type', '')), item.get('symbol', '?'))
+            if key not in self.item_types:
+                code = len(self.item_types)
+                self.item_types[key] = code
+                self._write_block(b'T', _ITEM_TYPE.pack(code) + json.dumps(list(key), ensure_ascii=False).encode('utf-8'))
+            codes.append(self.item_types[key])
+
+        payload = [_AREA.pack(area.get('grid_x', 0), area.get('grid_y', 0),
+                              1 if area.get('active', False) else 0, len(enemies), len(items))]
+        payload.extend(_ENEMY.pack(e['x'], e['y'], int(e['health']), int(e['max_health'])) for e in enemies)
+        payload.extend(_ITEM.pack(item['x'], item['y'], code) for item, code in zip(items, codes))
+        self._write_block(b'A', b''.join(payload))
+
+    def close(self):
+        self._write_block(b'E', b'')
+
+
+def write_binary_save(filename: str, metadata: Dict, player: Dict, areas: Iterable[Dict], config: Dict):
+    with open(filename, 'wb') as f:
+        writer = BinarySaveWriter(f)
+        writer.write_metadata(metadata)
+        writer.write_player(player)
+        for area in areas:
+            writer.write_area(area)
+        writer.write_config(config)
+        writer.close()
+
+
+def _read_exact(fp: BinaryIO, size: int) -> bytes:
+    data = fp.read(size)
+    if len(data) != size:
+        raise SaveFormatError("Save binário truncado")
+    return data
+
+
+def iter_binary_records(filename: str) -> Iterator[Record]:
+    """Lê um save binário incrementalmente, área por área"""
+    with open(filename, 'rb') as f:
+        magic, version = _HEADER.unpack(_read_exact(f, _HEADER.size))
+        if magic != BINARY_MAGIC:
+            raise SaveFormatError("Arquivo não é um save binário")
+        if version != BINARY_VERSION:
+            raise SaveFormatError(f"Versão de save não suportada: {version}")
+
+        item_types: Dict[int, Tuple[str, str]] = {}
+        index = 0
+
+        while True:
+            tag, length = _BLOCK.unpack(_read_exact(f, _BLOCK.size))
+
+            if tag == b'E':
+                return
+            if tag in (b'M', b'C'):
+                data = json.loads(_read_exact(f, length).decode('utf-8'))
+                yield ('metadata' if tag == b'M' else 'config', data)
+            elif tag == b'P':
+                x, y, health, max_health, health_items, ammo_items = _PLAYER.unpack(_read_exact(f, length))
+                yield ('player', {
+                    'x': x, 'y': y, 'health': health, 'max_health': max_health,
+                    'health_items': health_items, 'ammo_items': ammo_items
+                })
+            elif tag == b'T':
+                payload = _read_exact(f, length)
+                code, = _ITEM_TYPE.unpack_from(payload)
+                item_types[code] = tuple(json.loads(payload[_ITEM_TYPE.size:].decode('utf-8')))
+            elif tag == b'A':
+                grid_x, grid_y, active, n_enemies, n_items = _AREA.unpack(_read_exact(f, _AREA.size))
+                yield ('area', {'index': index, 'grid_x': grid_x, 'grid_y': grid_y, 'active': bool(active)})
+
+                for batch in _iter_struct_batches(f, _ENEMY, n_enemies):
+                    for x, y, health, max_health in batch:
+                        yield ('enemy', {'x': x, 'y': y, 'health': health, 'max_health': max_health})
+
+                for batch in _iter_struct_batches(f, _ITEM, n_items):
+                    for x, y, code in batch:
+                        item_type, symbol = item_types.get(code, ('?', '?'))
+                        yield ('item', {'x': x, 'y': y, 'item_type': item_type, 'symbol': symbol})
+
+                yield ('area_end', {'index': index, 'enemies': n_enemies, 'items': n_items})
+                index += 1
+            else:
+                f.seek(length, os.SEEK_CUR)
+
+
+def _iter_struct_batches(fp: BinaryIO, record: struct.Struct, count: int):
+    remaining = count
+    while remaining > 0:
+        n = min(remaining, _RECORDS_PER_READ)
+        yield record.iter_unpack(_read_exact(fp, n * record.size))
+        remaining -= n
+
+
+# ---------------------------------------------------------------------------
+# Entrada comum
+# ---------------------------------------------------------------------------
+
+def is_binary_save(filename: str) -> bool:
+    if filename.endswith(BINARY_EXTENSIONS):
+        return True
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        return False
+
+
+def iter_save_records(filename: str) -> Iterator[Record]:
+    """Escolhe o leitor incremental adequado ao arquivo"""
+    if is_binary_save(filename):
+        return iter_binary_records(filename)
+    if filename.endswith('.json'):
+        return iter_json_records(filename)
+    raise SaveFormatError("Leitura incremental disponível apenas para .json e .sav")
+
+
+def read_metadata(filename: str) -> Optional[Dict]:
+    """Retorna os metadados sem ler o restante do save (quando vêm primeiro)"""
+    records = iter_save_records(filename)
+    try:
+        for kind, data in records:
+            if kind == 'metadata':
+                return data
+            if kind == 'area':
+                break
+        return None
+    finally:
+        records.close()
+
+
+def iter_state_records(metadata: Dict, player: Dict, areas: Iterable[Dict], config: Dict) -> Iterator[Record]:
+    """Converte um estado já carregado na mesma sequência de registros"""
+    yield ('metadata', metadata)
+    yield ('player', player)
+    for index, area in enumerate(areas):
+        header = {key: value for key, value in area.items() if key not in ('enemies', 'items')}
+        header['index'] = index
+        yield ('area', header)
+        enemies = area.get('enemies', [])
+        items = area.get('items', [])
+        for enemy in enemies:
+            yield ('enemy', enemy)
+        for item in items:
+            yield ('item', item)
+        yield ('area_end', {'index': index, 'enemies': len(enemies), 'items': len(items)})
+    yield ('config', config)
+
+
+def convert_save(source: str, target: str):
+    """Converte um save para o formato binário mantendo apenas uma área na memória"""
+    with open(target, 'wb') as f:
+        writer = BinarySaveWriter(f)
+        area: Optional[Dict] = None
+        config: Dict = {}
+
+        for kind, data in iter_save_records(source):
+            if kind == 'metadata':
+                writer.write_metadata(data)
+            elif kind == 'player':
+                writer.write_player(data)
+            elif kind == 'area':
+                area = dict(data, enemies=[], items=[])
+            elif kind == 'enemy':
+                area['enemies'].append(data)
+            elif kind == 'item':
+                area['items'].append(data)
+            elif kind == 'area_end':
+                writer.write_area(area)
+                area = None
+            elif kind == 'config':
+                config = data
+
+        writer.write_config(config)
+        writer.close()
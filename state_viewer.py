@@ -1,72 +1,118 @@
 #!/usr/bin/env python3
+import glob
 import json
 import yaml
 import os
 import sys
+from typing import Dict, Iterable, List, Optional, Tuple
 from game_state import GameState, create_preset_scenario, generate_random_scenario
+from state_stats import HEALTH_BIN_LABELS, aggregate_saves, diff_saves
+from state_stream import Record, SaveFormatError, convert_save, iter_save_records, iter_state_records, read_metadata
 
-def print_state_info(state: GameState):
+def print_state_info(state: GameState, area_filter: Optional[Tuple[int, int]] = None, limit: int = 3):
+    records = iter_state_records(state.metadata, state.player_data, state.areas_data, state.game_config)
+    print_records(records, area_filter, limit)
+
+def print_records(records: Iterable[Record], area_filter: Optional[Tuple[int, int]] = None, limit: int = 3):
+    """Imprime o estado à medida que os registros chegam, sem guardar as áreas"""
     print("=" * 50)
     print("📊 INFORMAÇÕES DO ESTADO DO JOGO")
     print("=" * 50)
     
-    print(f"⏰ Timestamp: {state.metadata.get('timestamp', 'N/A')}")
-    print(f"🎯 Áreas ativas: {state.metadata.get('active_areas_count', 'N/A')}")
-    print(f"👾 Total de inimigos: {state.metadata.get('total_enemies', 'N/A')}")
-    print(f"📦 Total de itens: {state.metadata.get('total_items', 'N/A')}")
-    
-    print("\n👤 JOGADOR:")
-    print(f"   Posição: ({state.player_data.get('x', 0):.1f}, {state.player_data.get('y', 0):.1f})")
-    print(f"   Saúde: {state.player_data.get('health', 0)}/{state.player_data.get('max_health', 0)}")
-    print(f"   Itens de saúde: {state.player_data.get('health_items', 0)}")
-    print(f"   Itens de munição: {state.player_data.get('ammo_items', 0)}")
-    
-    print("\n🗺️  ÁREAS:")
-    for i, area in enumerate(state.areas_data):
-        status = "✅ ATIVA" if area.get('active', False) else "❌ INATIVA"
-        print(f"   Área {i+1} ({area.get('grid_x', 0)},{area.get('grid_y', 0)}): {status}")
-        print(f"      Inimigos: {len(area.get('enemies', []))}")
-        print(f"      Itens: {len(area.get('items', []))}")
+    areas_title_printed = False
+    visible = False
+    listing = None
+    shown = 0
+    counts: Dict[str, int] = {}
+    
+    def close_listing(total: int):
+        if visible and listing and limit > 0 and total > shown:
+            print(f"         ... e mais {total - shown} {listing}")
+    
+    for kind, data in records:
+        if kind == 'metadata':
+            print(f"⏰ Timestamp: {data.get('timestamp', 'N/A')}")
+            print(f"🎯 Áreas ativas: {data.get('active_areas_count', 'N/A')}")
+            print(f"👾 Total de inimigos: {data.get('total_enemies', 'N/A')}")
+            print(f"📦 Total de itens: {data.get('total_items', 'N/A')}")
+        
+        elif kind == 'player':
+            print("\n👤 JOGADOR:")
+            print(f"   Posição: ({data.get('x', 0):.1f}, {data.get('y', 0):.1f})")
+            print(f"   Saúde: {data.get('health', 0)}/{data.get('max_health', 0)}")
+            print(f"   Itens de saúde: {data.get('health_items', 0)}")
+            print(f"   Itens de munição: {data.get('ammo_items', 0)}")
+        
+        elif kind == 'area':
+            if not areas_title_printed:
+                print("\n🗺️  ÁREAS:")
+                areas_title_printed = True
+            
+            coords = (data.get('grid_x', 0), data.get('grid_y', 0))
+            visible = area_filter is None or coords == area_filter
+            listing = None
+            counts = {'inimigos': 0, 'itens': 0}
+            if visible:
+                status = "✅ ATIVA" if data.get('active', False) else "❌ INATIVA"
+                print(f"   Área {data['index'] + 1} ({coords[0]},{coords[1]}): {status}")
         
-        enemies = area.get('enemies', [])
-        if enemies:
-            print("      👾 Inimigos:")
-            for j, enemy in enumerate(enemies[:3]):
-                print(f"         {j+1}. Pos: ({enemy.get('x', 0):.1f}, {enemy.get('y', 0):.1f}) Saúde: {enemy.get('health', 0)}")
-            if len(enemies) > 3:
-                print(f"         ... e mais {len(enemies) - 3} inimigos")
+        elif kind in ('enemy', 'item'):
+            name = 'inimigos' if kind == 'enemy' else 'itens'
+            if listing != name:
+                close_listing(counts.get(listing, 0))
+                listing = name
+                shown = 0
+                if visible and limit > 0:
+                    print("      👾 Inimigos:" if kind == 'enemy' else "      📦 Itens:")
+            counts[name] += 1
+            
+            if visible and shown < limit:
+                shown += 1
+                if kind == 'enemy':
+                    print(f"         {shown}. Pos: ({data.get('x', 0):.1f}, {data.get('y', 0):.1f}) Saúde: {data.get('health', 0)}")
+                else:
+                    print(f"         {shown}. {data.get('symbol', '?')} Pos: ({data.get('x', 0):.1f}, {data.get('y', 0):.1f})")
         
-        items = area.get('items', [])
-        if items:
-            print("      📦 Itens:")
-            for j, item in enumerate(items[:3]):
-                print(f"         {j+1}. {item.get('symbol', '?')} Pos: ({item.get('x', 0):.1f}, {item.get('y', 0):.1f})")
-            if len(items) > 3:
-                print(f"         ... e mais {len(items) - 3} itens")
+        elif kind == 'area_end':
+            close_listing(counts.get(listing, 0))
+            listing = None
+            if visible:
+                print(f"      Inimigos: {data['enemies']}")
+                print(f"      Itens: {data['items']}")
+                if area_filter is not None:
+                    break
+
+def load_state_file(filename: str) -> GameState:
+    state = GameState()
+    if filename.endswith('.json'):
+        state.load_from_json(filename)
+    elif filename.endswith(('.yaml', '.yml')):
+        state.load_from_yaml(filename)
+    else:
+        state.load_from_binary(filename)
+    return state
 
 def list_saved_states():
-    json_files = [f for f in os.listdir('.') if f.endswith('.json') and 'state' in f]
-    yaml_files = [f for f in os.listdir('.') if f.endswith('.yaml') and 'state' in f]
+    state_files = [f for f in os.listdir('.') if f.endswith(('.json', '.yaml', '.sav')) and 'state' in f]
     
     print("💾 ESTADOS SALVOS:")
     print("=" * 30)
     
-    if not json_files and not yaml_files:
+    if not state_files:
         print("   Nenhum estado salvo encontrado.")
         return []
     
     all_files = []
-    for file in json_files + yaml_files:
+    for file in sorted(state_files):
         try:
-            state = GameState()
-            if file.endswith('.json'):
-                state.load_from_json(file)
+            if file.endswith('.yaml'):
+                metadata = load_state_file(file).metadata
             else:
-                state.load_from_yaml(file)
+                metadata = read_metadata(file) or {}
             
-            timestamp = state.metadata.get('timestamp', 0)
-            enemies = state.metadata.get('total_enemies', 0)
-            areas = state.metadata.get('active_areas_count', 0)
+            timestamp = metadata.get('timestamp', 0)
+            enemies = metadata.get('total_enemies', 0)
+            areas = metadata.get('active_areas_count', 0)
             
             print(f"   📄 {file}")
             print(f"      ⏰ {timestamp:.1f}s | 👾 {enemies} inimigos | 🎯 {areas} áreas ativas")
@@ -76,6 +122,86 @@ def list_saved_states():
     
     return all_files
 
+def print_aggregate_stats(files: List[str], workers: Optional[int] = None):
+    aggregate = aggregate_saves(files, workers)
+    item_types = aggregate.item_types
+    
+    print("=" * 70)
+    print(f"📈 ESTATÍSTICAS DE {aggregate.files} SAVES")
+    print("=" * 70)
+    
+    header = f"{'Área':<8}{'Saves':>6}{'Inim. média':>13}{'Mín':>6}{'Máx':>6}{'Ativa %':>9}{'Saúde média':>13}"
+    header += ''.join(f"{item_type:>9}" for item_type in item_types)
+    print(header)
+    print("-" * len(header))
+    
+    for (grid_x, grid_y), stats in sorted(aggregate.areas.items()):
+        active_pct = 100.0 * stats.active / stats.saves
+        line = (f"{f'({grid_x},{grid_y})':<8}{stats.saves:>6}{stats.mean_enemies:>13.1f}"
+                f"{stats.enemies_min or 0:>6}{stats.enemies_max:>6}{active_pct:>9.1f}{stats.mean_health:>13.1f}")
+        line += ''.join(f"{stats.items.get(item_type, 0):>9}" for item_type in item_types)
+        print(line)
+    
+    print_health_histogram("👾 Saúde dos inimigos", aggregate.health_hist)
+    print_health_histogram("👤 Saúde do jogador", aggregate.player_health_hist)
+    
+    for filename, error in aggregate.errors:
+        print(f"❌ {filename} (erro: {error})")
+
+def print_health_histogram(title: str, hist: List[int]):
+    total = sum(hist)
+    print(f"\n{title}:")
+    for label, count in zip(HEALTH_BIN_LABELS, hist):
+        pct = 100.0 * count / total if total else 0.0
+        print(f"   {label:>8} {'█' * int(pct / 2):<50} {count} ({pct:.1f}%)")
+
+def print_save_diff(file_a: str, file_b: str):
+    diff = diff_saves(file_a, file_b)
+    
+    print("=" * 70)
+    print(f"🔍 DIFERENÇAS: {file_a} → {file_b}")
+    print("=" * 70)
+    
+    player = diff['player']
+    print(f"👤 Jogador: Δpos ({player['x']:+.1f}, {player['y']:+.1f}) | Δsaúde {player['health']:+} | "
+          f"Δ➕ {player['health_items']:+} | Δ⚡ {player['ammo_items']:+}")
+    
+    header = f"\n{'Área':<8}{'Inimigos A':>12}{'Inimigos B':>12}{'Δ':>7}{'Δ saúde média':>15}  Δ itens"
+    print(header)
+    print("-" * len(header))
+    for (grid_x, grid_y), area in diff['areas'].items():
+        status = '' if area['active_a'] == area['active_b'] else ('  (ativada)' if area['active_b'] else '  (desativada)')
+        items = ', '.join(f"{item_type} {delta:+}" for item_type, delta in area['items_delta'].items() if delta) or '-'
+        print(f"{f'({grid_x},{grid_y})':<8}{area['enemies_a']:>12}{area['enemies_b']:>12}"
+              f"{area['enemies_delta']:>+7}{area['mean_health_delta']:>+15.1f}  {items}{status}")
+
+def expand_save_patterns(patterns: List[str]) -> List[str]:
+    files = []
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        files.extend(f for f in sorted(matches) if os.path.isfile(f))
+    return files
+
+def parse_options(args: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Separa argumentos posicionais de opções no formato --nome valor"""
+    positional = []
+    options = {}
+    i = 0
+    while i < len(args):
+        if args[i].startswith('--'):
+            if i + 1 >= len(args):
+                raise ValueError(f"Opção {args[i]} precisa de um valor")
+            options[args[i][2:]] = args[i + 1]
+            i += 2
+        else:
+            positional.append(args[i])
+            i += 1
+    return positional, options
+
+def parse_area(value: str) -> Tuple[int, int]:
+    x, y = value.split(',')
+    return int(x), int(y)
+
 def create_scenario_file(scenario_name: str, filename: str):
     if scenario_name == 'random':
         config = generate_random_scenario()
@@ -101,6 +227,10 @@ def main():
         print("Uso:")
         print("  python state_viewer.py list                    # Listar estados salvos")
         print("  python state_viewer.py view <arquivo>          # Visualizar estado")
+        print("       [--area x,y] [--limit N]                  # Filtrar área / inimigos listados")
+        print("  python state_viewer.py convert <json> <sav>    # Converter save para binário")
+        print("  python state_viewer.py stats <glob> [--workers N]  # Estatísticas de vários saves")
+        print("  python state_viewer.py diff <a> <b>            # Diferenças por área entre saves")
         print("  python state_viewer.py create <cenario> <arquivo>  # Criar cenário")
         print("")
         print("Cenários disponíveis:")
@@ -117,29 +247,73 @@ def main():
         list_saved_states()
     
     elif command == 'view':
-        if len(sys.argv) < 3:
+        try:
+            args, options = parse_options(sys.argv[2:])
+            area_filter = parse_area(options['area']) if 'area' in options else None
+            limit = int(options.get('limit', 3))
+        except ValueError as e:
+            print(f"❌ Opções inválidas: {e}")
+            return
+        
+        if not args:
             print("❌ Especifique o arquivo para visualizar")
             return
         
-        filename = sys.argv[2]
+        filename = args[0]
         if not os.path.exists(filename):
             print(f"❌ Arquivo '{filename}' não encontrado")
             return
         
         try:
-            state = GameState()
-            if filename.endswith('.json'):
-                state.load_from_json(filename)
-            elif filename.endswith('.yaml') or filename.endswith('.yml'):
-                state.load_from_yaml(filename)
+            if filename.endswith(('.yaml', '.yml')):
+                print_state_info(load_state_file(filename), area_filter, limit)
             else:
-                print("❌ Formato de arquivo não suportado. Use .json ou .yaml")
-                return
-            
-            print_state_info(state)
+                print_records(iter_save_records(filename), area_filter, limit)
+        except SaveFormatError as e:
+            print(f"❌ Formato de arquivo não suportado: {e}")
         except Exception as e:
             print(f"❌ Erro ao carregar arquivo: {e}")
     
+    elif command == 'convert':
+        if len(sys.argv) < 4:
+            print("❌ Especifique o save de origem e o arquivo .sav de destino")
+            return
+        
+        source, target = sys.argv[2], sys.argv[3]
+        if not target.endswith('.sav'):
+            target += '.sav'
+        
+        try:
+            convert_save(source, target)
+            print(f"✅ Save convertido para: {target}")
+        except Exception as e:
+            print(f"❌ Erro ao converter arquivo: {e}")
+    
+    elif command == 'stats':
+        try:
+            patterns, options = parse_options(sys.argv[2:])
+            workers = int(options['workers']) if 'workers' in options else None
+        except ValueError as e:
+            print(f"❌ Opções inválidas: {e}")
+            return
+        
+        files = expand_save_patterns(patterns)
+        if not files:
+            print("❌ Nenhum save encontrado para o padrão informado")
+            return
+        
+        print_aggregate_stats(files, workers)
+    
+    elif command == 'diff':
+        if len(sys.argv) < 4:
+            print("❌ Especifique os dois saves a comparar")
+            return
+        
+        try:
+            print_save_diff(sys.argv[2], sys.argv[3])
+        except Exception as e:
+            print(f"❌ Erro ao comparar saves: {e}")
+    
     elif command == 'create':
         if len(sys.argv) < 4:
             print("❌ Especifique o cenário e nome do arquivo")
@@ -156,7 +330,7 @@ def main():
     
     else:
         print(f"❌ Comando '{command}' não reconhecido")
-        print("   Comandos disponíveis: list, view, create")
+        print("   Comandos disponíveis: list, view, convert, stats, diff, create")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
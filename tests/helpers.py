@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Utilidades comuns dos testes.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_config import DEFAULTS, GameConfig, merge_config
+
+
+def make_config(base: GameConfig = None, **sections) -> GameConfig:
+    """Configuração de teste: base (ou DEFAULTS) com as seções dadas por cima,
+    ex.: make_config(world={'walls': True}, spawn={'enemies_per_area': 5})"""
+    data = base.to_dict() if base is not None else DEFAULTS
+    return GameConfig.from_dict(merge_config(data, sections))
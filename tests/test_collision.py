@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Testes do mapa de colisão por ladrilhos (world.walls).
+"""
+
+import sys
+import os
+import json
+import random
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collision import area_collision
+from dynamic_world import DynamicAreaManager
+from lod import AreaAggregate
+from entities import Enemy, Player
+from game_config import ConfigError, GameConfig
+from spawn import spawn_margin
+from world import World
+from tests.helpers import make_config
+
+DT = 1.0 / 30.0
+
+
+def walls_config(**world) -> GameConfig:
+    return make_config(world=dict({'area_size': 300, 'walls': True, 'tile_size': 30}, **world))
+
+
+class TestCollisionMap(unittest.TestCase):
+
+    def setUp(self):
+        self.config = walls_config()
+        self.world = World(config=self.config, seed=1)
+        self.collision = self.world.collision
+
+    def test_area_bitmap(self):
+        """Borda bloqueada com uma passagem no meio de cada lado; o resto livre."""
+        bitmap = area_collision(300, 30)
+
+        self.assertEqual(len(bitmap), 100)
+        self.assertEqual(bitmap[0], 1)
+        self.assertEqual(bitmap[4], 0)
+        self.assertEqual(bitmap[5 * 10 + 9], 0)
+        self.assertEqual(bitmap[2 * 10 + 9], 1)
+        self.assertEqual(sum(bitmap[11:19]), 0)
+        self.assertEqual(self.world.get_area(1, 1).collision, bitmap)
+
+    def test_player_stops_at_wall_even_with_large_step(self):
+        """Um passo maior que um ladrilho não atravessa a parede."""
+        player = Player(400, 360, self.config.player)
+        player.move(1, 0, 2.0, self.collision)
+
+        # A parede da direita da área (1, 1) começa em x = 570
+        self.assertEqual(player.x, 570 - player.size)
+        self.assertEqual(player.y, 360)
+
+    def test_player_walks_through_door(self):
+        player = Player(450, 450, self.config.player)
+        for _ in range(60):
+            player.move(0, -1, DT, self.collision)
+
+        self.assertLess(player.y, 300)
+        self.assertEqual(self.world.get_area_at_position(player.x, player.y), self.world.get_area(1, 0))
+
+    def test_world_edge_blocks(self):
+        # Pela passagem de cima da área (0, 0) só se chega à borda do mundo
+        player = Player(150, 150, self.config.player)
+        player.move(0, -1, 10.0, self.collision)
+
+        self.assertEqual(player.y, player.size)
+
+    def test_enemy_slides_along_wall(self):
+        """O eixo que entraria na parede é desfeito; o outro continua."""
+        enemy = Enemy(400, 330 + self.config.enemy.size, self.config.enemy)
+        target = Player(300, 100, self.config.player)
+        for _ in range(10):
+            enemy.update(target, DT, collision=self.collision)
+
+        self.assertEqual(enemy.y, 330 + self.config.enemy.size)
+        self.assertLess(enemy.x, 400)
+
+    def test_enemy_inside_wall_only_moves_out(self):
+        """Sobre a parede, só passos que diminuem a sobreposição são aceitos."""
+        # Parede da esquerda da área (1, 1) ocupa x de 300 a 330
+        enemy = Enemy(335, 380, self.config.enemy)
+        enemy.update(Player(100, 380, self.config.player), DT, collision=self.collision)
+        self.assertEqual(enemy.x, 335)
+
+        enemy.update(Player(500, 380, self.config.player), DT, collision=self.collision)
+        self.assertGreater(enemy.x, 335)
+
+    def test_entities_spawn_and_promote_outside_walls(self):
+        config = make_config(world={'walls': True})
+        world = World(config=config, seed=3)
+        world.finish_generation()
+        for area in world.areas:
+            for entity in area.enemies + area.items:
+                size = entity.size
+                self.assertFalse(world.collision.overlaps(entity.x - size, entity.y - size,
+                                                          entity.x + size, entity.y + size))
+
+        area = world.get_area(1, 1)
+        aggregate = AreaAggregate.from_positions([(enemy.x, enemy.y) for enemy in area.enemies],
+                                                 area.x, area.y, area.area_size,
+                                                 spawn_margin(config, 0, config.enemy.size))
+        aggregate.offsets = [(ox * 4, oy * 4) for ox, oy in aggregate.offsets]
+        aggregate.apply(area.enemies)
+        for enemy in area.enemies:
+            size = enemy.size
+            self.assertFalse(world.collision.overlaps(enemy.x - size, enemy.y - size, enemy.x + size, enemy.y + size))
+
+    def test_batched_resolve_matches_single(self):
+        """resolve_all dá o mesmo resultado de resolve chamado inimigo por inimigo."""
+        rng = random.Random(5)
+        starts = [(rng.uniform(0, 900), rng.uniform(0, 900)) for _ in range(300)]
+        steps = [(rng.uniform(-40, 40), rng.uniform(-40, 40)) for _ in starts]
+        single = [Enemy(x, y, self.config.enemy) for x, y in starts]
+        batched = [Enemy(x, y, self.config.enemy) for x, y in starts]
+        for enemy, (x, y), (dx, dy) in zip(single, starts, steps):
+            enemy.x += dx
+            enemy.y += dy
+            self.collision.resolve(enemy, x, y)
+        for enemy, (dx, dy) in zip(batched, steps):
+            enemy.x += dx
+            enemy.y += dy
+        self.collision.resolve_all(batched, [x for x, _ in starts], [y for _, y in starts])
+
+        self.assertEqual([(e.x, e.y) for e in batched], [(e.x, e.y) for e in single])
+        self.assertTrue(any((e.x, e.y) != (x + dx, y + dy) for e, (x, y), (dx, dy) in zip(single, starts, steps)))
+
+    def test_tile_size_must_divide_area(self):
+        with self.assertRaises(ConfigError):
+            walls_config(tile_size=32)
+        self.assertEqual(walls_config(tile_size=32, walls=False).world.tile_size, 32)
+
+
+class TestCollisionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_bitmap_stored_with_area_cache(self):
+        manager = DynamicAreaManager(walls_config(), seed=1, cache_dir=self.tmp_dir)
+        area_data = manager.areas_data[(0, 0)]
+        manager.load_area(area_data)
+        manager.unload_area(area_data)
+
+        with open(manager.get_cache_filename(0, 0), encoding='utf-8') as f:
+            cached = json.load(f)
+        self.assertEqual(bytes.fromhex(cached['collision']), area_collision(300, 30))
+
+        area_data.collision = None
+        manager.load_area(area_data)
+        self.assertEqual(area_data.collision, area_collision(300, 30))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Testes da configuração tipada e do cache de carregamento.
+"""
+
+import sys
+import os
+import copy
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_config import (DEFAULTS, ConfigError, GameConfig, clear_config_cache, load_config,
+                         merge_config)
+
+
+class TestGameConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.tmp_dir, 'config.yaml')
+        self.write_config(DEFAULTS)
+        clear_config_cache()
+
+    def tearDown(self):
+        clear_config_cache()
+        shutil.rmtree(self.tmp_dir)
+
+    def write_config(self, data):
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, allow_unicode=True)
+
+    def test_roundtrip(self):
+        """to_dict devolve o mesmo dicionário que gerou a configuração."""
+        config = GameConfig.from_dict(DEFAULTS)
+
+        self.assertEqual(config.to_dict(), DEFAULTS)
+        self.assertEqual(config.items.get('ammo').radius, 150)
+        self.assertEqual(pickle.loads(pickle.dumps(config)), config)
+
+    def test_defaults_match_shipped_file(self):
+        """Um arquivo sem alguma chave roda igual ao config.yaml distribuído."""
+        shipped = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.yaml')
+
+        self.assertEqual(load_config(shipped), GameConfig.from_dict(DEFAULTS))
+
+    def test_validation_collects_errors(self):
+        """Todos os campos inválidos são reportados de uma vez."""
+        data = copy.deepcopy(DEFAULTS)
+        data['world']['area_size'] = 0
+        data['enemy']['color'] = [300, 0, 0]
+        data['game']['fps'] = 'rápido'
+
+        with self.assertRaises(ConfigError) as ctx:
+            GameConfig.from_dict(data)
+
+        self.assertEqual(len(ctx.exception.errors), 3)
+
+    def test_missing_keys_use_defaults(self):
+        """Seções parciais são completadas com os valores padrão."""
+        config = GameConfig.from_dict({'spawn': {'enemies_per_area': 2}})
+
+        self.assertEqual(config.spawn.enemies_per_area, 2)
+        self.assertEqual(config.world.area_size, DEFAULTS['world']['area_size'])
+
+    def test_load_is_cached_until_file_changes(self):
+        """O mesmo arquivo não é lido de novo enquanto não muda."""
+        first = load_config(self.config_file)
+        self.assertIs(load_config(self.config_file), first)
+
+        self.write_config(merge_config(DEFAULTS, {'world': {'area_size': 640}}))
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        self.assertEqual(load_config(self.config_file).world.area_size, 640)
+
+
+if __name__ == '__main__':
+    unittest.main()
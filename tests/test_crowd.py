@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Testes da separação entre inimigos (enemy.separation_radius).
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crowd import CrowdSeparation
+from entities import Enemy, Player
+from game_config import GameConfig
+from world import World
+from tests.helpers import make_config
+
+DT = 1.0 / 30.0
+
+
+def crowd_config(radius: float = 30, **simulation) -> GameConfig:
+    return make_config(player={'max_health': 100000}, enemy={'speed': 150, 'separation_radius': radius},
+                       spawn={'enemies_per_area': 25}, simulation=simulation)
+
+
+def mean_nearest(enemies) -> float:
+    return sum(min(((a.x - b.x) ** 2 + (a.y - b.y) ** 2) ** 0.5 for b in enemies if b is not a)
+               for a in enemies) / len(enemies)
+
+
+class TestCrowdSeparation(unittest.TestCase):
+
+    def test_close_enemies_pushed_apart(self):
+        """Dois inimigos dentro do raio se afastam igualmente; um distante não se move."""
+        config = crowd_config()
+        enemies = [Enemy(100, 100, config.enemy), Enemy(110, 100, config.enemy), Enemy(400, 400, config.enemy)]
+        CrowdSeparation(config).apply(enemies, DT)
+
+        self.assertLess(enemies[0].x, 100)
+        self.assertGreater(enemies[1].x, 110)
+        self.assertAlmostEqual(100 - enemies[0].x, enemies[1].x - 110)
+        self.assertEqual((enemies[0].y, enemies[1].y), (100, 100))
+        self.assertEqual((enemies[2].x, enemies[2].y), (400, 400))
+
+    def test_budget_rotates_over_enemies(self):
+        """Com orçamento cada passo visita só parte dos inimigos, em rodízio."""
+        config = crowd_config(separation_budget=2)
+        crowd = CrowdSeparation(config)
+        enemies = [Enemy(100 + i, 100, config.enemy) for i in range(5)]
+
+        crowd.apply(enemies, DT)
+        self.assertEqual(crowd.checked, 2)
+        moved = [enemy.x != 100 + i for i, enemy in enumerate(enemies)]
+        self.assertEqual(moved, [True, True, False, False, False])
+
+        crowd.apply(enemies, DT)
+        crowd.apply(enemies, DT)
+        self.assertEqual(crowd.cursor % 5, 1)
+
+    def test_neighbour_cap(self):
+        config = make_config(crowd_config(), enemy={'separation_neighbors': 2})
+        crowd = CrowdSeparation(config)
+        crowd.apply([Enemy(100 + i, 100, config.enemy) for i in range(10)], DT)
+
+        self.assertEqual(crowd.pairs, 2 * 10)
+
+    def test_push_does_not_enter_walls(self):
+        """Inimigo encostado na parede não é empurrado para dentro dela nem a atravessa depois."""
+        config = make_config(crowd_config(), world={'walls': True})
+        world = World(config=config, seed=1)
+        # Parede esquerda da área (1, 1) ocupa x de 500 a 525
+        enemies = [Enemy(540, 600, config.enemy), Enemy(545, 600, config.enemy)]
+        CrowdSeparation(config).apply(enemies, DT, world.collision)
+
+        self.assertEqual(enemies[0].x, 540)
+        self.assertGreater(enemies[1].x, 545)
+
+        player = Player(300, 600, config.player)
+        for _ in range(60):
+            enemies[0].update(player, DT, collision=world.collision)
+        self.assertGreaterEqual(enemies[0].x, 540)
+
+    def test_horde_does_not_collapse(self):
+        """Perseguindo um jogador parado, a horda com separação não vira um ponto só."""
+        distances = []
+        for radius in (0, 30):
+            config = crowd_config(radius)
+            world = World(config=config, seed=8)
+            player = Player(750, 750, config.player)
+            for _ in range(150):
+                world.update(player, DT)
+            distances.append(mean_nearest(world.get_area(1, 1).enemies))
+
+        self.assertIsNone(World(config=crowd_config(0), seed=8).crowd)
+        self.assertLess(distances[0], 3.0)
+        self.assertGreater(distances[1], 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Testes do campo de direções usado na perseguição (simulation.pursuit: flow).
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities import Player
+from flow_field import FlowField
+from game_config import GameConfig
+from world import World
+from tests.helpers import make_config
+
+
+class FakeArea:
+    def __init__(self, grid_x: int, grid_y: int):
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+
+
+def flow_config(walls: bool = False) -> GameConfig:
+    return make_config(world={'area_size': 300, 'walls': walls, 'tile_size': 30},
+                       simulation={'pursuit': 'flow', 'flow_cell_size': 30})
+
+
+class TestFlowField(unittest.TestCase):
+
+    def test_open_field_points_to_player(self):
+        """Sem paredes cada célula aponta para o jogador; na célula dele não há direção."""
+        field = FlowField(flow_config())
+        player = Player(450, 450, flow_config().player)
+        field.update(player, [FakeArea(x, y) for x in range(3) for y in range(3)])
+
+        self.assertIsNone(field.direction(460, 455))
+        self.assertEqual(field.direction(600, 450), (-1.0, 0.0))
+        dx, dy = field.direction(300, 300)
+        self.assertAlmostEqual(dx, 2 ** -0.5)
+        self.assertAlmostEqual(dy, 2 ** -0.5)
+
+    def test_recomputed_only_when_player_changes_cell(self):
+        field = FlowField(flow_config())
+        player = Player(450, 450, flow_config().player)
+        areas = [FakeArea(1, 1)]
+
+        self.assertTrue(field.update(player, areas))
+        player.x += 5
+        self.assertFalse(field.update(player, areas))
+        player.x += 40
+        self.assertTrue(field.update(player, areas))
+        self.assertEqual(field.version, 2)
+
+    def test_path_goes_through_door(self):
+        """Com paredes o caminho contorna a borda e entra pela passagem."""
+        config = flow_config(walls=True)
+        world = World(config=config, seed=1)
+        field = world.flow_field
+        player = Player(450, 450, config.player)
+        field.update(player, [FakeArea(1, 1), FakeArea(1, 0)])
+
+        # Acima das paredes entre as áreas (1, 0) e (1, 1), longe da passagem
+        x, y = 345.0, 255.0
+        for _ in range(200):
+            direction = field.direction(x, y)
+            if direction is None:
+                break
+            self.assertFalse(world.collision.blocked_at(x, y))
+            x += direction[0] * 10
+            y += direction[1] * 10
+
+        self.assertEqual(field.cell_at(x, y), field.target)
+        straight = max(abs(field.cell_at(345, 255)[0] - field.target[0]),
+                       abs(field.cell_at(345, 255)[1] - field.target[1]))
+        self.assertGreater(field.distances[field.cell_at(345, 255)], straight)
+
+    def test_enemies_follow_field_in_world(self):
+        """Com pursuit flow os inimigos do mundo usam a direção do campo."""
+        config = flow_config()
+        world = World(config=config, seed=3)
+        player = Player(450, 450, config.player)
+        world.update_active_areas(player)
+        world.flow_field.update(player, world.active_areas)
+        expected = [world.flow_field.direction(enemy.x, enemy.y) for enemy in world.enemies]
+
+        world.update(player, 1.0 / 30.0)
+
+        self.assertTrue(any(expected))
+        for enemy, direction in zip(world.enemies, expected):
+            if direction is not None:
+                self.assertEqual((enemy.dir_x, enemy.dir_y), direction)
+
+
+if __name__ == '__main__':
+    unittest.main()
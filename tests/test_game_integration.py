@@ -131,7 +131,21 @@ class TestGameIntegration(unittest.TestCase):
         
         self.assertEqual(len(world.areas), 9)
         self.assertEqual(len(world.active_areas), 1)
-    
+
+    def test_deferred_world_generation(self):
+        """Geração adiada produz o mesmo mundo que a geração imediata."""
+        eager = World(config=self.config, seed=42)
+        deferred = World(config=self.config, seed=42, defer_generation=True)
+
+        self.assertEqual(len(deferred.pending_areas), 8)
+        self.assertTrue(deferred.get_area(1, 1).generated)
+
+        self.assertEqual(deferred.generate_pending(), 7)
+        deferred.finish_generation()
+
+        positions = [[(e.x, e.y) for area in world.areas for e in area.enemies] for world in (eager, deferred)]
+        self.assertEqual(positions[0], positions[1])
+
     def test_dynamic_world_creation(self):
         """Testa criação do mundo dinâmico."""
         dynamic_world = DynamicAreaManager(self.config)
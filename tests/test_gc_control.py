@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Testes do controle do coletor de lixo durante a partida (gc_control.py).
+"""
+
+import sys
+import os
+import gc
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gc_control import GCController, GCMonitor
+
+
+class TestGCControl(unittest.TestCase):
+
+    def setUp(self):
+        self.thresholds = gc.get_threshold()
+        self.enabled = gc.isenabled()
+
+    def tearDown(self):
+        gc.set_threshold(*self.thresholds)
+        gc.unfreeze()
+        if self.enabled:
+            gc.enable()
+
+    def test_pause_attributed_to_frame(self):
+        """Coleta dentro do quadro vai para a timeline; fora dele, para boundary_ms."""
+        monitor = GCMonitor()
+        monitor.install()
+        try:
+            monitor.begin_frame()
+            gc.collect()
+            frame_ms, gc_ms, collections = monitor.end_frame()
+            gc.collect()
+        finally:
+            monitor.uninstall()
+
+        self.assertEqual(collections, 1)
+        self.assertGreater(gc_ms, 0.0)
+        self.assertGreaterEqual(frame_ms, gc_ms)
+        self.assertEqual(monitor.pauses, 2)
+        self.assertGreater(monitor.boundary_ms, 0.0)
+        self.assertEqual(monitor.summary()['gc_frames'], 1)
+
+    def test_managed_mode_collects_only_between_frames(self):
+        gc.set_threshold(50, 10, 10)
+        controller = GCController('managed')
+        controller.start()
+        try:
+            self.assertFalse(gc.isenabled())
+            controller.world_ready()
+            self.assertGreater(gc.get_freeze_count(), 0)
+
+            controller.begin_frame()
+            garbage = []
+            for _ in range(200):
+                cycle = []
+                cycle.append(cycle)
+                garbage.append(cycle)
+            del garbage, cycle
+            self.assertEqual(controller.end_frame()[2], 0)
+            self.assertLess(gc.get_count()[0], 50)
+        finally:
+            controller.stop()
+
+        self.assertGreater(controller.monitor.boundary_ms, 0.0)
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_auto_mode_only_measures(self):
+        controller = GCController('auto')
+        controller.start()
+        controller.world_ready()
+        controller.stop()
+
+        self.assertFalse(controller.frozen)
+        self.assertTrue(gc.isenabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Testes do desenho sob demanda do menu e da pausa (menu.MenuButton, MainMenu.needs_redraw,
+Game.idle_redraw, quadro congelado do PauseMenu).
+"""
+
+import sys
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game import Game
+from menu import MainMenu
+from tests.helpers import make_config
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+class TestIdleRender(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((1200, 800))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_menu_redraws_only_on_changes(self):
+        menu = MainMenu(1200, 800)
+        self.assertTrue(menu.needs_redraw)
+        menu.draw(self.screen)
+        self.assertFalse(menu.needs_redraw)
+
+        button = menu.main_buttons[0]
+        menu.handle_event(motion((5, 5)))
+        self.assertFalse(menu.needs_redraw)
+        menu.handle_event(motion(button.rect.center))
+        self.assertTrue(button.dirty)
+        menu.draw(self.screen)
+        # Mouse andando dentro do mesmo botão não redesenha
+        menu.handle_event(motion((button.rect.centerx + 10, button.rect.centery)))
+        self.assertFalse(menu.needs_redraw)
+        self.assertEqual(self.screen.get_at(button.rect.midleft)[:3], (255, 255, 255))
+
+        menu.show_screen("config")
+        self.assertTrue(menu.needs_redraw)
+        menu.draw(self.screen)
+        menu.config_sliders[0].value = 42
+        self.assertTrue(menu.needs_redraw)
+
+    def test_paused_game_redraws_only_when_needed(self):
+        game = Game(config=make_config(), seed=1)
+        game.pause_menu.show()
+        game.paused = True
+        game.draw()
+        self.assertFalse(game.pause_menu.dirty)
+
+        self.assertFalse(game.idle_redraw([]))
+        self.assertFalse(game.idle_redraw([motion((5, 5))]))
+        resume = game.pause_menu.buttons[0]
+        game.handle_events([motion(resume.rect.center)])
+        self.assertTrue(game.idle_redraw([]))
+        game.draw()
+        self.assertFalse(game.idle_redraw([]))
+
+    def test_pause_draws_over_frozen_frame(self):
+        game = Game(config=make_config(), seed=1)
+        game.draw()
+        game.pause_menu.show()
+        game.paused = True
+        game.draw()
+        frozen = game.pause_menu.frozen
+        self.assertIsNotNone(frozen)
+        paused_frame = pygame.image.tostring(game.screen, 'RGB')
+
+        calls = []
+        game.world.draw = lambda *args: calls.append(args)
+        game.draw()
+        resume = game.pause_menu.buttons[0]
+        game.handle_events([motion(resume.rect.center)])
+        self.assertEqual(game.pause_menu.draw(game.screen), [resume.bounds])
+        game.handle_events([motion((5, 5))])
+        game.draw()
+        self.assertEqual(calls, [])
+        self.assertIs(game.pause_menu.frozen, frozen)
+        self.assertEqual(pygame.image.tostring(game.screen, 'RGB'), paused_frame)
+
+        game.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=resume.rect.center, button=1)])
+        self.assertFalse(game.paused)
+        self.assertIsNone(game.pause_menu.frozen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Testes da contabilidade de memória do mundo (memory_stats.py, world.memory_budget_mb).
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dynamic_world import DynamicAreaManager
+from game_config import GameConfig
+from memory_stats import MB, format_bytes, overlay_lines
+from world import World
+from tests.helpers import make_config
+
+
+def budget_config(budget_mb: float = 0) -> GameConfig:
+    return make_config(world={'grid_size': 4, 'area_size': 300, 'max_loaded_areas': 16, 'memory_budget_mb': budget_mb},
+                       spawn={'enemies_per_area': 100})
+
+
+class TestMemoryStats(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def load_all(self, manager: DynamicAreaManager):
+        for area_data in manager.areas_data.values():
+            manager.load_area(area_data)
+
+    def test_bytes_per_loaded_area(self):
+        manager = DynamicAreaManager(budget_config(), seed=1, cache_dir=self.tmp_dir)
+        self.load_all(manager)
+        manager.unload_area(manager.areas_data[(0, 0)])
+
+        stats = manager.get_memory_stats()
+        self.assertEqual(len(stats['area_bytes']), 15)
+        self.assertNotIn('0,0', stats['area_bytes'])
+        # Cada inimigo custa pelo menos o objeto e o dicionário de atributos
+        self.assertGreater(stats['area_bytes']['1,1'], 100 * 100)
+        self.assertEqual(stats['world_bytes'], sum(stats['area_bytes'].values()))
+        self.assertGreater(stats['disk_bytes'], 0)
+
+    def test_loader_respects_budget(self):
+        budget_mb = 0.06
+        manager = DynamicAreaManager(budget_config(budget_mb), seed=1, cache_dir=self.tmp_dir)
+        self.load_all(manager)
+
+        stats = manager.get_memory_stats()
+        self.assertLessEqual(stats['world_bytes'], budget_mb * MB)
+        self.assertGreater(stats['loaded_areas'], 0)
+        self.assertLess(stats['loaded_areas'], 16)
+
+    def test_static_world_and_overlay(self):
+        world = World(config=budget_config(), seed=1)
+        stats = world.memory_stats()
+        report = {'rss': 50 * MB, 'subsystems': {'Mundo': stats['world_bytes']}, 'world': stats}
+
+        self.assertEqual(len(stats['area_bytes']), 16)
+        self.assertEqual(overlay_lines(report)[0], "RSS: 50.0MB")
+        self.assertEqual(format_bytes(512), "512B")
+
+
+if __name__ == '__main__':
+    unittest.main()
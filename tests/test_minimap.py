@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Testes do minimapa em cache (minimap.py, WorldBackend.area_states).
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from dynamic_world import DynamicAreaManager
+from game import Game
+from minimap import Minimap, density_color
+from world import World
+from tests.helpers import make_config
+
+
+class TestMinimap(unittest.TestCase):
+
+    def test_repaints_only_changed_cells(self):
+        minimap = Minimap(grid_size=3, area_size=500, reference=10, refresh=2)
+        areas = [(x, y, False, True, 5) for y in range(3) for x in range(3)]
+
+        self.assertTrue(minimap.due)
+        self.assertEqual(minimap.update(areas), 9)
+        self.assertFalse(minimap.due)
+        self.assertEqual(minimap.surface.get_at((minimap.cell + 5, 5))[:3], density_color(4))
+        # Quadro fora da taxa de atualização
+        areas[4] = (1, 1, True, True, 20)
+        self.assertEqual(minimap.update(areas), 0)
+        self.assertEqual(minimap.update(areas), 1)
+        self.assertEqual(minimap.surface.get_at((minimap.cell + 5, minimap.cell + 5))[:3], density_color(7))
+        minimap.update(areas)
+        self.assertEqual(minimap.update(areas), 0)
+
+    def test_backends_report_every_area(self):
+        config = make_config(world={'grid_size': 4})
+        world = World(config=config, seed=1)
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            manager = DynamicAreaManager(config, seed=1, cache_dir=tmp_dir)
+            manager.load_area(manager.areas_data[(2, 3)])
+            for backend in (world, manager):
+                states = {(x, y): (loaded, enemies) for x, y, _, loaded, enemies in backend.area_states()}
+                self.assertEqual(len(states), 16)
+                self.assertEqual(states[(2, 3)], (True, config.spawn.enemies_per_area))
+            self.assertEqual(sum(loaded for loaded, _ in states.values()), 1)
+            manager.close()
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_game_reads_areas_only_when_due(self):
+        """O HUD só percorre as áreas nos quadros em que o minimapa repinta."""
+        pygame.init()
+        try:
+            game = Game(config=make_config(), seed=1)
+            calls = []
+            area_states = game.world.area_states
+            game.world.area_states = lambda: calls.append(1) or area_states()
+            for _ in range(game.minimap.refresh * 2):
+                game.draw()
+        finally:
+            pygame.quit()
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(game.minimap.states), game.config.world.grid_size ** 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Modo paralelo: os workers avançam as áreas em memória compartilhada e o
+resultado deve ser o mesmo da atualização no processo principal.
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities import Player
+from game_config import GameConfig
+from parallel import SharedEnemy
+from pools import enemy_pool
+from world import World
+from tests.helpers import make_config
+
+DT = 1.0 / 30.0
+
+
+def workers_config(workers: int, pursuit: str = 'direct', walls: bool = False) -> GameConfig:
+    # Janela grande e direção recalculada todo quadro: todas as áreas são
+    # faixa 0 e o resultado não depende de qual área guarda cada inimigo
+    return make_config(
+        game={'window_width': 2000, 'window_height': 2000},
+        player={'max_health': 100000},
+        world={'area_size': 300, 'activation_distance': 1000, 'max_active_areas': 9, 'lod_radius': 0,
+               'walls': walls, 'tile_size': 30},
+        spawn={'enemies_per_area': 8},
+        simulation={'steering_interval': 1, 'workers': workers, 'pursuit': pursuit}
+    )
+
+
+def enemy_state(world):
+    return sorted((e.x, e.y, e.health, e.damage_cooldown) for e in world.enemies)
+
+
+class TestParallelAreaUpdates(unittest.TestCase):
+
+    def setUp(self):
+        self.worlds = []
+
+    def tearDown(self):
+        for world in self.worlds:
+            world.close()
+
+    def run_world(self, workers: int, frames: int, pursuit: str = 'direct', walls: bool = False):
+        world = World(config=workers_config(workers, pursuit, walls), seed=11)
+        self.worlds.append(world)
+        player = Player(450, 450, world.config.player)
+        for frame in range(frames):
+            if frame == 40:
+                player.ammo_items += 1
+                world.remove_enemies(player.use_ammo_item(world.enemies, 50, 200))
+            world.update(player, DT)
+        return world, player
+
+    def test_same_result_as_serial(self):
+        """Com workers, inimigos e jogador terminam no mesmo estado do modo serial."""
+        serial, serial_player = self.run_world(0, 120)
+        parallel, parallel_player = self.run_world(2, 120)
+
+        self.assertEqual(enemy_state(parallel), enemy_state(serial))
+        self.assertEqual(parallel_player.health, serial_player.health)
+        self.assertLess(parallel_player.health, parallel_player.max_health)
+
+    def test_same_result_with_flow_field(self):
+        """Os workers recebem o campo de direções e seguem o mesmo caminho."""
+        serial, serial_player = self.run_world(0, 90, 'flow')
+        parallel, parallel_player = self.run_world(2, 90, 'flow')
+
+        self.assertGreater(parallel.flow_field.version, 0)
+        self.assertEqual(enemy_state(parallel), enemy_state(serial))
+        self.assertEqual(parallel_player.health, serial_player.health)
+
+    def test_same_result_with_walls(self):
+        """A resolução de colisão em lote dos workers bate com a do modo serial."""
+        serial, _ = self.run_world(0, 90, 'flow', walls=True)
+        parallel, _ = self.run_world(2, 90, 'flow', walls=True)
+
+        self.assertEqual(enemy_state(parallel), enemy_state(serial))
+        for enemy in parallel.enemies:
+            self.assertFalse(parallel.collision.blocked_at(enemy.x, enemy.y))
+
+    def test_migration_between_areas(self):
+        """Inimigos que entram em outra área ativa passam para a lista dela."""
+        world, _ = self.run_world(1, 120)
+
+        self.assertGreater(world.migrations, 0)
+        for area in world.active_areas:
+            for enemy in area.enemies:
+                self.assertIs(world.get_area_at_position(enemy.x, enemy.y), area)
+
+    def test_same_areas_as_serial(self):
+        """As migrações são as mesmas nos dois modos: cada inimigo termina na mesma área."""
+        serial, _ = self.run_world(0, 120)
+        parallel, _ = self.run_world(2, 120)
+
+        self.assertGreater(serial.migrations, 0)
+        self.assertEqual(parallel.migrations, serial.migrations)
+        self.assertEqual(parallel.snapshot(), serial.snapshot())
+
+    def test_pool_counts_only_pooled_enemies(self):
+        """Enemy copiados para os blocos voltam ao pool; in_use não cresce com as ativações."""
+        enemy_pool.free.clear()
+        enemy_pool.reset_stats()
+        world, _ = self.run_world(2, 30)
+
+        pooled = sum(1 for area in world.areas for enemy in area.enemies if not isinstance(enemy, SharedEnemy))
+        self.assertGreater(len(enemy_pool.free), 0)
+        self.assertEqual(enemy_pool.stats.in_use, pooled)
+
+    def test_close_stops_workers(self):
+        world, _ = self.run_world(2, 5)
+        processes = world.parallel.processes
+
+        world.close()
+
+        self.assertIsNone(world.parallel)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Testes dos pools de entidades (pools.py).
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dynamic_world import DynamicAreaManager
+from entities import Enemy, Player
+from pools import EntityPool, enemy_pool, item_pool
+from scheduler import update_entities
+from world import World
+from tests.helpers import make_config
+
+
+class TestEntityPool(unittest.TestCase):
+
+    def setUp(self):
+        self.config = make_config(world={'grid_size': 3, 'area_size': 300, 'max_loaded_areas': 2},
+                                  spawn={'enemies_per_area': 5, 'health_items_per_area': 1, 'ammo_items_per_area': 1})
+        for pool in (enemy_pool, item_pool):
+            pool.free.clear()
+            pool.reset_stats()
+
+    def test_reused_enemy_is_reset(self):
+        pool = EntityPool(Enemy)
+        enemy = pool.acquire(10, 20, self.config.enemy)
+        enemy.take_damage(30)
+        enemy.damage_cooldown = 0.4
+        enemy.steered = True
+        pool.release(enemy)
+
+        again = pool.acquire(50, 60, self.config.enemy)
+
+        self.assertIs(again, enemy)
+        self.assertEqual((again.x, again.y), (50, 60))
+        self.assertEqual(again.health, self.config.enemy.health)
+        self.assertEqual(again.damage_cooldown, 0.0)
+        self.assertFalse(again.steered)
+        self.assertEqual((pool.stats.hits, pool.stats.misses, pool.stats.high_water), (1, 1, 1))
+
+    def test_subclasses_are_not_pooled(self):
+        """Entidades de subclasses (ex.: parallel.SharedEnemy) ficam fora do pool."""
+        class Special(Enemy):
+            pass
+
+        pool = EntityPool(Enemy)
+        pool.release(Special(0, 0, self.config.enemy))
+
+        self.assertEqual(pool.free, [])
+
+    def test_killed_and_collected_return_to_pool(self):
+        """Mortos e itens coletados durante o update voltam aos pools."""
+        player = Player(100, 100, self.config.player)
+        enemies = enemy_pool.acquire_many([(400, 400), (500, 400)], self.config.enemy)
+        items = item_pool.acquire_many([(100, 100), (300, 300)], 'health', self.config.items.health)
+        enemies[0].health = 0
+
+        update_entities(enemies, items, player, 1 / 30, 0, 1)
+
+        self.assertEqual(len(enemies), 1)
+        self.assertEqual(len(items), 1)
+        self.assertEqual(enemy_pool.stats.in_use, 1)
+        self.assertEqual(item_pool.stats.in_use, 1)
+        self.assertEqual(len(enemy_pool.free) + len(item_pool.free), 2)
+
+    def test_unload_and_reload_reuses_entities(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            manager = DynamicAreaManager(self.config, seed=3, cache_dir=tmp_dir)
+            area_data = manager.areas_data[(0, 0)]
+            manager.load_area(area_data)
+            manager.unload_area(area_data)
+            manager.load_area(area_data)
+
+            stats = manager.get_memory_stats()['pools']
+            self.assertEqual(stats['enemies']['hits'], 5)
+            self.assertEqual(stats['items']['hits'], 2)
+            self.assertEqual(stats['enemies']['high_water'], 5)
+            self.assertEqual(stats['enemies']['hit_rate'], 0.5)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_closed_world_feeds_the_next(self):
+        """Game.restart fecha o mundo antigo; o novo reaproveita as entidades."""
+        world = World(config=self.config, seed=1)
+        world.close()
+        World(config=self.config, seed=2)
+
+        self.assertEqual(enemy_pool.stats.misses, 9 * 5)
+        self.assertEqual(enemy_pool.stats.hits, 9 * 5)
+        self.assertEqual(enemy_pool.stats.high_water, 9 * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Testes das capturas de perfil feitas durante o jogo (profiling.py).
+"""
+
+import sys
+import os
+import pstats
+import shutil
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profiling import AllocationTracker, StackSampler
+
+
+def busy_loop(seconds: float):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_sampler_writes_collapsed_stacks_and_pstats(self):
+        sampler = StackSampler(duration=0.3, interval=0.002, output_dir=self.tmp_dir)
+        sampler.start()
+        busy_loop(0.4)
+        sampler.join()
+
+        self.assertGreater(sampler.samples, 10)
+        collapsed, prof = sampler.files
+        with open(collapsed, encoding='utf-8') as f:
+            self.assertIn('test_profiling:busy_loop', f.read())
+        stats = pstats.Stats(prof)
+        busy = [key for key in stats.stats if key[2] == 'busy_loop']
+        self.assertEqual(len(busy), 1)
+        self.assertGreater(stats.stats[busy[0]][3], 0.1)
+
+    def test_allocation_diff_per_module(self):
+        tracker = AllocationTracker(output_dir=self.tmp_dir)
+        self.assertIsNone(tracker.toggle())
+        self.assertTrue(tracker.tracing)
+        kept = [bytearray(1024) for _ in range(500)]
+        report = tracker.toggle()
+
+        self.assertFalse(tracker.tracing)
+        with open(report, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        mine = [line for line in lines if line.endswith('test_profiling.py')]
+        self.assertEqual(len(mine), 1)
+        self.assertGreater(int(mine[0].split()[0]), 500 * 1024)
+        del kept
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Testes do controle adaptativo de qualidade (quality.py, seção quality).
+"""
+
+import sys
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game import Game
+from game_config import ConfigError
+from quality import QualityController
+from tests.helpers import make_config
+
+LEVELS = make_config().quality.levels
+
+
+class TestQualityController(unittest.TestCase):
+
+    def run_frames(self, controller: QualityController, work_ms: float, seconds: float):
+        for _ in range(int(seconds * 60)):
+            controller.record(work_ms, 1.0 / 60.0)
+
+    def test_steps_down_while_slow_and_back_up(self):
+        controller = QualityController(LEVELS, target_ms=1000.0 / 60.0, window=10, cooldown=0.5, retry=5.0)
+
+        self.run_frames(controller, 40.0, 0.5)
+        self.assertEqual(controller.index, 1)
+        self.run_frames(controller, 40.0, 2.5)
+        self.assertEqual(controller.level.name, 'Mínima')
+
+        # Rápido de novo: sobe, mas só volta a um nível abandonado depois de retry segundos
+        self.run_frames(controller, 5.0, 2.0)
+        self.assertEqual(controller.level.name, 'Mínima')
+        self.run_frames(controller, 5.0, 30.0)
+        self.assertEqual(controller.index, 0)
+
+    def test_fixed_when_not_adaptive(self):
+        controller = QualityController(LEVELS, target_ms=16.0, adaptive=False)
+        self.run_frames(controller, 100.0, 5.0)
+        self.assertEqual(controller.index, 0)
+
+    def test_levels_are_validated(self):
+        with self.assertRaises(ConfigError) as ctx:
+            make_config(quality={'levels': [{'render_scale': 2}, 'baixa']})
+        self.assertEqual(len(ctx.exception.errors), 2)
+
+
+class TestGameQuality(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_reduced_levels_draw_and_decimate_ai(self):
+        config = make_config(world={'walls': True})
+        game = Game(config=config, seed=2)
+        game.tick(1.0 / 30.0)
+
+        for index, level in enumerate(LEVELS):
+            game.quality.index = index
+            game.apply_quality()
+            game.draw()
+            self.assertEqual(game.world.scheduler.steering_interval,
+                             config.simulation.steering_interval * level.ai_interval)
+            self.assertEqual(game.hud_state()['quality'], level.name)
+        self.assertEqual(game.world_surface.get_size(), (600, 400))
+
+
+if __name__ == '__main__':
+    unittest.main()
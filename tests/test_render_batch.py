@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Testes do desenho em lote de inimigos e itens (render_batch.py, camera.transform_points).
+"""
+
+import sys
+import os
+import unittest
+
+import numpy as np
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from camera import Camera
+from entities import Enemy, Item
+from game_config import DEFAULTS, GameConfig
+from render_batch import BatchRenderer, enemy_array, item_array
+
+CONFIG = GameConfig.from_dict(DEFAULTS)
+
+
+class TestRenderBatch(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((400, 300))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_same_pixels_as_entity_draw(self):
+        enemies = [Enemy(40 + 50 * index, 60 + 7 * index, CONFIG.enemy) for index in range(8)]
+        for index, enemy in enumerate(enemies):
+            enemy.save_previous()
+            enemy.x += 3.7
+            enemy.health = 8 * index
+        # Parcialmente fora da tela
+        enemies.append(Enemy(-8, 150, CONFIG.enemy))
+        items = [Item(60 + 80 * index, 220, item_type, CONFIG.items.get(item_type))
+                 for index, item_type in enumerate(('health', 'ammo', 'health'))]
+        camera_x, camera_y, alpha = 12.5, -3.0, 0.4
+
+        self.screen.fill((20, 20, 20))
+        for enemy in enemies:
+            enemy.draw(self.screen, camera_x, camera_y, alpha)
+        for item in items:
+            item.draw(self.screen, camera_x, camera_y)
+        expected = pygame.image.tostring(self.screen, 'RGB')
+
+        self.screen.fill((20, 20, 20))
+        batch = BatchRenderer()
+        batch.draw_enemies(self.screen, enemy_array(enemies), [enemy.color for enemy in enemies],
+                           camera_x, camera_y, alpha)
+        batch.draw_items(self.screen, item_array(items), [item.color for item in items],
+                         [item.symbol for item in items], camera_x, camera_y)
+        self.assertEqual(pygame.image.tostring(self.screen, 'RGB'), expected)
+
+    def test_offscreen_entities_are_culled(self):
+        enemies = [Enemy(x, 100, CONFIG.enemy) for x in (100, 2000, -500)]
+        batch = BatchRenderer()
+        batch.draw_enemies(self.screen, enemy_array(enemies), [enemy.color for enemy in enemies], 0, 0)
+
+        # Um só tamanho de círculo e de barra foi preparado, para o inimigo visível
+        self.assertEqual(len(batch.circles), 1)
+        self.assertEqual(self.screen.get_at((100, 100))[:3], CONFIG.enemy.color)
+
+    def test_camera_arrays_match_single_points(self):
+        camera = Camera(400, 300)
+        camera.x, camera.y = 33.3, -71.9
+        xs = np.array([0.0, 250.5, -40.2, 999.0])
+        ys = np.array([10.0, -80.0, 299.9, 100.0])
+        sizes = np.array([15, 15, 50, 15])
+
+        screen_x, screen_y = camera.world_to_screen_array(xs, ys)
+        self.assertEqual(list(zip(screen_x.tolist(), screen_y.tolist())),
+                         [camera.world_to_screen(x, y) for x, y in zip(xs, ys)])
+        self.assertEqual(camera.visible_mask(xs, ys, sizes).tolist(),
+                         [camera.is_visible(x, y, size) for x, y, size in zip(xs, ys, sizes)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Testes do modo pipeline: snapshots imutáveis do quadro (render_snapshot.py).
+"""
+
+import sys
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game import Game
+from render_snapshot import capture_snapshot
+from tests.helpers import make_config
+
+
+def make_game(backend: str) -> Game:
+    config = make_config(game={'pipeline': True}, world={'backend': backend})
+    return Game(config=config, seed=3)
+
+
+class TestRenderSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_snapshot_is_a_read_only_copy(self):
+        game = make_game('static')
+        game.tick(1.0 / 30.0)
+        snapshot = capture_snapshot(game)
+        enemies = game.world.enemies
+
+        self.assertEqual(snapshot.enemies.shape, (len(enemies), 6))
+        self.assertEqual(snapshot.enemies[0, 2], enemies[0].x)
+        self.assertEqual(snapshot.hud['enemies'], len(enemies))
+        with self.assertRaises(ValueError):
+            snapshot.enemies[0, 2] = 0.0
+
+        # A simulação seguinte não altera o snapshot já capturado
+        x = snapshot.enemies[0, 2]
+        game.tick(1.0)
+        self.assertEqual(snapshot.enemies[0, 2], x)
+        game.pipeline.shutdown()
+
+    def test_pipelined_frame_matches_serial_draw(self):
+        for backend in ('static', 'dynamic'):
+            with self.subTest(backend=backend):
+                game = make_game(backend)
+                game.keys_pressed = {pygame.K_d}
+                for _ in range(10):
+                    game.pipeline_frame(1.0 / 30.0)
+                game.pipeline.shutdown()
+
+                game.draw()
+                serial = pygame.image.tostring(game.screen, 'RGB')
+                game.draw_snapshot(game.snapshot)
+                self.assertEqual(pygame.image.tostring(game.screen, 'RGB'), serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
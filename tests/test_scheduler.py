@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Testes do escalonador de atualização das áreas.
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities import Enemy, Player
+from game_config import GameConfig
+from scheduler import AreaScheduler, update_entities
+from tests.helpers import make_config
+
+
+class FakeArea:
+    def __init__(self, grid_x: int, grid_y: int, area_size: int = 500):
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+        self.area_size = area_size
+        self.x = grid_x * area_size
+        self.y = grid_y * area_size
+
+
+def scheduler_config(**simulation) -> GameConfig:
+    return make_config(game={'window_width': 400, 'window_height': 400}, simulation=simulation)
+
+
+class TestAreaScheduler(unittest.TestCase):
+
+    def setUp(self):
+        # Jogador no centro da área (1, 1); a janela de 400x400 não alcança as vizinhas
+        self.player = Player(750, 750, scheduler_config().player)
+        self.near = FakeArea(2, 1)
+        self.far = FakeArea(3, 1)
+        self.own = FakeArea(1, 1)
+
+    def run_frames(self, scheduler, areas, frames, dt=0.01):
+        calls = []
+        for _ in range(frames):
+            scheduler.run(areas, self.player, dt,
+                          lambda area, player, area_dt, tick: calls.append((area.grid_x, round(area_dt, 6))))
+        return calls
+
+    def test_tiers(self):
+        """Área do jogador é faixa 0; vizinhas fora da tela, 1; mais distantes, 2."""
+        scheduler = AreaScheduler(scheduler_config())
+
+        self.assertEqual(scheduler.tier(self.own, self.player), 0)
+        self.assertEqual(scheduler.tier(self.near, self.player), 1)
+        self.assertEqual(scheduler.tier(self.far, self.player), 2)
+
+    def test_staggered_with_accumulated_dt(self):
+        """Faixas 1 e 2 atualizam a cada 2 e 4 quadros, recebendo o dt acumulado."""
+        scheduler = AreaScheduler(scheduler_config())
+        calls = self.run_frames(scheduler, [self.own, self.near, self.far], 8)
+
+        self.assertEqual(len([c for c in calls if c[0] == 1]), 8)
+        self.assertEqual({dt for x, dt in calls if x == 2}, {0.02})
+        self.assertEqual({dt for x, dt in calls if x == 3}, {0.04})
+        self.assertEqual(scheduler.total.staggered, 4 + 6)
+
+    def test_budget_defers_and_max_lag_forces(self):
+        """Sem orçamento as áreas fora da tela esperam, mas não além de max_lag."""
+        scheduler = AreaScheduler(scheduler_config(update_budget_ms=1, max_lag=0.05))
+        ticks = iter(range(0, 10 ** 6, 5))
+        scheduler.perf = lambda: next(ticks) / 1000.0  # cada leitura avança 5ms
+
+        calls = self.run_frames(scheduler, [self.own, self.near], 10)
+
+        self.assertGreater(scheduler.total.over_budget, 0)
+        near_dts = [dt for x, dt in calls if x == 2]
+        self.assertTrue(near_dts)
+        self.assertTrue(all(dt >= 0.05 for dt in near_dts))
+
+    def test_steering_interval(self):
+        """Direção recalculada a cada N atualizações; a posição anda todo quadro."""
+        config = scheduler_config()
+        player = Player(0, 0, config.player)
+        enemies = [Enemy(100, 0, config.enemy), Enemy(0, 100, config.enemy)]
+        update_entities(enemies, [], player, 0.01, 0, 2)
+        direction = (enemies[1].dir_x, enemies[1].dir_y)
+
+        player.x = 500
+        update_entities(enemies, [], player, 0.01, 0, 2)
+
+        self.assertEqual((enemies[1].dir_x, enemies[1].dir_y), direction)
+        self.assertEqual((enemies[0].dir_x, enemies[0].dir_y), (1.0, 0.0))
+        self.assertLess(enemies[1].y, 100 - config.enemy.speed * 0.015)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Testes da geração em lote do conteúdo das áreas (spawn.py).
+"""
+
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spawn import ENEMY_MARGIN, ITEM_MARGIN, AreaSpawn
+from tests.helpers import make_config
+
+
+class TestAreaSpawn(unittest.TestCase):
+
+    def setUp(self):
+        self.config = make_config(world={'area_size': 300},
+                                  spawn={'enemies_per_area': 200, 'health_items_per_area': 3, 'ammo_items_per_area': 2})
+
+    def test_positions_inside_area_margins(self):
+        spawn = AreaSpawn(self.config, 5, 2, 1)
+
+        self.assertEqual((len(spawn.enemies), len(spawn.health), len(spawn.ammo)), (200, 3, 2))
+        x, y = spawn.enemies[:, 0], spawn.enemies[:, 1]
+        self.assertTrue(((x >= 600 + ENEMY_MARGIN) & (x <= 900 - ENEMY_MARGIN)).all())
+        self.assertTrue(((y >= 300 + ENEMY_MARGIN) & (y <= 600 - ENEMY_MARGIN)).all())
+        ammo_y = spawn.ammo[:, 1]
+        self.assertTrue(((ammo_y >= 300 + ITEM_MARGIN) & (ammo_y <= 600 - ITEM_MARGIN)).all())
+
+    def test_same_seed_same_content(self):
+        """Objetos e formato de cache saem das mesmas posições; outra área, outras posições."""
+        enemies, items = AreaSpawn(self.config, 5, 2, 1).entities(self.config)
+        content = AreaSpawn(self.config, 5, 2, 1).content(self.config)
+
+        self.assertEqual([(e.x, e.y) for e in enemies], [(e['x'], e['y']) for e in content['enemies']])
+        self.assertEqual([(i.item_type, i.x) for i in items], [(i['type'], i['x']) for i in content['items']])
+        self.assertEqual(enemies[0].health, self.config.enemy.health)
+        self.assertNotEqual(content, AreaSpawn(self.config, 5, 1, 2).content(self.config))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Testes dos sprites direcionais pré-desenhados (sprites.DirectionalSprites).
+"""
+
+import sys
+import os
+import math
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from entities import Player
+from game import Game
+from game_config import DEFAULTS, GameConfig
+from sprites import DIRECTIONS, DirectionalSprites, input_heading, paint_player, player_sprites, quantize_direction
+
+
+class TestDirectionalSprites(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_input_heading_matches_atan2(self):
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx or dy:
+                    scale = 0.707 if dx and dy else 1
+                    self.assertEqual(input_heading(dx * scale, dy * scale), quantize_direction(dx, dy))
+        self.assertEqual(quantize_direction(0, 1), DIRECTIONS // 4)
+
+        player = Player(0, 0, GameConfig.from_dict(DEFAULTS).player)
+        player.move(-0.707, 0.707, 0.01)
+        self.assertAlmostEqual(player.direction, math.atan2(0.707, -0.707))
+
+    def test_sprites_are_lazy_and_shared_across_restart(self):
+        sprites = DirectionalSprites(paint_player)
+        self.assertEqual(len(sprites.sprites), 0)
+        sprite = sprites.get((0, 255, 0), 20, 3)
+        self.assertIs(sprites.get((0, 255, 0), 20, 3), sprite)
+        self.assertEqual(sprite.get_size(), (41, 41))
+        # Canto do quadrado fica transparente
+        self.assertEqual(sprite.get_at((0, 0)), sprite.get_colorkey())
+
+        game = Game(config=GameConfig.from_dict(DEFAULTS), seed=1)
+        game.draw()
+        cached = dict(player_sprites.sprites)
+        game.restart()
+        game.draw()
+        self.assertEqual(player_sprites.sprites, cached)
+
+
+if __name__ == '__main__':
+    unittest.main()
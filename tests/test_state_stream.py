@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Testes da leitura incremental de saves (JSON e binário).
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_state import GameState
+from state_stats import aggregate_saves, diff_saves, summarize_save
+from state_stream import (SaveFormatError, convert_save, iter_json_records, iter_save_records,
+                          read_metadata)
+
+
+def make_state() -> GameState:
+    state = GameState()
+    state.metadata = {'timestamp': 12.5, 'active_areas_count': 1, 'total_enemies': 3, 'total_items': 1}
+    state.player_data = {'x': 150.0, 'y': 250.5, 'health': 80, 'max_health': 100,
+                         'health_items': 1, 'ammo_items': 2}
+    state.areas_data = [
+        {'grid_x': 0, 'grid_y': 0, 'active': True,
+         'enemies': [{'x': 10.25, 'y': 20.5, 'health': 60, 'max_health': 60},
+                     {'x': -1e-3, 'y': 3.0, 'health': 15, 'max_health': 60}],
+         'items': [{'x': 5.0, 'y': 6.0, 'item_type': 'ammo', 'symbol': '⚡'}]},
+        {'grid_x': 1, 'grid_y': 0, 'active': False,
+         'enemies': [{'x': 410.0, 'y': 20.0, 'health': 60, 'max_health': 60}],
+         'items': []}
+    ]
+    state.game_config = {'spawn': {'enemies_per_area': 2}}
+    return state
+
+
+class TestStateStream(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.state = make_state()
+        self.json_file = os.path.join(self.tmp_dir, 'game_state_1.json')
+        self.sav_file = os.path.join(self.tmp_dir, 'game_state_1.sav')
+        self.state.save_to_json(self.json_file)
+        self.state.save_to_binary(self.sav_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_json_records_in_order(self):
+        """Registros saem na ordem do arquivo, com cabeçalho antes dos inimigos."""
+        kinds = [kind for kind, _ in iter_save_records(self.json_file)]
+
+        self.assertEqual(kinds, ['metadata', 'player',
+                                 'area', 'enemy', 'enemy', 'item', 'area_end',
+                                 'area', 'enemy', 'area_end', 'config'])
+
+    def test_small_chunks_match_full_parse(self):
+        """Blocos minúsculos cortam tokens ao meio e ainda assim o resultado é igual."""
+        self.assertEqual(list(iter_json_records(self.json_file, chunk_size=3)),
+                         list(iter_json_records(self.json_file)))
+
+    def test_binary_matches_json(self):
+        """O formato binário produz a mesma sequência de registros do JSON."""
+        self.assertEqual(list(iter_save_records(self.sav_file)),
+                         list(iter_save_records(self.json_file)))
+
+    def test_binary_roundtrip(self):
+        """GameState carregado do binário é idêntico ao original."""
+        loaded = GameState()
+        loaded.load_from_binary(self.sav_file)
+
+        self.assertEqual(loaded.metadata, self.state.metadata)
+        self.assertEqual(loaded.player_data, self.state.player_data)
+        self.assertEqual(loaded.areas_data, self.state.areas_data)
+        self.assertEqual(loaded.game_config, self.state.game_config)
+
+    def test_convert_json_to_binary(self):
+        """Conversão incremental gera o mesmo arquivo que a gravação direta."""
+        target = os.path.join(self.tmp_dir, 'convertido.sav')
+        convert_save(self.json_file, target)
+
+        with open(target, 'rb') as a, open(self.sav_file, 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_read_metadata(self):
+        """Metadados são lidos sem percorrer as áreas."""
+        self.assertEqual(read_metadata(self.json_file)['total_enemies'], 3)
+        self.assertEqual(read_metadata(self.sav_file)['total_enemies'], 3)
+
+    def test_truncated_json(self):
+        """Arquivo cortado gera erro de formato."""
+        with open(self.json_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        truncated = os.path.join(self.tmp_dir, 'truncado.json')
+        with open(truncated, 'w', encoding='utf-8') as f:
+            f.write(content[:len(content) // 2])
+
+        with self.assertRaises(SaveFormatError):
+            list(iter_save_records(truncated))
+
+
+class TestStateStats(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.file_a = os.path.join(self.tmp_dir, 'a.json')
+        self.file_b = os.path.join(self.tmp_dir, 'b.sav')
+        state = make_state()
+        state.save_to_json(self.file_a)
+        state.areas_data[0]['enemies'].pop()
+        state.areas_data[1]['items'].append({'x': 1.0, 'y': 1.0, 'item_type': 'health', 'symbol': '➕'})
+        state.save_to_binary(self.file_b)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_summarize_save(self):
+        """Resumo conta inimigos, faixas de saúde e itens por área."""
+        summary = summarize_save(self.file_a)
+        area = summary['areas'][(0, 0)]
+
+        self.assertIsNone(summary['error'])
+        self.assertEqual(area['enemies'], 2)
+        self.assertEqual(area['health_hist'], [0, 1, 0, 1])
+        self.assertEqual(area['items'], {'ammo': 1})
+
+    def test_aggregate_with_process_pool(self):
+        """Agregação em paralelo soma os saves por área."""
+        aggregate = aggregate_saves([self.file_a, self.file_b, self.file_a], workers=2)
+
+        self.assertEqual(aggregate.files, 3)
+        self.assertEqual(aggregate.areas[(0, 0)].enemies_total, 5)
+        self.assertEqual(aggregate.areas[(0, 0)].enemies_min, 1)
+        self.assertEqual(aggregate.areas[(1, 0)].items, {'health': 1})
+
+    def test_aggregate_reports_errors(self):
+        """Arquivos inválidos aparecem como erro sem interromper a agregação."""
+        broken = os.path.join(self.tmp_dir, 'quebrado.json')
+        with open(broken, 'w', encoding='utf-8') as f:
+            f.write('{"areas": [')
+
+        aggregate = aggregate_saves([self.file_a, broken], workers=1)
+
+        self.assertEqual(aggregate.files, 1)
+        self.assertEqual(len(aggregate.errors), 1)
+
+    def test_diff_saves(self):
+        """Diferença por área entre dois saves."""
+        diff = diff_saves(self.file_a, self.file_b, workers=1)
+
+        self.assertEqual(diff['areas'][(0, 0)]['enemies_delta'], -1)
+        self.assertEqual(diff['areas'][(1, 0)]['items_delta'], {'health': 1})
+        self.assertEqual(diff['player']['health'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
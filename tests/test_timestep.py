@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Testes do passo fixo de simulação com desenho interpolado (timestep.py).
+"""
+
+import sys
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from camera import Camera
+from game import Game
+from timestep import FixedTimestep, FramePacing
+from tests.helpers import make_config
+
+
+class TestFixedTimestep(unittest.TestCase):
+
+    def test_accumulates_partial_steps(self):
+        timestep = FixedTimestep(30)
+
+        self.assertEqual(timestep.advance(1.0 / 60.0), 0)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+        self.assertEqual(timestep.advance(1.0 / 60.0 + 1e-9), 1)
+        self.assertAlmostEqual(timestep.alpha, 0.0, places=5)
+
+    def test_catch_up_is_capped(self):
+        """Um engasgo de meio segundo roda no máximo max_steps passos; o resto é descartado."""
+        timestep = FixedTimestep(30, max_steps=5)
+
+        self.assertEqual(timestep.advance(0.5), 5)
+        self.assertLess(timestep.accumulator, timestep.step)
+        self.assertAlmostEqual(timestep.dropped, 0.5 - 5 * timestep.step - timestep.accumulator)
+        self.assertEqual(timestep.advance(0.0), 0)
+
+    def test_pacing_jitter(self):
+        pacing = FramePacing()
+        for dt in (0.016, 0.016, 0.020, 0.012):
+            pacing.record(dt, 1)
+
+        summary = pacing.summary()
+        self.assertAlmostEqual(summary['frame_ms'], 16.0)
+        self.assertAlmostEqual(summary['jitter_ms'], 8 ** 0.5)
+        self.assertAlmostEqual(summary['max_ms'], 20.0)
+
+    def test_camera_interpolation(self):
+        camera = Camera(800, 600)
+        camera.save_previous()
+        camera.x, camera.y = 100, 40
+
+        self.assertEqual(camera.get_position(0.25), (25, 10))
+        self.assertEqual(camera.get_position(), (100, 40))
+
+
+class TestGameFixedStep(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_frame_spike_does_not_teleport(self):
+        config = make_config(player={'max_health': 100000}, simulation={'tick_rate': 30, 'max_steps': 3})
+        game = Game(config=config, seed=5)
+        game.keys_pressed = {pygame.K_d}
+        start_x = game.player.x
+
+        game.tick(2.0)
+
+        # Só 3 passos de 1/30s, não 2 segundos de movimento
+        self.assertAlmostEqual(game.player.x - start_x, config.player.speed * 3 / 30)
+        self.assertAlmostEqual(game.elapsed_time, 3 / 30)
+        self.assertEqual(game.pacing.summary()['steps_per_frame'], 3)
+
+        game.tick(1.0 / 60.0)
+        self.assertAlmostEqual(game.alpha, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Paridade entre os backends de mundo: com a mesma semente, World (estático) e
+DynamicAreaManager (dinâmico) devem simular exatamente o mesmo jogo.
+"""
+
+import sys
+import os
+import copy
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities import Player
+from game_config import GameConfig
+from world import World
+from dynamic_world import DynamicAreaManager
+from world_backend import create_world
+from tests.helpers import make_config
+
+DT = 1.0 / 30.0
+# Percurso do jogador em posições do mundo; cruza várias áreas da malha 4x4
+WAYPOINTS = [(450, 450), (850, 450), (850, 850), (150, 850), (150, 150), (1050, 150), (450, 450)]
+
+
+def backend_config(backend: str = 'static') -> GameConfig:
+    return make_config(
+        player={'max_health': 100000},
+        enemy={'speed': 90, 'damage': 5, 'damage_interval': 0.5},
+        world={'grid_size': 4, 'area_size': 300, 'activation_distance': 60, 'max_active_areas': 3,
+               'backend': backend, 'max_loaded_areas': 3},
+        spawn={'enemies_per_area': 6, 'health_items_per_area': 1, 'ammo_items_per_area': 1}
+    )
+
+
+def steer(player: Player, frame: int):
+    """Move o jogador em direção ao próximo ponto do percurso"""
+    target_x, target_y = WAYPOINTS[(frame // 120) % len(WAYPOINTS)]
+    dx = (target_x > player.x + 5) - (target_x < player.x - 5)
+    dy = (target_y > player.y + 5) - (target_y < player.y - 5)
+    player.move(dx, dy, DT)
+
+
+class TestWorldBackendParity(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config = backend_config()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def make_pair(self, seed: int = 2024):
+        static = World(config=self.config, seed=seed, defer_generation=True)
+        dynamic = DynamicAreaManager(self.config, seed=seed, cache_dir=os.path.join(self.tmp_dir, 'cache'))
+        return static, dynamic
+
+    def make_player(self) -> Player:
+        return Player(450, 450, self.config.player)
+
+    def simulate(self, world, player: Player, frames: int, start: int = 0):
+        for frame in range(start, start + frames):
+            steer(player, frame)
+            if frame % 150 == 75:
+                player.ammo_items += 1
+                world.remove_enemies(player.use_ammo_item(world.enemies, 50, 150))
+            world.update(player, DT)
+
+    def assertSameState(self, world_a, player_a, world_b, player_b):
+        self.assertEqual((player_a.x, player_a.y, player_a.health, player_a.health_items),
+                         (player_b.x, player_b.y, player_b.health, player_b.health_items))
+        self.assertEqual(world_a.snapshot(), world_b.snapshot())
+        self.assertEqual([(a.grid_x, a.grid_y) for a in world_a.active_areas],
+                         [(a.grid_x, a.grid_y) for a in world_b.active_areas])
+
+    def test_same_generated_content(self):
+        """Conteúdo inicial das áreas é o mesmo nos dois backends."""
+        static, dynamic = self.make_pair()
+        strip = lambda areas: [dict(area, active=None) for area in areas]
+
+        self.assertEqual(strip(static.snapshot()), strip(dynamic.snapshot()))
+
+    def test_simulation_parity(self):
+        """Mesma semente e mesma entrada levam ao mesmo estado, quadro a quadro."""
+        static, dynamic = self.make_pair()
+        player_static, player_dynamic = self.make_player(), self.make_player()
+
+        for step in range(8):
+            self.simulate(static, player_static, 120, start=step * 120)
+            self.simulate(dynamic, player_dynamic, 120, start=step * 120)
+            self.assertSameState(static, player_static, dynamic, player_dynamic)
+            self.assertLessEqual(len(dynamic.loaded_areas), dynamic.max_loaded_areas)
+
+        # As áreas passaram pelo cache em disco e voltaram sem perder estado
+        self.assertTrue(os.listdir(dynamic.cache_dir))
+
+    def test_restore_across_backends(self):
+        """Um snapshot do backend estático restaurado no dinâmico continua igual."""
+        source, _ = self.make_pair()
+        player = self.make_player()
+        self.simulate(source, player, 400)
+        saved = copy.deepcopy(source.snapshot())
+        # Inimigos encostados no jogador estão no meio do intervalo de dano
+        self.assertTrue(any(enemy['damage_cooldown'] > 0 for area in saved for enemy in area['enemies']))
+
+        static, dynamic = self.make_pair(seed=1)
+        players = []
+        for world in (static, dynamic):
+            world.restore(copy.deepcopy(saved))
+            restored_player = self.make_player()
+            restored_player.x, restored_player.y = player.x, player.y
+            players.append(restored_player)
+
+        self.assertEqual(static.snapshot(), saved)
+        self.assertEqual(dynamic.snapshot(), saved)
+
+        self.simulate(static, players[0], 300, start=400)
+        self.simulate(dynamic, players[1], 300, start=400)
+        self.assertSameState(static, players[0], dynamic, players[1])
+
+    def test_backend_selected_by_config(self):
+        """world.backend escolhe a implementação criada por create_world."""
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+        try:
+            self.assertIsInstance(create_world(backend_config('dynamic'), seed=1), DynamicAreaManager)
+            self.assertIsInstance(create_world(backend_config('static'), seed=1), World)
+        finally:
+            os.chdir(cwd)
+
+
+class TestLevelOfDetail(unittest.TestCase):
+
+    def setUp(self):
+        self.config = backend_config()
+
+    def centroid(self, area):
+        return (sum(e.x for e in area.enemies) / len(area.enemies),
+                sum(e.y for e in area.enemies) / len(area.enemies))
+
+    def test_nearby_areas_approach_far_areas_freeze(self):
+        """Áreas inativas vizinhas se aproximam do jogador; as distantes não mudam."""
+        world = World(config=self.config, seed=5)
+        player = Player(450, 450, self.config.player)
+        far_before = [(e.x, e.y) for e in world.get_area(3, 3).enemies]
+
+        for _ in range(60):
+            world.update(player, DT)
+
+        neighbour = world.get_area(0, 0)
+        self.assertFalse(neighbour.active)
+        self.assertIn(neighbour, world.lod_areas)
+        self.assertNotIn(world.get_area(3, 3), world.lod_areas)
+        self.assertEqual([(e.x, e.y) for e in world.get_area(3, 3).enemies], far_before)
+
+        # Os inimigos concretos ainda estão na posição original; o agregado andou
+        start_x, start_y = self.centroid(neighbour)
+        self.assertGreater(neighbour.aggregate.cx, start_x)
+        self.assertGreater(neighbour.aggregate.cy, start_y)
+        self.assertLess(neighbour.aggregate.scale, 1.0)
+
+    def test_promotion_materializes_aggregate(self):
+        """Ao ativar a área, os inimigos aparecem onde o modelo agregado diz."""
+        world = World(config=self.config, seed=5)
+        player = Player(450, 450, self.config.player)
+        for _ in range(60):
+            world.update(player, DT)
+        area = world.get_area(0, 1)
+        aggregate = area.aggregate
+        expected = list(aggregate.positions())
+
+        player.x, player.y = 290, 450
+        world.update(player, 0.0)
+
+        self.assertTrue(area.active)
+        self.assertIsNone(area.aggregate)
+        # Quem foi materializado além da borda passa para a área vizinha
+        self.assertLessEqual(set(expected), {(e.x, e.y) for e in world.enemies})
+        for enemy in area.enemies:
+            self.assertIs(world.get_area_at_position(enemy.x, enemy.y), area)
+        self.assertAlmostEqual(sum(x for x, _ in expected) / len(expected), aggregate.cx)
+        self.assertAlmostEqual(sum(y for _, y in expected) / len(expected), aggregate.cy)
+
+    def test_promoted_enemies_drawn_at_new_position(self):
+        """Com alpha 0 o desenho já começa na posição materializada, nos dois backends."""
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            dynamic = DynamicAreaManager(self.config, seed=5, cache_dir=tmp_dir)
+            for world in (World(config=self.config, seed=5), dynamic):
+                player = Player(450, 450, self.config.player)
+                for _ in range(60):
+                    world.update(player, DT)
+                player.x, player.y = 290, 450
+                world.update(player, 0.0)
+
+                area = world.get_area_at_position(150, 450)
+                self.assertTrue(area.active)
+                for enemy in area.enemies:
+                    self.assertEqual(enemy.screen_position(0, 0, alpha=0.0), (int(enemy.x), int(enemy.y)))
+            dynamic.close()
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_lod_disabled(self):
+        """lod_radius 0 mantém as áreas inativas congeladas."""
+        config = make_config(self.config, world={'lod_radius': 0})
+        world = World(config=config, seed=5)
+        player = Player(450, 450, config.player)
+        before = [(e.x, e.y) for e in world.get_area(0, 0).enemies]
+
+        for _ in range(60):
+            world.update(player, DT)
+
+        self.assertEqual([(e.x, e.y) for e in world.get_area(0, 0).enemies], before)
+        self.assertEqual(world.lod_areas, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import math
+from collections import deque
+from typing import Deque, Dict
+
+
+class FixedTimestep:
+    """Acumulador de passo fixo: o tempo real de cada quadro entra em
+    accumulator e sai em passos de step segundos.
+
+    Com max_steps o quadro roda no máximo esse número de passos; o atraso
+    que sobra é descartado (dropped) em vez de virar uma rajada de passos
+    nos quadros seguintes. alpha é a fração do próximo passo já acumulada,
+    usada para interpolar o desenho entre o estado anterior e o atual.
+    """
+
+    def __init__(self, rate: float, max_steps: int = 5):
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps = 0
+        self.dropped = 0.0
+
+    def advance(self, dt: float) -> int:
+        """Quantos passos rodar neste quadro"""
+        self.accumulator += dt
+        steps = min(int(self.accumulator / self.step), self.max_steps)
+        self.accumulator -= steps * self.step
+        if steps == self.max_steps and self.accumulator >= self.step:
+            excess = self.accumulator - self.accumulator % self.step
+            self.dropped += excess
+            self.accumulator -= excess
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        return min(1.0, self.accumulator / self.step)
+
+
+class FramePacing:
+    """Estatísticas do ritmo dos quadros: intervalo médio, variação (jitter)
+    e piores casos sobre os últimos history quadros, em milissegundos"""
+
+    def __init__(self, history: int = 240):
+        self.intervals: Deque[float] = deque(maxlen=history)
+        self.steps: Deque[int] = deque(maxlen=history)
+
+    def record(self, dt: float, steps: int = 1):
+        self.intervals.append(dt * 1000.0)
+        self.steps.append(steps)
+
+    def summary(self) -> Dict:
+        if not self.intervals:
+            return {'frames': 0, 'frame_ms': 0.0, 'jitter_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0,
+                    'steps_per_frame': 0.0}
+        count = len(self.intervals)
+        mean = sum(self.intervals) / count
+        variance = sum((interval - mean) ** 2 for interval in self.intervals) / count
+        ordered = sorted(self.intervals)
+        return {
+            'frames': count,
+            'frame_ms': mean,
+            'jitter_ms': math.sqrt(variance),
+            'p95_ms': ordered[min(count - 1, int(round(0.95 * (count - 1))))],
+            'max_ms': ordered[-1],
+            'steps_per_frame': sum(self.steps) / count
+        }
+
+
+def lerp(previous: float, current: float, alpha: float) -> float:
+    return previous + (current - previous) * alpha
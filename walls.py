@@ -0,0 +1,47 @@
+import math
+from functools import lru_cache
+from typing import FrozenSet, Tuple
+
+import pygame
+
+WALL_COLOR = (80, 60, 40)
+WALL_BORDER_COLOR = (60, 40, 20)
+
+Tile = Tuple[int, int]
+
+
+@lru_cache(maxsize=None)
+def wall_tiles(area_size: int, tile_size: int) -> FrozenSet[Tile]:
+    """Ladrilhos de parede de uma área, em coordenadas locais (coluna, linha).
+
+    É a borda que SpriteRenderer.draw_area_background pinta, com uma passagem
+    no meio de cada lado para que as áreas continuem ligadas entre si.
+    """
+    count = area_size // tile_size
+    door = max(1, count // 5)
+    door_start = (count - door) // 2
+    door_tiles = range(door_start, door_start + door)
+
+    tiles = set()
+    for index in range(count):
+        if index in door_tiles:
+            continue
+        tiles.update(((index, 0), (index, count - 1), (0, index), (count - 1, index)))
+    return frozenset(tiles)
+
+
+def draw_walls(screen: pygame.Surface, area_x: int, area_y: int, bitmap: bytes, tile_size: int,
+               camera_x: float, camera_y: float, scale: float = 1.0, border: bool = True):
+    """Desenha os ladrilhos bloqueados do bitmap de colisão da área; scale
+    reduz posições e tamanhos para o desenho em resolução interna menor"""
+    count = math.isqrt(len(bitmap))
+    size = math.ceil(tile_size * scale)
+    for index, blocked in enumerate(bitmap):
+        if not blocked:
+            continue
+        tile_y, tile_x = divmod(index, count)
+        rect = pygame.Rect(int((area_x + tile_x * tile_size - camera_x) * scale),
+                           int((area_y + tile_y * tile_size - camera_y) * scale), size, size)
+        pygame.draw.rect(screen, WALL_COLOR, rect)
+        if border:
+            pygame.draw.rect(screen, WALL_BORDER_COLOR, rect, 2)
@@ -1,11 +1,22 @@
 import pygame
 import random
-import yaml
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, Union
 from entities import Player, Enemy, Item
+from game_config import GameConfig, load_config
+from world_backend import WorldBackend, build_enemies, build_items, create_parallel_updater, serialize_area
+from lod import AreaAggregate, lod_neighbours
+from scheduler import AreaScheduler, update_entities
+from flow_field import create_flow_field
+from crowd import create_crowd_separation
+from collision import area_collision, create_collision_map
+from walls import draw_walls
+from render_batch import BatchRenderer
+from pools import enemy_pool, release_entities
+from spawn import AreaSpawn, spawn_margin
 
 class Area:
-    def __init__(self, grid_x: int, grid_y: int, area_size: int, config: Dict):
+    def __init__(self, grid_x: int, grid_y: int, area_size: int, config: GameConfig, seed: int = None,
+                 generate: bool = True):
         self.grid_x = grid_x
         self.grid_y = grid_y
         self.area_size = area_size
@@ -15,44 +26,51 @@ class Area:
         self.enemies: List[Enemy] = []
         self.items: List[Item] = []
         self.config = config
+        # Semente do mundo; o conteúdo da área depende só dela (spawn.AreaSpawn)
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.generated = False
+        # Bitmap de colisão das paredes, fixo desde a criação da área
+        self.collision = area_collision(area_size, config.world.tile_size) if config.world.walls else None
+        # Modelo agregado enquanto a área está inativa e perto do jogador
+        self.aggregate: AreaAggregate = None
         
-        self.generate_content()
+        if generate:
+            self.generate_content()
+    
+    def ensure_content(self):
+        """Gera o conteúdo adiado, se ainda não foi gerado"""
+        if not self.generated:
+            self.generate_content()
     
     def generate_content(self):
         """Gera conteúdo para a área"""
-        spawn_config = self.config['spawn']
-        
-        for _ in range(spawn_config['enemies_per_area']):
-            x = random.uniform(self.x + 20, self.x + self.area_size - 20)
-            y = random.uniform(self.y + 20, self.y + self.area_size - 20)
-            enemy = Enemy(x, y, self.config['enemy'])
-            self.enemies.append(enemy)
-        
-        for _ in range(spawn_config['health_items_per_area']):
-            x = random.uniform(self.x + 15, self.x + self.area_size - 15)
-            y = random.uniform(self.y + 15, self.y + self.area_size - 15)
-            item = Item(x, y, 'health', self.config['items']['health'])
-            self.items.append(item)
-        
-        for _ in range(spawn_config['ammo_items_per_area']):
-            x = random.uniform(self.x + 15, self.x + self.area_size - 15)
-            y = random.uniform(self.y + 15, self.y + self.area_size - 15)
-            item = Item(x, y, 'ammo', self.config['items']['ammo'])
-            self.items.append(item)
+        self.generated = True
+        self.enemies, self.items = AreaSpawn(self.config, self.seed, self.grid_x, self.grid_y).entities(self.config)
     
-    def update(self, player: Player, dt: float):
+    def demote(self) -> AreaAggregate:
+        """Troca a simulação completa pelo modelo agregado"""
+        if self.aggregate is None:
+            self.ensure_content()
+            positions = [(enemy.x, enemy.y) for enemy in self.enemies]
+            self.aggregate = AreaAggregate.from_positions(positions, self.x, self.y, self.area_size,
+                                                          spawn_margin(self.config, 0, self.config.enemy.size))
+        return self.aggregate
+    
+    def promote(self):
+        """Materializa os inimigos a partir do modelo agregado"""
+        if self.aggregate is not None:
+            self.aggregate.apply(self.enemies)
+            self.aggregate = None
+    
+    def update(self, player: Player, dt: float, tick: int = 0, steering_interval: int = 1, field=None,
+               collision=None):
         if not self.active:
             return
         
-        for enemy in self.enemies[:]:
-            if not enemy.update(player, dt):
-                self.enemies.remove(enemy)
-        
-        for item in self.items[:]:
-            if item.collect(player):
-                self.items.remove(item)
+        update_entities(self.enemies, self.items, player, dt, tick, steering_interval, field, collision)
     
     def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float):
+        """Fundo e paredes; as entidades são desenhadas em lote por World.draw"""
         if not self.active:
             return
         
@@ -64,31 +82,44 @@ class Area:
         )
         pygame.draw.rect(screen, (40, 40, 40), area_rect)
         pygame.draw.rect(screen, (100, 100, 100), area_rect, 2)
-        
-        for enemy in self.enemies:
-            enemy.draw(screen, camera_x, camera_y)
-        
-        for item in self.items:
-            item.draw(screen, camera_x, camera_y)
+        if self.collision is not None:
+            draw_walls(screen, self.x, self.y, self.collision, self.config.world.tile_size, camera_x, camera_y)
     
     def get_rect(self) -> pygame.Rect:
         return pygame.Rect(self.x, self.y, self.area_size, self.area_size)
 
-class World:
-    def __init__(self, config_path: str = 'config.yaml', config: Dict = None):
+class World(WorldBackend):
+    """Malha de áreas. Com defer_generation só a área central é gerada na
+    criação; as demais são geradas ao serem ativadas ou aos poucos por
+    generate_pending, sem alterar o resultado (cada área tem gerador próprio)."""
+    
+    def __init__(self, config_path: str = 'config.yaml', config: Union[GameConfig, Dict] = None, seed: int = None,
+                 defer_generation: bool = False):
         if config:
-            self.config = config
+            self.config = GameConfig.coerce(config)
         else:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            self.config = load_config(config_path)
         
-        self.area_size = self.config['world']['area_size']
-        self.grid_size = self.config['world']['grid_size']
-        self.activation_distance = self.config['world']['activation_distance']
-        self.max_active_areas = self.config['world']['max_active_areas']
+        self.area_size = self.config.world.area_size
+        self.grid_size = self.config.world.grid_size
+        self.activation_distance = self.config.world.activation_distance
+        self.max_active_areas = self.config.world.max_active_areas
+        self.lod_radius = self.config.world.lod_radius
+        self.lod_tick_interval = self.config.world.lod_tick_interval
+        self.scheduler = AreaScheduler(self.config)
+        self.parallel = create_parallel_updater(self.config)
+        self.collision = create_collision_map(self.config, self.collision_bitmap)
+        self.flow_field = create_flow_field(self.config, self.collision)
+        self.crowd = create_crowd_separation(self.config)
+        self.batch = BatchRenderer()
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.defer_generation = defer_generation
         
         self.areas: List[Area] = []
+        self.area_index: Dict[Tuple[int, int], Area] = {}
         self.active_areas: List[Area] = []
+        self.lod_areas: List[Area] = []
+        self.pending_areas: List[Area] = []
         
         self.generate_world()
     
@@ -96,20 +127,39 @@ class World:
         """Gera o mundo com todas as áreas"""
         for y in range(self.grid_size):
             for x in range(self.grid_size):
-                area = Area(x, y, self.area_size, self.config)
+                area = Area(x, y, self.area_size, self.config, self.seed,
+                            generate=not self.defer_generation)
                 self.areas.append(area)
+                self.area_index[(x, y)] = area
         
         center_area = self.get_area(1, 1)
         if center_area:
+            center_area.ensure_content()
             center_area.active = True
             self.active_areas.append(center_area)
+        
+        self.pending_areas = [area for area in self.areas if not area.generated]
+    
+    def generate_pending(self, max_areas: int = 1) -> int:
+        """Gera até max_areas áreas adiadas; retorna quantas ainda faltam"""
+        while self.pending_areas and max_areas > 0:
+            area = self.pending_areas.pop(0)
+            if not area.generated:
+                area.generate_content()
+                max_areas -= 1
+        return len(self.pending_areas)
+    
+    def finish_generation(self):
+        """Gera todas as áreas que ainda faltam (ex.: antes de salvar o estado)"""
+        self.generate_pending(len(self.pending_areas))
     
     def get_area(self, grid_x: int, grid_y: int) -> Area:
         """Retorna a área nas coordenadas do grid"""
-        for area in self.areas:
-            if area.grid_x == grid_x and area.grid_y == grid_y:
-                return area
-        return None
+        return self.area_index.get((grid_x, grid_y))
+    
+    def collision_bitmap(self, grid_x: int, grid_y: int) -> Optional[bytes]:
+        area = self.area_index.get((grid_x, grid_y))
+        return area.collision if area else None
     
     def get_area_at_position(self, x: float, y: float) -> Area:
         """Retorna a área que contém a posição"""
@@ -141,7 +191,12 @@ class World:
         
         for area in new_active_areas:
             if area not in self.active_areas:
+                area.ensure_content()
+                area.promote()
                 area.active = True
+                # Fora das áreas ativas ninguém passa por Game.save_previous
+                for enemy in area.enemies:
+                    enemy.save_previous()
         
         self.active_areas = new_active_areas
     
@@ -158,14 +213,31 @@ class World:
     def update(self, player: Player, dt: float):
         """Atualiza o mundo"""
         self.update_active_areas(player)
+        self.run_areas(player, dt)
+        self.update_lod(player, dt)
+    
+    def update_area(self, area: Area, player: Player, dt: float, tick: int):
+        area.update(player, dt, tick, self.scheduler.steering_interval, self.flow_field, self.collision)
+    
+    def update_lod(self, player: Player, dt: float):
+        """Avança o modelo agregado das áreas inativas próximas; as distantes ficam congeladas"""
+        current_area = self.get_area_at_position(player.x, player.y)
+        if not current_area or self.lod_radius <= 0:
+            self.lod_areas = []
+            return
         
-        for area in self.active_areas:
-            area.update(player, dt)
+        self.lod_areas = [area for area in lod_neighbours(self.get_area, current_area.grid_x, current_area.grid_y,
+                                                          self.lod_radius)
+                          if not area.active]
+        speed = self.config.enemy.speed
+        for area in self.lod_areas:
+            area.demote().tick(player.x, player.y, speed, dt, self.lod_tick_interval)
     
-    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float):
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0):
         """Desenha o mundo"""
         for area in self.active_areas:
             area.draw(screen, camera_x, camera_y)
+        self.draw_entities(screen, camera_x, camera_y, alpha)
     
     def draw_grid(self, screen: pygame.Surface, camera_x: float, camera_y: float):
         """Desenha o grid completo"""
@@ -183,10 +255,72 @@ class World:
             color = (100, 100, 100) if area.active else (50, 50, 50)
             pygame.draw.rect(screen, color, screen_rect, 3)
     
+    def render_shapes(self) -> Tuple[List, List, List]:
+        rects = []
+        for area in self.areas:
+            color = (100, 100, 100) if area.active else (50, 50, 50)
+            rects.append(((40, 40, 40), area.x, area.y, area.area_size, area.area_size, 0))
+            rects.append((color, area.x, area.y, area.area_size, area.area_size, 3))
+        walls = []
+        for area in self.active_areas:
+            rects.append(((40, 40, 40), area.x, area.y, area.area_size, area.area_size, 0))
+            rects.append(((100, 100, 100), area.x, area.y, area.area_size, area.area_size, 2))
+            if area.collision is not None:
+                walls.append((area.x, area.y, area.collision))
+        return rects, [], walls
+    
+    def area_states(self) -> List[Tuple[int, int, bool, bool, int]]:
+        return [(area.grid_x, area.grid_y, area.active, area.generated,
+                 area.aggregate.count if area.aggregate is not None else len(area.enemies))
+                for area in self.areas]
+    
     @property
     def enemies(self) -> List[Enemy]:
         """Retorna todos os inimigos das áreas ativas"""
         all_enemies = []
         for area in self.active_areas:
             all_enemies.extend(area.enemies)
-        return all_enemies
\ No newline at end of file
+        return all_enemies
+    
+    def remove_enemies(self, enemies: List[Enemy]):
+        for enemy in enemies:
+            area = self.get_area_at_position(enemy.x, enemy.y)
+            if area and enemy in area.enemies:
+                area.enemies.remove(enemy)
+                enemy_pool.release(enemy)
+                continue
+            for area in self.areas:
+                if enemy in area.enemies:
+                    area.enemies.remove(enemy)
+                    enemy_pool.release(enemy)
+                    break
+    
+    def snapshot(self) -> List[Dict]:
+        self.finish_generation()
+        for area in self.areas:
+            if area.aggregate is not None:
+                area.aggregate.apply(area.enemies)
+        return [serialize_area(area.grid_x, area.grid_y, area.active, area.enemies, area.items)
+                for area in self.areas]
+    
+    def restore(self, areas_data: List[Dict]):
+        for area_data in areas_data:
+            area = self.get_area(area_data['grid_x'], area_data['grid_y'])
+            if not area:
+                continue
+            area.generated = True
+            area.aggregate = None
+            area.active = area_data['active']
+            release_entities(area.enemies, area.items)
+            area.enemies = build_enemies(area_data['enemies'], self.config)
+            area.items = build_items(area_data['items'], self.config)
+        
+        self.active_areas = [area for area in self.areas if area.active]
+        self.scheduler.reset()
+    
+    def memory_areas(self) -> List[Area]:
+        return [area for area in self.areas if area.generated]
+    
+    def release_content(self):
+        for area in self.areas:
+            release_entities(area.enemies, area.items)
@@ -0,0 +1,242 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Union
+
+import pygame
+
+from entities import Enemy, Item, Player
+from game_config import GameConfig
+from memory_stats import MB, area_bytes, entities_bytes
+from pools import enemy_pool, item_pool
+from render_batch import BatchRenderer, enemy_array, item_array
+
+BACKENDS = ('static', 'dynamic')
+
+
+class WorldBackend(ABC):
+    """Interface comum dos mundos usados pelo Game.
+
+    'static' (world.World) mantém todas as áreas em memória; 'dynamic'
+    (dynamic_world.DynamicAreaManager) carrega e descarrega áreas, guardando
+    as inativas em cache no disco. Com a mesma semente as duas simulam
+    exatamente o mesmo jogo.
+
+    snapshot/restore usam o formato de áreas do GameState: uma lista de
+    dicionários com grid_x, grid_y, active, enemies e items.
+    """
+
+    seed: int
+    config: GameConfig
+    batch: BatchRenderer
+    active_areas: List
+    # scheduler.AreaScheduler que distribui a atualização das áreas ativas
+    scheduler: object
+    # parallel.ParallelAreaUpdater quando simulation.workers > 0
+    parallel: object = None
+    # flow_field.FlowField quando simulation.pursuit é 'flow'
+    flow_field: object = None
+    # crowd.CrowdSeparation quando enemy.separation_radius > 0
+    crowd: object = None
+    # collision.CollisionMap quando world.walls está ligado
+    collision: object = None
+    # Inimigos que passaram de uma área ativa para outra (migrate_enemies)
+    migrations: int = 0
+
+    @abstractmethod
+    def update(self, player: Player, dt: float):
+        pass
+
+    @abstractmethod
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0):
+        """alpha interpola os inimigos entre o passo de simulação anterior e o atual"""
+
+    @abstractmethod
+    def draw_grid(self, screen: pygame.Surface, camera_x: float, camera_y: float):
+        pass
+
+    def draw_entities(self, screen: pygame.Surface, camera_x: float, camera_y: float, alpha: float = 1.0):
+        """Inimigos e itens das áreas ativas, em lote (render_batch.BatchRenderer)"""
+        enemies = self.enemies
+        self.batch.draw_enemies(screen, enemy_array(enemies), [enemy.color for enemy in enemies],
+                                camera_x, camera_y, alpha)
+        items = self.items
+        self.batch.draw_items(screen, item_array(items), [item.color for item in items],
+                              [item.symbol for item in items], camera_x, camera_y)
+
+    @abstractmethod
+    def render_shapes(self) -> Tuple[List, List, List]:
+        """O que draw_grid e draw pintam além das entidades, em coordenadas do
+        mundo, para o desenho a partir de render_snapshot.RenderSnapshot:
+        retângulos (cor, x, y, largura, altura, espessura; 0 = preenchido),
+        rótulos (texto, x, y, cor) e paredes (x, y, bitmap de colisão)"""
+
+    @abstractmethod
+    def area_states(self) -> List[Tuple[int, int, bool, bool, int]]:
+        """(coluna, linha, ativa, em memória, inimigos) de todas as áreas, para o
+        minimapa; as contagens não percorrem as entidades"""
+
+    @property
+    @abstractmethod
+    def enemies(self) -> List[Enemy]:
+        """Inimigos das áreas ativas"""
+
+    @property
+    def items(self) -> List[Item]:
+        """Itens das áreas ativas"""
+        return [item for area in self.active_areas for item in area.items]
+
+    @property
+    def enemy_count(self) -> int:
+        """len(enemies) sem montar a lista"""
+        return sum(len(area.enemies) for area in self.active_areas)
+
+    @abstractmethod
+    def remove_enemies(self, enemies: List[Enemy]):
+        """Remove inimigos mortos fora do update (ex.: item de munição)"""
+
+    @abstractmethod
+    def snapshot(self) -> List[Dict]:
+        """Estado de todas as áreas, inclusive as que não estão em memória"""
+
+    @abstractmethod
+    def restore(self, areas_data: List[Dict]):
+        pass
+
+    def generate_pending(self, max_areas: int = 1) -> int:
+        """Gera conteúdo adiado aos poucos; retorna quantas áreas ainda faltam"""
+        return 0
+
+    def finish_generation(self):
+        pass
+
+    def run_areas(self, player: Player, dt: float):
+        """Passa as áreas ativas pelo scheduler; em modo paralelo as áreas
+        devidas vão para os workers e são aplicadas juntas no fim do quadro"""
+        if self.flow_field is not None:
+            self.flow_field.update(player, self.active_areas)
+        if self.parallel is None:
+            self.scheduler.run(self.active_areas, player, dt, self.update_area)
+        else:
+            self.scheduler.run(self.active_areas, player, dt, self.parallel.queue)
+            self.parallel.flush(player, self.flow_field, self.collision)
+        if self.crowd is not None:
+            self.crowd.apply(self.enemies, dt, self.collision)
+        self.migrate_enemies()
+
+    def migrate_enemies(self):
+        """Passa para a lista da área ativa certa os inimigos que cruzaram a
+        borda; mesmo código e mesma ordem nos modos serial e paralelo.
+        Quem sai para uma área inativa fica onde está."""
+        size = self.config.world.area_size
+        by_key = {(area.grid_x, area.grid_y): area for area in self.active_areas}
+        for area in self.active_areas:
+            left, top = area.x, area.y
+            staying = []
+            for enemy in area.enemies:
+                if left <= enemy.x < left + size and top <= enemy.y < top + size:
+                    staying.append(enemy)
+                    continue
+                target = by_key.get((int(enemy.x // size), int(enemy.y // size)))
+                if target is None:
+                    staying.append(enemy)
+                    continue
+                target.enemies.append(enemy)
+                self.migrations += 1
+                if self.parallel is not None:
+                    self.parallel.invalidate(target)
+            if len(staying) != len(area.enemies):
+                area.enemies[:] = staying
+                if self.parallel is not None:
+                    self.parallel.invalidate(area)
+
+    def decimate_ai(self, factor: int):
+        """Inimigos recalculam a direção factor vezes menos (nível de qualidade)"""
+        interval = self.config.simulation.steering_interval * factor
+        self.scheduler.steering_interval = interval
+        if self.parallel is not None:
+            self.parallel.steering_interval = interval
+
+    def memory_areas(self) -> List:
+        """Áreas cujo conteúdo está em memória"""
+        return self.active_areas
+
+    def disk_bytes(self) -> int:
+        """Bytes do cache de áreas em disco"""
+        return 0
+
+    def world_bytes(self) -> int:
+        return sum(area_bytes(area) for area in self.memory_areas())
+
+    def memory_stats(self) -> Dict:
+        """Memória estimada do mundo, em bytes (memory_stats.py)"""
+        areas = {f"{area.grid_x},{area.grid_y}": area_bytes(area) for area in self.memory_areas()}
+        return {
+            'area_bytes': areas,
+            'world_bytes': sum(areas.values()),
+            'pool_bytes': entities_bytes(enemy_pool.free) + entities_bytes(item_pool.free),
+            'disk_bytes': self.disk_bytes(),
+            'budget_bytes': int(self.config.world.memory_budget_mb * MB)
+        }
+
+    def release_content(self):
+        """Devolve aos pools (pools.py) as entidades que estão em memória"""
+
+    def close(self):
+        """Encerra os workers do modo paralelo, se houver, e devolve as
+        entidades aos pools; o mundo não deve ser usado depois disso"""
+        if self.parallel is not None:
+            self.parallel.close()
+            self.parallel = None
+        self.release_content()
+
+
+def serialize_area(grid_x: int, grid_y: int, active: bool, enemies: List[Enemy], items: List[Item]) -> Dict:
+    return {
+        'grid_x': grid_x,
+        'grid_y': grid_y,
+        'active': active,
+        'enemies': [{'x': enemy.x, 'y': enemy.y, 'health': enemy.health, 'max_health': enemy.max_health,
+                     'damage_cooldown': enemy.damage_cooldown}
+                    for enemy in enemies],
+        'items': [{'x': item.x, 'y': item.y, 'item_type': item.item_type, 'symbol': item.symbol}
+                  for item in items]
+    }
+
+
+def build_enemies(enemies_data: List[Dict], config: GameConfig) -> List[Enemy]:
+    enemies = []
+    for enemy_data in enemies_data:
+        enemy = enemy_pool.acquire(enemy_data['x'], enemy_data['y'], config.enemy)
+        enemy.health = enemy_data['health']
+        enemy.max_health = enemy_data['max_health']
+        enemy.damage_cooldown = enemy_data.get('damage_cooldown', 0.0)
+        enemies.append(enemy)
+    return enemies
+
+
+def build_items(items_data: List[Dict], config: GameConfig) -> List[Item]:
+    items = []
+    for item_data in items_data:
+        item_type = item_data.get('item_type', item_data.get('type'))
+        item = item_pool.acquire(item_data['x'], item_data['y'], item_type, config.items.get(item_type))
+        item.symbol = item_data.get('symbol', item.symbol)
+        items.append(item)
+    return items
+
+
+def create_parallel_updater(config: GameConfig):
+    if config.simulation.workers <= 0:
+        return None
+    # multiprocessing e numpy só são carregados com o modo paralelo ligado
+    from parallel import ParallelAreaUpdater
+    return ParallelAreaUpdater(config, config.simulation.workers)
+
+
+def create_world(config: Union[GameConfig, Dict], seed: int = None) -> WorldBackend:
+    """Cria o mundo escolhido em world.backend"""
+    config = GameConfig.coerce(config)
+    if config.world.backend == 'dynamic':
+        from dynamic_world import DynamicAreaManager
+        return DynamicAreaManager(config, seed=seed)
+
+    from world import World
+    return World(config=config, seed=seed, defer_generation=True)